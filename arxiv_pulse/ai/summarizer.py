@@ -337,24 +337,19 @@ Please format your response as a JSON object with the following fields:
 
     def get_summary_stats(self) -> dict[str, Any]:
         """Get summarization statistics"""
-        with self.db.get_session() as session:
-            total = session.query(Paper).count()
-            summarized = session.query(Paper).filter_by(summarized=True).count()
-
-            papers = session.query(Paper).filter_by(summarized=True).all()
-            avg_summary_length = 0
-            if papers:
-                total_length = sum(len(p.summary or "") for p in papers)
-                avg_summary_length = total_length / len(papers)
-
-            return {
-                "total_papers": total,
-                "summarized_papers": summarized,
-                "summarization_rate": summarized / total if total > 0 else 0,
-                "avg_summary_length": avg_summary_length,
-                "token_usage": {
-                    "total_prompt_tokens": self.total_prompt_tokens,
-                    "total_completion_tokens": self.total_completion_tokens,
-                    "total_tokens": self.total_tokens,
-                },
-            }
+        counters = self.db.get_stat_counters()
+        total = counters.get("papers", 0)
+        summarized = counters.get("summarized", 0)
+        avg_summary_length = counters.get("summary_chars", 0) / summarized if summarized else 0
+
+        return {
+            "total_papers": total,
+            "summarized_papers": summarized,
+            "summarization_rate": summarized / total if total > 0 else 0,
+            "avg_summary_length": avg_summary_length,
+            "token_usage": {
+                "total_prompt_tokens": self.total_prompt_tokens,
+                "total_completion_tokens": self.total_completion_tokens,
+                "total_tokens": self.total_tokens,
+            },
+        }
@@ -556,5 +556,156 @@ def restart(directory, foreground, force):
     )
 
 
+def _open_database(directory: Path):
+    """打开数据目录中的数据库（不存在时新建）"""
+    data_dir = directory / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    db_url = f"sqlite:///{data_dir / 'arxiv_papers.db'}"
+    os.environ["DATABASE_URL"] = db_url
+
+    from arxiv_pulse.core import Database
+
+    return Database(db_url)
+
+
+def _echo_progress(table: str, rows: int) -> None:
+    click.echo(f"   {table}: {rows}")
+
+
+@cli.command()
+@click.argument("directory", type=click.Path(file_okay=False), default=".")
+@click.option("--years", default=5, type=int, help="回溯年数 (默认: 5)")
+@click.option("--field", "fields", multiple=True, help="领域分类 ID，可重复 (默认: 已选择的研究领域)")
+@click.option("--max-results", type=int, default=None, help="最多新增的论文数 (默认: 不限)")
+@click.option("--oai-url", default=None, help="OAI-PMH 接口地址 (默认: arXiv 官方接口)")
+def harvest(directory, years, fields, max_results, oai_url):
+    """用 OAI-PMH 批量采集论文（初次同步 / 多年回溯）
+
+    \b
+    参数:
+        DIRECTORY    数据存储目录 (默认: 当前目录)
+
+    \b
+    说明:
+        按大类集合和日期窗口批量拉取 arXiv 元数据，比搜索 API 逐页翻快得多，
+        也不受搜索结果数上限限制。只保留属于所选领域的论文，已有论文跳过。
+
+    \b
+    示例:
+        pulse harvest . --years 5                     # 采集已选领域近 5 年的论文
+        pulse harvest . --field cs.AI --field quant-ph --years 2
+    """
+    import time
+
+    from arxiv_pulse.crawler import ArXivCrawler
+
+    directory = Path(directory).resolve()
+    db = _open_database(directory)
+    fields = list(fields) or db.get_selected_fields()
+    if not fields:
+        click.secho("❌ 未选择研究领域，请用 --field 指定 / No fields selected", fg="red")
+        sys.exit(1)
+
+    click.echo(f"🌾 正在批量采集 / Harvesting: {', '.join(fields)}，近 {years} 年")
+    started = time.monotonic()
+    total_new = 0
+    window_new = 0
+    try:
+        for progress in ArXivCrawler().harvest_fields(fields, years, max_results, oai_url):
+            total_new = progress["total_new"]
+            window_new += progress["new_papers"]
+            if progress["last_page"]:
+                click.echo(
+                    f"   [{progress['window_index']}/{progress['windows']}] {progress['set']} "
+                    f"{progress['from']} ~ {progress['until']}: 新增 {window_new} 篇 (累计 {total_new})"
+                )
+                window_new = 0
+    except Exception as e:
+        click.secho(f"❌ 采集失败 / Harvest failed: {e}（已保存 {total_new} 篇）", fg="red")
+        sys.exit(1)
+    finally:
+        db.close_writer()
+    click.secho(f"✅ 采集完成 / Done: 新增 {total_new} 篇, {time.monotonic() - started:.1f}s", fg="green")
+
+
+@cli.command("export-corpus")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False), default=".")
+@click.option("--output", "-o", required=True, type=click.Path(file_okay=False), help="导出目录")
+@click.option("--format", "fmt", type=click.Choice(["parquet", "arrow"]), default="parquet", help="文件格式")
+@click.option("--chunk-size", default=50000, type=int, help="每块行数 (默认: 50000)")
+def export_corpus(directory, output, fmt, chunk_size):
+    """导出论文库为 Parquet / Arrow 文件
+
+    \b
+    参数:
+        DIRECTORY    数据存储目录 (默认: 当前目录)
+
+    \b
+    说明:
+        导出论文、分类、作者、论文集和归档论文（不含缓存和配置），
+        每张表一个文件，外加 corpus.json 清单。服务运行时也可以导出。
+
+    \b
+    示例:
+        pulse export-corpus . -o corpus/              # 导出为 Parquet
+        pulse export-corpus . -o corpus/ --format arrow
+    """
+    import time
+
+    from arxiv_pulse.services.corpus_service import export_corpus as run_export
+
+    directory = Path(directory).resolve()
+    db = _open_database(directory)
+    click.echo(f"📤 正在导出论文库 / Exporting corpus: {directory} -> {output}")
+    started = time.monotonic()
+    try:
+        manifest = run_export(db.engine, output, fmt, chunk_size, progress=_echo_progress)
+    except RuntimeError as e:
+        click.secho(f"❌ {e}", fg="red")
+        sys.exit(1)
+    total = sum(entry["rows"] for entry in manifest["tables"].values())
+    click.secho(f"✅ 导出完成 / Done: {total} 行, {time.monotonic() - started:.1f}s", fg="green")
+
+
+@cli.command("import-corpus")
+@click.argument("source", type=click.Path(exists=True))
+@click.argument("directory", type=click.Path(file_okay=False), default=".")
+@click.option("--chunk-size", default=50000, type=int, help="每块行数 (默认: 50000)")
+def import_corpus(source, directory, chunk_size):
+    """把 export-corpus 的导出（目录或 zip）导入到新的数据目录
+
+    \b
+    参数:
+        SOURCE       导出目录或 zip 文件
+        DIRECTORY    目标数据存储目录 (默认: 当前目录)，其中不能已有论文
+
+    \b
+    示例:
+        pulse import-corpus corpus/ /path/to/new      # 导入到新数据目录
+        pulse import-corpus corpus.zip .
+    """
+    import time
+
+    from arxiv_pulse.services.corpus_service import import_corpus as run_import
+
+    directory = Path(directory).resolve()
+    is_locked, _ = ServiceLock(directory).is_locked()
+    if is_locked:
+        click.secho("❌ 服务正在运行，请先停止 / Service is running, stop it first", fg="red")
+        sys.exit(1)
+
+    db = _open_database(directory)
+    click.echo(f"📥 正在导入论文库 / Importing corpus: {source} -> {directory}")
+    started = time.monotonic()
+    try:
+        counts = run_import(db.engine, source, chunk_size, progress=_echo_progress)
+    except (RuntimeError, ValueError) as e:
+        click.secho(f"❌ {e}", fg="red")
+        sys.exit(1)
+    finally:
+        db.close_writer()
+    click.secho(f"✅ 导入完成 / Done: {sum(counts.values())} 行, {time.monotonic() - started:.1f}s", fg="green")
+
+
 if __name__ == "__main__":
     cli()
@@ -1,6 +1,11 @@
 from arxiv_pulse.constants.categories import (
     ARXIV_CATEGORIES,
+    CATEGORY_ANCESTORS,
+    CATEGORY_TABLE,
+    CATEGORY_TRIE,
     DEFAULT_FIELDS,
+    CategoryTrie,
+    expand_category,
     get_all_categories,
     get_category_query,
     get_field_display_name,
@@ -10,7 +15,12 @@ from arxiv_pulse.constants.categories import (
 
 __all__ = [
     "ARXIV_CATEGORIES",
+    "CATEGORY_ANCESTORS",
+    "CATEGORY_TABLE",
+    "CATEGORY_TRIE",
+    "CategoryTrie",
     "DEFAULT_FIELDS",
+    "expand_category",
     "get_all_categories",
     "get_category_query",
     "get_field_display_name",
@@ -3,6 +3,10 @@ arXiv 官方分类体系
 基于 https://arxiv.org/category_taxonomy
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 ARXIV_CATEGORIES = {
     "physics": {
         "id": "physics",
@@ -383,29 +387,87 @@ ARXIV_CATEGORIES = {
 DEFAULT_FIELDS = ["cond-mat.mtrl-sci", "quant-ph", "cs.LG"]
 
 
-def get_all_categories() -> dict:
-    """获取所有分类的扁平化字典"""
-    result = {}
+class CategoryTrie:
+    """按 "." 分段的分类代码前缀树，`cond-mat` / `cond-mat.*` 查出整个大类"""
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, CategoryTrie] = {}
+        self.ids: frozenset[str] = frozenset()  # 该前缀下的所有分类代码（含前缀本身）
+
+    def insert(self, category_id: str) -> None:
+        node = self
+        node.ids |= {category_id}
+        for segment in category_id.split("."):
+            node = node.children.setdefault(segment, CategoryTrie())
+            node.ids |= {category_id}
+
+    def expand(self, pattern: str) -> frozenset[str]:
+        """分类代码或通配符 -> 匹配的已知分类代码；不带 "." 的代码（或 `x.*`）匹配整个大类"""
+        pattern = pattern.strip()
+        wildcard = pattern.endswith(".*") or "." not in pattern
+        node = self
+        for segment in pattern.removesuffix(".*").split("."):
+            child = node.children.get(segment)
+            if child is None:
+                return frozenset()
+            node = child
+        if wildcard:
+            return node.ids
+        return frozenset({pattern}) & node.ids
+
+
+def _compile_taxonomy() -> tuple[Mapping[str, Mapping[str, Any]], Mapping[str, tuple[str, ...]], CategoryTrie]:
+    """把 ARXIV_CATEGORIES 树编译为只读查找表，导入时执行一次"""
+    table: dict[str, MappingProxyType] = {}
+    parents: dict[str, tuple[str, ...]] = {}
 
-    def traverse(node: dict, parent_id: str = ""):
-        if "id" in node:
-            cat_id = node["id"]
-            result[cat_id] = {
+    def traverse(node: dict, ancestors: tuple[str, ...]):
+        if "id" not in node:
+            return
+        cat_id = node["id"]
+        table[cat_id] = MappingProxyType(
+            {
                 "id": cat_id,
                 "name": node.get("name", cat_id),
                 "name_en": node.get("name_en", cat_id),
-                "parent": parent_id,
+                "parent": ancestors[0] if ancestors else "",
                 "recommended": node.get("recommended", False),
                 "has_children": "children" in node,
             }
-            if "children" in node:
-                for child in node["children"].values():
-                    traverse(child, cat_id)
+        )
+        parents[cat_id] = ancestors
+        for child in node.get("children", {}).values():
+            traverse(child, (cat_id, *ancestors))
 
     for group in ARXIV_CATEGORIES.values():
-        traverse(group)
+        traverse(group, ())
+
+    trie = CategoryTrie()
+    for cat_id in table:
+        trie.insert(cat_id)
+
+    return (
+        MappingProxyType(table),
+        MappingProxyType(parents),
+        trie,
+    )
+
+
+# 扁平分类表（分类代码 -> 只读信息）、祖先闭包（由近到远）、代码前缀树（兼作后代闭包：expand_category）
+CATEGORY_TABLE, CATEGORY_ANCESTORS, CATEGORY_TRIE = _compile_taxonomy()
+RECOMMENDED_FIELDS: tuple[str, ...] = tuple(cat_id for cat_id, info in CATEGORY_TABLE.items() if info["recommended"])
+
+
+def get_all_categories() -> Mapping[str, Mapping[str, Any]]:
+    """获取所有分类的扁平化字典（导入时编译好的只读表）"""
+    return CATEGORY_TABLE
+
 
-    return result
+def expand_category(pattern: str) -> frozenset[str]:
+    """分类代码或通配符（`cond-mat`、`cond-mat.*`）对应的已知分类代码"""
+    return CATEGORY_TRIE.expand(pattern)
 
 
 def get_category_query(category_id: str) -> str:
@@ -426,13 +488,12 @@ def get_queries_for_fields(field_ids: list[str]) -> list[str]:
 
 def get_recommended_fields() -> list[str]:
     """获取推荐领域列表"""
-    all_cats = get_all_categories()
-    return [cat_id for cat_id, info in all_cats.items() if info.get("recommended", False)]
+    return list(RECOMMENDED_FIELDS)
 
 
 def get_field_display_name(field_id: str, lang: str = "zh") -> str:
     """获取领域的显示名称"""
-    all_cats = get_all_categories()
-    if field_id in all_cats:
-        return all_cats[field_id].get("name" if lang == "zh" else "name_en", field_id)
-    return field_id
+    info = CATEGORY_TABLE.get(field_id)
+    if info is None:
+        return field_id
+    return info["name" if lang == "zh" else "name_en"]
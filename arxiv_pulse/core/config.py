@@ -1,4 +1,21 @@
+"""
+配置访问
+
+Config.X 从内存中的只读快照读取，不再每次访问都查询 system_config。快照带有配置版本号：
+本进程修改配置（Database.set_configs）后立即失效；其他进程（多个 worker、命令行）的修改
+通过版本号发现，每隔 CONFIG_VERSION_CHECK_INTERVAL 秒最多检查一次。
+"""
+
 import os
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+
+from arxiv_pulse.models import DEFAULT_CONFIG
+
+CONFIG_VERSION_CHECK_INTERVAL = 1.0  # 秒：两次检查数据库中配置版本号的最短间隔
 
 
 class classproperty:
@@ -23,11 +40,49 @@ def get_db():
     return _db_instance
 
 
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """某一配置版本的全部配置，创建后不再修改，可在线程间共享"""
+
+    version: int
+    values: Mapping[str, str]
+    checked_at: float  # 最近一次确认版本号未变的时间（time.monotonic）
+
+
 class Config:
+    _snapshot: ConfigSnapshot | None = None
+    _generation = 0  # invalidate() 的次数，防止加载中的旧快照覆盖失效标记
+    _snapshot_lock = threading.Lock()
+
+    @classmethod
+    def snapshot(cls) -> ConfigSnapshot:
+        """当前配置快照；版本号未变时不重新读取配置"""
+        snapshot = cls._snapshot
+        if snapshot is not None and time.monotonic() - snapshot.checked_at < CONFIG_VERSION_CHECK_INTERVAL:
+            return snapshot
+        with cls._snapshot_lock:
+            snapshot, generation, now = cls._snapshot, cls._generation, time.monotonic()
+            if snapshot is not None and now - snapshot.checked_at < CONFIG_VERSION_CHECK_INTERVAL:
+                return snapshot
+            db = get_db()
+            if snapshot is not None and db.get_config_version() == snapshot.version:
+                snapshot = replace(snapshot, checked_at=now)
+            else:
+                version, values = db.get_config_snapshot()
+                snapshot = ConfigSnapshot(version, MappingProxyType(values), now)
+            if generation == cls._generation:
+                cls._snapshot = snapshot
+            return snapshot
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """丢弃快照，下次访问时重新加载（本进程修改配置后由 Database.set_configs 调用）"""
+        cls._generation += 1
+        cls._snapshot = None
+
     @classmethod
     def _get(cls, key: str, default: str = "") -> str:
-        db = get_db()
-        value = db.get_config(key)
+        value = cls.snapshot().values.get(key)
         return value if value is not None else default
 
     @classmethod
@@ -61,8 +116,8 @@ class Config:
 
     @classproperty
     def SEARCH_QUERIES(cls) -> list[str]:
-        db = get_db()
-        return db.get_search_queries()
+        queries_str = cls._get("search_queries", DEFAULT_CONFIG["search_queries"])
+        return [q.strip() for q in queries_str.split(";") if q.strip()]
 
     @classproperty
     def ARXIV_MAX_RESULTS(cls) -> int:
@@ -84,6 +139,10 @@ class Config:
     def YEARS_BACK(cls) -> int:
         return cls._get_int("years_back", 5)
 
+    @classproperty
+    def ARCHIVE_HORIZON_DAYS(cls) -> int:
+        return cls._get_int("archive_horizon_days", 0)
+
     @classproperty
     def SUMMARY_MAX_TOKENS(cls) -> int:
         return int(os.getenv("SUMMARY_MAX_TOKENS", "10000"))
@@ -111,8 +170,7 @@ class Config:
 
     @classmethod
     def is_initialized(cls) -> bool:
-        db = get_db()
-        return db.is_initialized()
+        return cls._get("is_initialized") == "true"
 
     @classmethod
     def set_initialized(cls, initialized: bool = True) -> None:
@@ -121,13 +179,12 @@ class Config:
 
     @classmethod
     def get_all_config(cls) -> dict[str, str]:
-        db = get_db()
-        return db.get_all_config()
+        return dict(cls.snapshot().values)
 
     @classmethod
     def update_config(cls, config_dict: dict[str, str]) -> None:
-        for key, value in config_dict.items():
-            cls._set(key, value)
+        db = get_db()
+        db.set_configs(config_dict)
 
     @classmethod
     def validate(cls) -> bool:
@@ -1,22 +1,198 @@
+import hashlib
 import json
-from datetime import UTC, datetime, timedelta
+import os
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from datetime import UTC, date, datetime, timedelta
 
-from sqlalchemy import create_engine
+from sqlalchemy import ColumnElement, Integer, Text, cast, create_engine, event, func, insert, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from arxiv_pulse.core.maintenance import CacheAccessLog
+from arxiv_pulse.core.migrations import QueryPlanError, run_migrations, verify_query_plans
+from arxiv_pulse.core.paper_index import PaperIndex, count_and_max_id
+from arxiv_pulse.core.writer import DatabaseWriter, WriteOp
 from arxiv_pulse.models import (
+    ARCHIVE_SCHEMA,
+    CACHE_SCHEMA,
     DEFAULT_CONFIG,
+    PAPERS_FTS_DDL,
+    PAPERS_FTS_REBUILD,
+    STAT_ALL_CATEGORIES,
+    STATS_REBUILD_SQL,
+    ArchivedPaper,
+    Author,
     Base,
+    CollectionPaper,
+    CollectionStat,
+    DailyCategoryStat,
     FigureCache,
     Paper,
+    PaperAuthor,
+    PaperCategory,
     PaperContentCache,
+    QueryStat,
+    StatCounter,
+    SyncCheckpoint,
+    SyncTask,
     TranslationCache,
+    compress_text,
+    normalize_author_name,
+    utcnow,
 )
+from arxiv_pulse.utils import output
+
+BULK_BATCH_SIZE = 500
+ARCHIVE_DB_FILENAME = "archive.db"
+CACHE_DB_FILENAME = "cache.db"
+
+# 附加库：schema -> (文件名, 每个连接上执行的 PRAGMA)。auto_vacuum 只对新建的空库生效
+ATTACHED_DATABASES = {
+    ARCHIVE_SCHEMA: (ARCHIVE_DB_FILENAME, ("auto_vacuum=INCREMENTAL", "journal_mode=WAL")),
+    # 缓存都可重建：不等待 fsync，掉电丢失或损坏时删除 cache.db 即可
+    CACHE_SCHEMA: (CACHE_DB_FILENAME, ("auto_vacuum=INCREMENTAL", "journal_mode=WAL", "synchronous=OFF")),
+}
+
+
+def translation_cache_key(source_text: str, target_language: str = "zh") -> str:
+    """TranslationCache.source_text_hash：原文与目标语言一起做 SHA-256"""
+    return hashlib.sha256(f"{source_text}:{target_language}".encode()).hexdigest()
+
+
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")  # 只对新建的空库生效，已有库由迁移 v4 转换
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.close()
+
+
+def attached_path_for(url: URL, filename: str) -> str:
+    """附加库与主库放在同一目录；内存库对应内存附加库"""
+    if not url.database or url.database == ":memory:":
+        return ":memory:"
+    return os.path.join(os.path.dirname(os.path.abspath(url.database)), filename)
+
+
+def attach_databases(url: URL):
+    """生成 connect 监听器：在每个新连接上 ATTACH 归档库和缓存库"""
+    paths = {schema: attached_path_for(url, filename) for schema, (filename, _) in ATTACHED_DATABASES.items()}
+
+    def listener(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for schema, (_, pragmas) in ATTACHED_DATABASES.items():
+            cursor.execute(f"ATTACH DATABASE ? AS {schema}", (paths[schema],))
+            for pragma in pragmas:
+                cursor.execute(f"PRAGMA {schema}.{pragma}")
+        cursor.close()
+
+    return listener
+
+
+class RequestScope:
+    """一次请求内共享的同步会话，以及该请求的数据库用量（打开的会话数、执行的 SQL 条数）
+
+    作用域内 Database.get_session() 都借用同一个会话，请求结束时统一关闭。
+    同一请求内的代码顺序执行（包括 asyncio.to_thread），不会并发使用这个会话。
+    """
+
+    def __init__(self, session_factory):
+        self._session_factory = session_factory
+        self._session = None
+        self.closed = False
+        self.sessions = 0
+        self.queries = 0
+
+    def session(self):
+        if self._session is None:
+            self._session = self._session_factory()
+            self.sessions += 1
+        return self._session
+
+    def expire(self):
+        """让共享会话中已加载的对象在下次访问时重新读取（写线程提交了新数据之后调用）"""
+        if self._session is not None:
+            self._session.expire_all()
+
+    def close(self):
+        self.closed = True
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+_request_scope: ContextVar[RequestScope | None] = ContextVar("db_request_scope", default=None)
+
+
+def current_request_scope() -> RequestScope | None:
+    """当前上下文中仍有效的请求作用域（请求结束后遗留的后台任务拿到的是 None）"""
+    scope = _request_scope.get()
+    return scope if scope is not None and not scope.closed else None
+
+
+def detached_context() -> Context:
+    """复制当前上下文但脱离请求作用域，供请求中启动、生命周期更长的后台任务使用"""
+    context = copy_context()
+    context.run(_request_scope.set, None)
+    return context
+
+
+def count_query(conn, cursor, statement, parameters, context, executemany):
+    scope = current_request_scope()
+    if scope is not None:
+        scope.queries += 1
+
+
+def _holds_write_transaction(session) -> bool:
+    """会话的事务是否已执行过写语句（query.update / execute(insert) 等不进入 new / dirty / deleted）
+
+    pysqlite 只在写语句前隐式 BEGIN，驱动连接的 in_transaction 为真即持有写锁；只读过的事务不必回滚，
+    以免让作用域内已加载的对象全部过期、之后逐个重新查询。其他驱动一律视为需要回滚。
+    """
+    if not session.in_transaction():
+        return False
+    return getattr(session.connection().connection.dbapi_connection, "in_transaction", True)
+
+
+@contextmanager
+def _borrowed_session(session):
+    """借用请求作用域的会话：退出 with 时不关闭；出错、留有未提交的修改或写过却未提交时回滚，与关闭独立会话的效果一致"""
+    try:
+        yield session
+    except BaseException:
+        session.rollback()
+        raise
+    if session.new or session.dirty or session.deleted or _holds_write_transaction(session):
+        session.rollback()
+
+
+def _fill_column_defaults(paper, now: datetime) -> None:
+    """批量插入不经过 ORM，Paper 的列默认值在这里补到对象上（返回的论文与逐条 add 的一致）"""
+    paper.created_at = paper.created_at or now
+    paper.updated_at = paper.updated_at or now
+    paper.relevance_score = paper.relevance_score or 0.0
+    paper.downloaded = bool(paper.downloaded)
+    paper.summarized = bool(paper.summarized)
 
 
 class Database:
-    _instance = None
-    _engine = None
+    _instance: "Database | None" = None
+    _engine: Engine | None = None
+    _async_engine: AsyncEngine | None = None
+    _writer: DatabaseWriter | None = None
+    fts_enabled = False
+    cache_access = CacheAccessLog()
+    paper_index = PaperIndex()
+    papers_version = 0  # 热库论文每次增删后递增，依赖论文数的缓存（分页总数）据此失效
+
+    @classmethod
+    def papers_changed(cls) -> None:
+        cls.papers_version += 1
 
     def __new__(cls, db_url: str | None = None):
         if cls._instance is None:
@@ -28,46 +204,567 @@ class Database:
                 pool_pre_ping=True,
                 connect_args={"check_same_thread": False} if "sqlite" in (db_url or "") else {},
             )
+            if cls._engine.dialect.name == "sqlite":
+                event.listen(cls._engine, "connect", set_sqlite_pragma)
+                event.listen(cls._engine, "connect", attach_databases(cls._engine.url))
+            event.listen(cls._engine, "before_cursor_execute", count_query)
             Base.metadata.create_all(cls._engine)
-            from sqlalchemy import event
 
-            @event.listens_for(cls._engine, "connect")
-            def set_sqlite_pragma(dbapi_connection, connection_record):
-                if "sqlite" in str(cls._engine.url):
-                    cursor = dbapi_connection.cursor()
-                    cursor.execute("PRAGMA journal_mode=WAL")
-                    cursor.execute("PRAGMA synchronous=NORMAL")
-                    cursor.execute("PRAGMA busy_timeout=30000")
-                    cursor.close()
+            cls._instance.Session = sessionmaker(bind=cls._engine)
+            run_migrations(cls._engine)
+            try:
+                verify_query_plans(cls._engine)
+            except QueryPlanError as e:
+                output.warn(str(e))
+            cls._instance.backfill_paper_categories()
+            cls._instance.backfill_paper_authors()
+            cls._instance.ensure_fulltext_index()
 
         return cls._instance
 
     def __init__(self, db_url: str | None = None):
         self.Session = sessionmaker(bind=self._engine)
 
+    @property
+    def engine(self) -> Engine:
+        """同步引擎（在 __new__ 中创建）"""
+        assert Database._engine is not None
+        return Database._engine
+
     def get_session(self):
-        return self.Session()
+        """with db.get_session() as session: ...；请求作用域内借用该请求的共享会话"""
+        scope = current_request_scope()
+        if scope is None:
+            return self.Session()
+        return _borrowed_session(scope.session())
+
+    @contextmanager
+    def request_scope(self):
+        """建立请求作用域，结束时关闭共享会话"""
+        scope = RequestScope(self.Session)
+        token = _request_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _request_scope.reset(token)
+            scope.close()
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        """与同步引擎指向同一数据库的异步引擎（SQLite 使用 aiosqlite），首次使用时创建"""
+        if Database._async_engine is None:
+            url = self.engine.url
+            if url.drivername == "sqlite":
+                url = url.set(drivername="sqlite+aiosqlite")
+            async_engine = create_async_engine(url, pool_pre_ping=True)
+            if self.engine.dialect.name == "sqlite":
+                event.listen(async_engine.sync_engine, "connect", set_sqlite_pragma)
+                event.listen(async_engine.sync_engine, "connect", attach_databases(self.engine.url))
+            event.listen(async_engine.sync_engine, "before_cursor_execute", count_query)
+            Database._async_engine = async_engine
+        return Database._async_engine
+
+    def get_async_session(self) -> AsyncSession:
+        """供 async 路由使用: async with db.get_async_session() as session: ..."""
+        scope = current_request_scope()
+        if scope is not None:
+            scope.sessions += 1
+        return AsyncSession(self.async_engine, expire_on_commit=False)
+
+    async def dispose_async_engine(self) -> None:
+        if Database._async_engine is not None:
+            await Database._async_engine.dispose()
+            Database._async_engine = None
+
+    @property
+    def writer(self) -> DatabaseWriter:
+        """进程内唯一的写线程，见 core/writer.py"""
+        if Database._writer is None:
+            Database._writer = DatabaseWriter(self.Session)
+        return Database._writer
+
+    def write(self, op: WriteOp):
+        """经写线程执行写操作并等待提交，返回 op 的返回值
+
+        请求作用域内的共享会话随后失效重读，保证接下来读到刚写入的数据。
+        """
+        result = self.writer.write(op)
+        scope = current_request_scope()
+        if scope is not None:
+            scope.expire()
+        return result
+
+    def write_later(self, op: WriteOp) -> Future:
+        """低优先级写入：排队后立即返回，由写线程与其他写入合并提交"""
+        return self.writer.submit(op)
+
+    def flush_writes(self) -> None:
+        """等待已排队的写入全部落库"""
+        if Database._writer is not None:
+            Database._writer.flush()
+            scope = current_request_scope()
+            if scope is not None:
+                scope.expire()
+
+    def touch_cache(self, cache: str, keys) -> None:
+        """记录缓存命中（cache 为 CACHE_POLICIES 中的名称），攒够一批后低优先级更新 accessed_at"""
+        if self.cache_access.touch(cache, keys):
+            self.flush_cache_access(wait=False)
+
+    def flush_cache_access(self, wait: bool = True) -> None:
+        """把积攒的缓存命中写入 accessed_at"""
+        op = self.cache_access.flush_op()
+        if op is None:
+            return
+        if wait:
+            self.write(op)
+        else:
+            self.write_later(op)
+
+    def build_paper_index(self) -> int:
+        """全量构建内存论文索引（服务启动时在后台线程调用），返回索引的论文数"""
+        return self.paper_index.build(self.engine)
+
+    def refresh_paper_index(self) -> dict:
+        """索引与数据库的篇数或最大 id 不一致（其他进程写入过）时重建索引"""
+        if not self.paper_index.ready:
+            return {"rebuilt": False, "papers": 0}
+        count, max_id = count_and_max_id(self.engine)
+        if (count, max_id) == (len(self.paper_index), self.paper_index.max_id):
+            return {"rebuilt": False, "papers": count}
+        return {"rebuilt": True, "papers": self.build_paper_index()}
+
+    def close_writer(self) -> None:
+        if Database._writer is not None:
+            Database._writer.stop()
 
     def paper_exists(self, arxiv_id):
+        """热库或归档库中已有该论文"""
         with self.get_session() as session:
-            return session.query(Paper).filter_by(arxiv_id=arxiv_id).first() is not None
+            if session.query(Paper.id).filter_by(arxiv_id=arxiv_id).first() is not None:
+                return True
+            return session.query(ArchivedPaper.id).filter_by(arxiv_id=arxiv_id).first() is not None
+
+    def iter_arxiv_ids(self, chunk_size: int = 50_000):
+        """逐块读出热库和归档库中的全部 arxiv_id（用于同步前加载已知 ID 集合）"""
+        with self.engine.connect() as conn:
+            for model in (Paper, ArchivedPaper):
+                result = conn.execution_options(yield_per=chunk_size).execute(select(model.arxiv_id))
+                for rows in result.partitions():
+                    yield [arxiv_id for (arxiv_id,) in rows]
 
     def add_paper(self, paper):
         with self.get_session() as session:
             session.add(paper)
             session.commit()
+            self.paper_index.add([paper])
+            self.papers_changed()
             return paper.id
 
-    def update_paper(self, arxiv_id, **kwargs):
+    def bulk_upsert_papers(
+        self, entries, search_query: str, batch_size: int = BULK_BATCH_SIZE, skip_errors: bool = False
+    ) -> list[dict]:
+        """批量写入论文，每批一个事务，已存在的 arxiv_id 跳过
+
+        Args:
+            entries: arxiv.Result 或 Paper 对象列表
+            search_query: 写入 Paper.search_query 的查询
+            batch_size: 每个事务写入的论文数
+            skip_errors: 一批写入失败时逐篇重试，跳过（并记录）仍然失败的论文，不抛出异常；
+                默认直接抛出，之前各批已提交的论文仍在库中
+
+        Returns:
+            每批一条报告: {"inserted": [Paper, ...], "skipped": int, "failed": int}
+        """
+        papers = []
+        seen = set()
+        failed_entries = 0
+        for entry in entries:
+            try:
+                paper = entry if isinstance(entry, Paper) else Paper.from_arxiv_entry(entry, search_query)
+            except Exception as e:
+                if not skip_errors:
+                    raise
+                failed_entries += 1
+                output.error(
+                    "保存论文失败", details={"paper_id": getattr(entry, "entry_id", entry), "exception": str(e)}
+                )
+                continue
+            if paper.arxiv_id in seen:
+                continue
+            seen.add(paper.arxiv_id)
+            papers.append(paper)
+
+        columns = [c.name for c in Paper.__table__.columns if c.name != "id"]
+        stmt = (
+            sqlite_insert(Paper.__table__)
+            .on_conflict_do_nothing(index_elements=["arxiv_id"])
+            .returning(Paper.__table__.c.id, Paper.__table__.c.arxiv_id)
+        )
+
+        def write_batch(batch: list[Paper]) -> list[Paper]:
+            now = utcnow()
+            rows = []
+            for paper in batch:
+                _fill_column_defaults(paper, now)
+                rows.append({name: getattr(paper, name) for name in columns})
+
+            def insert_batch(session):
+                # 已归档的论文不再写回热库
+                archived = set(
+                    session.scalars(
+                        select(ArchivedPaper.arxiv_id).where(ArchivedPaper.arxiv_id.in_([r["arxiv_id"] for r in rows]))
+                    )
+                )
+                new_rows = [row for row in rows if row["arxiv_id"] not in archived]
+                inserted_ids = (
+                    {arxiv_id: paper_id for paper_id, arxiv_id in session.execute(stmt, new_rows)} if new_rows else {}
+                )
+                inserted = []
+                category_rows = []
+                for paper in batch:
+                    if paper.arxiv_id in inserted_ids:
+                        paper.id = inserted_ids[paper.arxiv_id]
+                        inserted.append(paper)
+                        category_rows.extend(PaperCategory.rows_for(paper.id, paper.categories, paper.primary_category))
+                if category_rows:
+                    session.execute(PaperCategory.__table__.insert(), category_rows)
+                self._index_authors(session, [(paper.id, paper.authors) for paper in inserted])
+                return inserted
+
+            inserted: list[Paper] = self.write(insert_batch)
+            self.paper_index.add(inserted)
+            if inserted:
+                self.papers_changed()
+            return inserted
+
+        reports = []
+        for start in range(0, len(papers), batch_size):
+            batch = papers[start : start + batch_size]
+            failed = 0
+            try:
+                inserted = write_batch(batch)
+            except Exception:
+                if not skip_errors:
+                    raise
+                # 逐篇重试，只跳过出错的论文
+                inserted = []
+                for paper in batch:
+                    try:
+                        inserted.extend(write_batch([paper]))
+                    except Exception as e:
+                        failed += 1
+                        output.error("保存论文失败", details={"paper_id": paper.arxiv_id, "exception": str(e)})
+            reports.append({"inserted": inserted, "skipped": len(batch) - len(inserted) - failed, "failed": failed})
+
+        if failed_entries:
+            reports.append({"inserted": [], "skipped": 0, "failed": failed_entries})
+        return reports
+
+    def archive_old_papers(self, horizon_days: int, batch_size: int = 1000) -> int:
+        """把发表早于 horizon_days 天、且不在任何论文集中的论文移入归档库，返回移动的篇数
+
+        每批一个事务：先复制到 archive.papers，再只删除确认已复制进归档库的论文及其分类、作者索引行
+        （删除会经触发器同步 FTS 索引和统计汇总表）。归档库中已有同一 arxiv_id（或 id）的论文留在热库，
+        既不覆盖归档中的那一篇，也不丢弃。horizon_days <= 0 表示不归档。
+        """
+        if horizon_days <= 0:
+            return 0
+
+        cutoff = utcnow() - timedelta(days=horizon_days)
+        columns = [c.name for c in Paper.__table__.columns]
+
+        def move_batch(session):
+            # 保留 id 最大的一篇：SQLite 按 max(id)+1 分配新 id，这样新论文不会复用归档论文的 id
+            max_id = select(func.max(Paper.id)).scalar_subquery()
+            ids = session.scalars(
+                select(Paper.id)
+                .where(
+                    Paper.published < cutoff,
+                    Paper.id < max_id,
+                    Paper.id.notin_(select(CollectionPaper.paper_id)),
+                    Paper.id.notin_(select(ArchivedPaper.id)),
+                    Paper.arxiv_id.notin_(select(ArchivedPaper.arxiv_id)),
+                )
+                .limit(batch_size)
+            ).all()
+            if not ids:
+                return 0, []
+            source = select(*[Paper.__table__.c[name] for name in columns]).where(Paper.id.in_(ids))
+            session.execute(insert(ArchivedPaper.__table__).prefix_with("OR IGNORE").from_select(columns, source))
+            # 只删除确实复制进归档库的论文：复制被忽略的论文留在热库
+            moved_ids = session.scalars(
+                select(Paper.id)
+                .join(ArchivedPaper, (ArchivedPaper.id == Paper.id) & (ArchivedPaper.arxiv_id == Paper.arxiv_id))
+                .where(Paper.id.in_(ids))
+            ).all()
+            session.query(PaperCategory).filter(PaperCategory.paper_id.in_(moved_ids)).delete(synchronize_session=False)
+            session.query(PaperAuthor).filter(PaperAuthor.paper_id.in_(moved_ids)).delete(synchronize_session=False)
+            session.query(Paper).filter(Paper.id.in_(moved_ids)).delete(synchronize_session=False)
+            return len(ids), moved_ids
+
+        moved = 0
+        while True:
+            selected, ids = self.write(move_batch)
+            self.paper_index.remove(ids)
+            if ids:
+                self.papers_changed()
+            moved += len(ids)
+            if selected < batch_size or not ids:
+                break
+        if moved:
+            output.info(f"归档论文 {moved} 篇（发表早于 {cutoff.date()}）")
+        return moved
+
+    def get_archived_paper(self, paper_id: int | None = None, arxiv_id: str | None = None) -> ArchivedPaper | None:
         with self.get_session() as session:
-            paper = session.query(Paper).filter_by(arxiv_id=arxiv_id).first()
-            if paper:
-                for key, value in kwargs.items():
-                    setattr(paper, key, value)
-                paper.updated_at = datetime.now(UTC).replace(tzinfo=None)
+            query = session.query(ArchivedPaper)
+            query = query.filter_by(id=paper_id) if paper_id is not None else query.filter_by(arxiv_id=arxiv_id)
+            archived: ArchivedPaper | None = query.first()
+            return archived
+
+    def backfill_paper_categories(self, batch_size: int = 5000) -> int:
+        """为还没有 paper_categories 行的论文补齐分类索引"""
+        count = 0
+        with self.get_session() as session:
+            while True:
+                papers = (
+                    session.query(Paper.id, Paper.categories, Paper.primary_category)
+                    .filter(Paper.id.notin_(select(PaperCategory.paper_id)))
+                    .limit(batch_size)
+                    .all()
+                )
+                if not papers:
+                    break
+                rows = []
+                for paper_id, categories, primary_category in papers:
+                    rows.extend(PaperCategory.rows_for(paper_id, categories, primary_category))
+                if not rows:
+                    break
+                session.execute(PaperCategory.__table__.insert(), rows)
                 session.commit()
-                return True
+                count += len(papers)
+        return count
+
+    def _index_authors(self, session, papers) -> None:
+        """写入 authors / paper_authors，papers 为 (paper_id, authors_json) 列表，不提交事务"""
+        names_by_paper = [(paper_id, PaperAuthor.author_names(authors)) for paper_id, authors in papers]
+        display_names: dict[str, str] = {}
+        for _, names in names_by_paper:
+            for name in names:
+                display_names.setdefault(normalize_author_name(name), name)
+        if not display_names:
+            return
+
+        normalized = list(display_names)
+        session.execute(
+            sqlite_insert(Author.__table__).on_conflict_do_nothing(index_elements=["normalized_name"]),
+            [{"name": display_names[key], "normalized_name": key} for key in normalized],
+        )
+        author_ids = {}
+        for start in range(0, len(normalized), BULK_BATCH_SIZE):
+            chunk = normalized[start : start + BULK_BATCH_SIZE]
+            author_ids.update(
+                session.execute(
+                    select(Author.normalized_name, Author.id).where(Author.normalized_name.in_(chunk))
+                ).all()
+            )
+
+        rows = [
+            {"paper_id": paper_id, "position": position, "author_id": author_ids[normalize_author_name(name)]}
+            for paper_id, names in names_by_paper
+            for position, name in enumerate(names)
+        ]
+        session.execute(sqlite_insert(PaperAuthor.__table__).on_conflict_do_nothing(), rows)
+
+    def backfill_paper_authors(self, batch_size: int = 2000) -> int:
+        """为还没有 paper_authors 行的论文补齐作者索引"""
+        count = 0
+        with self.get_session() as session:
+            last_id = 0
+            while True:
+                papers = (
+                    session.query(Paper.id, Paper.authors)
+                    .filter(Paper.id > last_id, Paper.id.notin_(select(PaperAuthor.paper_id)))
+                    .order_by(Paper.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not papers:
+                    break
+                self._index_authors(session, papers)
+                session.commit()
+                last_id = papers[-1].id
+                count += len(papers)
+        return count
+
+    def ensure_fulltext_index(self) -> bool:
+        """创建 papers_fts 全文索引及同步触发器，新建时从 papers 重建索引"""
+        if self.engine.dialect.name != "sqlite":
             return False
+        try:
+            with self.engine.begin() as conn:
+                existed = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'papers_fts'")
+                ).first()
+                for ddl in PAPERS_FTS_DDL:
+                    conn.execute(text(ddl))
+                if not existed:
+                    for statement in PAPERS_FTS_REBUILD:
+                        conn.execute(text(statement))
+            Database.fts_enabled = True
+        except Exception as e:
+            output.warn(f"全文索引不可用，搜索将回退到 LIKE 匹配: {e}")
+            Database.fts_enabled = False
+        return Database.fts_enabled
+
+    def get_category_counts(self, session=None) -> dict[str, int]:
+        """按分类统计论文数（读 stat_daily_categories 汇总表）"""
+        if session is None:
+            with self.get_session() as s:
+                return self.get_category_counts(s)
+        paper_count: ColumnElement[int] = func.sum(DailyCategoryStat.paper_count)
+        rows = (
+            session.query(DailyCategoryStat.category, paper_count)
+            .filter(DailyCategoryStat.category != STAT_ALL_CATEGORIES)
+            .group_by(DailyCategoryStat.category)
+            .having(paper_count > 0)
+            .all()
+        )
+        return {category: count for category, count in rows}
+
+    def get_stat_counters(self, session=None) -> dict[str, int]:
+        """汇总计数器: papers / summarized / summary_chars / collections / collection_papers"""
+        if session is None:
+            with self.get_session() as s:
+                return self.get_stat_counters(s)
+        return {name: value for name, value in session.query(StatCounter.name, StatCounter.value).all()}
+
+    def count_papers_since(self, day: date, session=None) -> int:
+        """发表日期不早于 day 的论文数（读按天汇总）"""
+        if session is None:
+            with self.get_session() as s:
+                return self.count_papers_since(day, s)
+        count: int = (
+            session.query(func.coalesce(func.sum(DailyCategoryStat.paper_count), 0))
+            .filter(DailyCategoryStat.category == STAT_ALL_CATEGORIES, DailyCategoryStat.day >= day)
+            .scalar()
+        )
+        return count
+
+    def get_year_counts(self, session=None) -> dict[int, int]:
+        """按发表年份统计论文数（读按天汇总）"""
+        if session is None:
+            with self.get_session() as s:
+                return self.get_year_counts(s)
+        year = func.strftime("%Y", DailyCategoryStat.day)
+        rows = (
+            session.query(year, func.sum(DailyCategoryStat.paper_count))
+            .filter(DailyCategoryStat.category == STAT_ALL_CATEGORIES)
+            .group_by(year)
+            .all()
+        )
+        return {int(y): count for y, count in sorted(rows) if y and count}
+
+    def get_query_stats(self, session=None) -> dict[str, dict]:
+        """按 search_query 统计论文数、已总结数和最新发表时间"""
+        if session is None:
+            with self.get_session() as s:
+                return self.get_query_stats(s)
+        return {
+            q.search_query: {
+                "papers": q.paper_count,
+                "summarized": q.summarized_count,
+                "latest_published": q.latest_published,
+            }
+            for q in session.query(QueryStat).filter(QueryStat.paper_count > 0).all()
+        }
+
+    def get_collection_sizes(self, session=None) -> dict[int, int]:
+        if session is None:
+            with self.get_session() as s:
+                return self.get_collection_sizes(s)
+        return {cid: count for cid, count in session.query(CollectionStat.collection_id, CollectionStat.paper_count)}
+
+    def rebuild_stats_rollups(self) -> None:
+        """从原始表重算全部统计汇总表（汇总表由触发器维护，正常情况下无需调用）"""
+        with self.engine.begin() as conn:
+            for statement in STATS_REBUILD_SQL:
+                conn.execute(text(statement))
+
+    def get_author_counts(self, limit: int | None = None, session=None) -> dict[str, int]:
+        """按作者统计论文数（GROUP BY paper_authors），按篇数降序"""
+        if session is None:
+            with self.get_session() as s:
+                return self.get_author_counts(limit, s)
+        paper_count = func.count(func.distinct(PaperAuthor.paper_id))
+        query = (
+            session.query(Author.name, paper_count)
+            .join(PaperAuthor, PaperAuthor.author_id == Author.id)
+            .group_by(Author.id)
+            .order_by(paper_count.desc(), Author.name)
+        )
+        if limit:
+            query = query.limit(limit)
+        return {name: count for name, count in query.all()}
+
+    def get_papers_by_author(self, name: str, limit: int = 64, exact: bool = True) -> list[Paper]:
+        """某作者的论文（按发表时间倒序），通过 paper_authors 索引查找"""
+        with self.get_session() as session:
+            papers: list[Paper] = (
+                session.query(Paper)
+                .filter(Paper.id.in_(PaperAuthor.paper_ids_by_author(name, exact=exact)))
+                .order_by(Paper.published.desc())
+                .limit(limit)
+                .all()
+            )
+            return papers
+
+    def get_papers_by_arxiv_ids(self, arxiv_ids: list[str]) -> list[Paper]:
+        if not arxiv_ids:
+            return []
+        with self.get_session() as session:
+            papers = session.query(Paper).filter(Paper.arxiv_id.in_(arxiv_ids)).all()
+            id_to_paper = {p.arxiv_id: p for p in papers}
+            return [id_to_paper[aid] for aid in arxiv_ids if aid in id_to_paper]
+
+    def update_paper(self, arxiv_id, **kwargs):
+        def apply(session):
+            paper = session.query(Paper).filter_by(arxiv_id=arxiv_id).first()
+            if not paper:
+                return None
+            for key, value in kwargs.items():
+                setattr(paper, key, value)
+            paper.updated_at = datetime.now(UTC).replace(tzinfo=None)
+            return paper.id
+
+        paper_id = self.write(apply)
+        if paper_id and "summarized" in kwargs:
+            self.paper_index.set_summarized([paper_id], bool(kwargs["summarized"]))
+        return paper_id is not None
+
+    def update_sync_task(self, task_id: str, **fields) -> Future:
+        """低优先级更新 SyncTask 的进度字段"""
+
+        def apply(session):
+            session.query(SyncTask).filter_by(id=task_id).update(fields, synchronize_session=False)
+
+        return self.write_later(apply)
+
+    def get_sync_checkpoint(self, key: str) -> SyncCheckpoint | None:
+        with self.get_session() as session:
+            checkpoint: SyncCheckpoint | None = session.get(SyncCheckpoint, key)
+            return checkpoint
+
+    def save_sync_checkpoint(self, key: str, **fields) -> None:
+        """写入同步检查点（不存在则新建），与论文入库同样经写线程按顺序提交"""
+
+        def apply(session):
+            now = utcnow()
+            stmt = sqlite_insert(SyncCheckpoint.__table__).values(key=key, created_at=now, updated_at=now, **fields)
+            session.execute(stmt.on_conflict_do_update(index_elements=["key"], set_={**fields, "updated_at": now}))
+
+        self.write(apply)
 
     def get_recent_papers(self, days=7, limit=100):
         with self.get_session() as session:
@@ -84,7 +781,7 @@ class Database:
         with self.get_session() as session:
             return (
                 session.query(Paper)
-                .filter(Paper.categories.contains(category) | Paper.primary_category.contains(category))
+                .filter(Paper.id.in_(PaperCategory.paper_ids_matching([category])))
                 .order_by(Paper.published.desc())
                 .limit(limit)
                 .all()
@@ -102,42 +799,48 @@ class Database:
 
     def get_statistics(self):
         with self.get_session() as session:
-            total = session.query(Paper).count()
-            summarized = session.query(Paper).filter_by(summarized=True).count()
-            categories = {}
-            papers = session.query(Paper).all()
-            for paper in papers:
-                for cat in paper.categories.split(", "):
-                    categories[cat] = categories.get(cat, 0) + 1
+            counters = self.get_stat_counters(session)
             return {
-                "total_papers": total,
-                "summarized_papers": summarized,
-                "categories_distribution": categories,
+                "total_papers": counters.get("papers", 0),
+                "summarized_papers": counters.get("summarized", 0),
+                "categories_distribution": self.get_category_counts(session),
             }
 
     def get_translation_cache(self, source_text: str, target_language: str = "zh") -> str | None:
-        import hashlib
-
-        cache_key = f"{source_text}:{target_language}"
-        text_hash = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+        text_hash = translation_cache_key(source_text, target_language)
 
         with self.get_session() as session:
             cache_entry = session.query(TranslationCache).filter_by(source_text_hash=text_hash).first()
             if cache_entry:
+                self.touch_cache("translations", [text_hash])
                 return cache_entry.translated_text
             return None
 
-    def set_translation_cache(self, source_text: str, translated_text: str, target_language: str = "zh") -> None:
-        import hashlib
+    def get_translation_cache_many(self, texts, target_language: str = "zh") -> dict[str, str]:
+        """用 IN (...) 批量查询翻译缓存，返回 {原文: 译文}，未命中的原文不在结果中"""
+        by_hash = {translation_cache_key(t, target_language): t for t in texts if t}
+        hashes = list(by_hash)
+        result: dict[str, str] = {}
+        hits: list[str] = []
+        with self.get_session() as session:
+            for start in range(0, len(hashes), BULK_BATCH_SIZE):
+                rows = session.query(TranslationCache.source_text_hash, TranslationCache.translated_text).filter(
+                    TranslationCache.source_text_hash.in_(hashes[start : start + BULK_BATCH_SIZE])
+                )
+                for text_hash, translated_text in rows:
+                    result[by_hash[text_hash]] = translated_text
+                    hits.append(text_hash)
+        self.touch_cache("translations", hits)
+        return result
 
-        cache_key = f"{source_text}:{target_language}"
-        text_hash = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+    def set_translation_cache(self, source_text: str, translated_text: str, target_language: str = "zh") -> None:
+        text_hash = translation_cache_key(source_text, target_language)
 
-        with self.get_session() as session:
+        def apply(session):
             existing = session.query(TranslationCache).filter_by(source_text_hash=text_hash).first()
             if existing:
                 existing.translated_text = translated_text
-                existing.updated_at = datetime.now(UTC).replace(tzinfo=None)
+                existing.updated_at = existing.accessed_at = datetime.now(UTC).replace(tzinfo=None)
             else:
                 cache_entry = TranslationCache(
                     source_text=source_text,
@@ -146,12 +849,13 @@ class Database:
                     target_language=target_language,
                 )
                 session.add(cache_entry)
-            session.commit()
+
+        self.write_later(apply)
 
     def clear_old_translation_cache(self, days_old: int = 30) -> int:
         with self.get_session() as session:
             cutoff_date = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days_old)
-            deleted_count = session.query(TranslationCache).filter(TranslationCache.updated_at < cutoff_date).delete()
+            deleted_count = session.query(TranslationCache).filter(TranslationCache.accessed_at < cutoff_date).delete()
             session.commit()
             return deleted_count
 
@@ -159,24 +863,26 @@ class Database:
         with self.get_session() as session:
             cache_entry = session.query(FigureCache).filter_by(arxiv_id=arxiv_id).first()
             if cache_entry:
+                self.touch_cache("figures", [arxiv_id])
                 return cache_entry.figure_url
             return None
 
     def set_figure_cache(self, arxiv_id: str, figure_url: str) -> None:
-        with self.get_session() as session:
+        def apply(session):
             existing = session.query(FigureCache).filter_by(arxiv_id=arxiv_id).first()
             if existing:
                 existing.figure_url = figure_url
-                existing.updated_at = datetime.now(UTC).replace(tzinfo=None)
+                existing.updated_at = existing.accessed_at = datetime.now(UTC).replace(tzinfo=None)
             else:
                 cache_entry = FigureCache(arxiv_id=arxiv_id, figure_url=figure_url)
                 session.add(cache_entry)
-            session.commit()
+
+        self.write_later(apply)
 
     def clear_old_figure_cache(self, days_old: int = 30) -> int:
         with self.get_session() as session:
             cutoff_date = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days_old)
-            deleted_count = session.query(FigureCache).filter(FigureCache.updated_at < cutoff_date).delete()
+            deleted_count = session.query(FigureCache).filter(FigureCache.accessed_at < cutoff_date).delete()
             session.commit()
             return deleted_count
 
@@ -192,20 +898,77 @@ class Database:
             session.commit()
             return count
 
+    def get_paper_content(self, arxiv_id: str) -> str | None:
+        """读取缓存的论文正文（解压后的文本）"""
+        with self.get_session() as session:
+            cache = session.query(PaperContentCache).filter_by(arxiv_id=arxiv_id).first()
+            if cache is None:
+                return None
+            self.touch_cache("contents", [arxiv_id])
+            content: str | None = cache.text
+            return content
+
+    def set_paper_content(self, arxiv_id: str, full_text: str) -> None:
+        """压缩后写入论文正文缓存（已存在则覆盖），经写线程低优先级提交"""
+        blob = compress_text(full_text)
+
+        def apply(session):
+            now = utcnow()
+            stmt = sqlite_insert(PaperContentCache.__table__).values(
+                arxiv_id=arxiv_id, full_text_z=blob, created_at=now, accessed_at=now
+            )
+            session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["arxiv_id"], set_={"full_text_z": blob, "full_text": None, "accessed_at": now}
+                )
+            )
+
+        self.write_later(apply)
+
     def clear_all_content_cache(self) -> int:
         with self.get_session() as session:
             count = session.query(PaperContentCache).delete()
             session.commit()
             return count
 
+    def reset_cache_database(self, include_recent: bool = False) -> dict[str, int]:
+        """清空 cache.db 中的翻译、图片、全文缓存：删表重建后 VACUUM，不产生大批量 DELETE 事务
+
+        连接池中的每个连接都附加着 cache.db，不能直接删除文件，这里改为重建其中的表。
+        最近论文列表（recent_results）是用户可见的状态，只有 include_recent 时才一并清空。
+        返回各缓存清除前的行数。
+        """
+        from arxiv_pulse.models import RecentResult
+
+        stats = self.get_cache_stats()
+        if include_recent:
+            with self.get_session() as session:
+                stats["recent_results"] = session.query(RecentResult).count()
+        self.flush_writes()
+        self.cache_access.drain()
+        tables = [
+            t
+            for t in Base.metadata.sorted_tables
+            if t.schema == CACHE_SCHEMA and (include_recent or t.name != RecentResult.__tablename__)
+        ]
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for table in reversed(tables):
+                table.drop(conn)
+            Base.metadata.create_all(conn, tables=tables)
+            conn.execute(text(f"VACUUM {CACHE_SCHEMA}"))
+            conn.execute(text(f"PRAGMA {CACHE_SCHEMA}.wal_checkpoint(TRUNCATE)"))
+        names = ["translations", "figures", "contents"] + (["recent_results"] if include_recent else [])
+        return {name: stats[name] for name in names}
+
     def clear_all_summaries(self) -> int:
         with self.get_session() as session:
-            papers = session.query(Paper).filter(Paper.summarized == True).all()
-            count = len(papers)
-            for paper in papers:
-                paper.summarized = False
-                paper.summary = None
+            count = (
+                session.query(Paper)
+                .filter(Paper.summarized == True)
+                .update({Paper.summarized: False, Paper.summary: None}, synchronize_session=False)
+            )
             session.commit()
+            self.paper_index.set_summarized(None, False)
             return count
 
     def get_cache_stats(self) -> dict:
@@ -261,30 +1024,59 @@ class Database:
             return default
 
     def set_config(self, key: str, value: str, description: str | None = None) -> None:
-        from arxiv_pulse.models import SystemConfig
+        self.set_configs({key: value}, {key: description} if description else None)
+
+    def set_configs(self, values: dict[str, str], descriptions: dict[str, str] | None = None) -> None:
+        """在一个事务内写入多项配置，并把配置版本号加一（Config 据此重新加载快照）"""
+        from arxiv_pulse.core.config import Config
+        from arxiv_pulse.models import CONFIG_VERSION_KEY, SystemConfig
 
+        descriptions = descriptions or {}
         with self.get_session() as session:
-            config = session.query(SystemConfig).filter_by(key=key).first()
-            if config:
-                config.value = value
-                if description:
-                    config.description = description
-            else:
-                config = SystemConfig(key=key, value=value, description=description)
-                session.add(config)
+            existing = {c.key: c for c in session.query(SystemConfig).filter(SystemConfig.key.in_(list(values)))}
+            for key, value in values.items():
+                config = existing.get(key)
+                if config:
+                    config.value = value
+                    if descriptions.get(key):
+                        config.description = descriptions[key]
+                else:
+                    session.add(SystemConfig(key=key, value=value, description=descriptions.get(key)))
+            now = utcnow()
+            bump = sqlite_insert(SystemConfig.__table__).values(
+                key=CONFIG_VERSION_KEY, value="1", created_at=now, updated_at=now
+            )
+            session.execute(
+                bump.on_conflict_do_update(
+                    index_elements=["key"],
+                    set_={"value": cast(cast(SystemConfig.value, Integer) + 1, Text), "updated_at": now},
+                )
+            )
             session.commit()
+        Config.invalidate()
 
-    def get_all_config(self) -> dict[str, str]:
-        from arxiv_pulse.models import SystemConfig
+    def get_config_version(self) -> int:
+        """配置版本号（从未修改过配置时为 0）"""
+        from arxiv_pulse.models import CONFIG_VERSION_KEY
+
+        return int(self.get_config(CONFIG_VERSION_KEY) or 0)
+
+    def get_config_snapshot(self) -> tuple[int, dict[str, str]]:
+        """一次读出 (配置版本号, 全部配置)"""
+        from arxiv_pulse.models import CONFIG_VERSION_KEY, SystemConfig
 
         with self.get_session() as session:
-            configs = session.query(SystemConfig).all()
-            return {c.key: c.value for c in configs}
+            values = {key: value for key, value in session.query(SystemConfig.key, SystemConfig.value)}
+        return int(values.pop(CONFIG_VERSION_KEY, None) or 0), values
+
+    def get_all_config(self) -> dict[str, str]:
+        return self.get_config_snapshot()[1]
 
     def init_default_config(self) -> None:
-        for key, value in DEFAULT_CONFIG.items():
-            if self.get_config(key) is None:
-                self.set_config(key, value)
+        _, config = self.get_config_snapshot()
+        missing = {key: value for key, value in DEFAULT_CONFIG.items() if config.get(key) is None}
+        if missing:
+            self.set_configs(missing)
 
     def is_initialized(self) -> bool:
         return self.get_config("is_initialized") == "true"
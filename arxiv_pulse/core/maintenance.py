@@ -0,0 +1,391 @@
+"""
+后台数据库维护
+
+服务运行期间按各自的间隔执行维护任务：缓存淘汰（空闲过期 + 行数/字节上限，按最近访问时间 LRU）、
+WAL 超过阈值时 checkpoint、增量 vacuum 归还空闲页、PRAGMA optimize / ANALYZE 刷新统计信息，
+按保留期归档旧论文，以及核对内存论文索引是否落后于数据库。
+每次运行生成一份 MaintenanceReport，记录各任务回收了什么。
+
+缓存行的 accessed_at 不在每次读取时更新：读取方调用 Database.touch_cache() 记下命中的键，
+由 CacheAccessLog 攒够一批（或维护任务开始前）再经写线程一次性更新。
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Connection, text
+
+from arxiv_pulse.models import (
+    ARCHIVE_SCHEMA,
+    CACHE_SCHEMA,
+    FigureCache,
+    PaperContentCache,
+    TranslationCache,
+    utcnow,
+)
+from arxiv_pulse.utils import output
+
+if TYPE_CHECKING:
+    from arxiv_pulse.core.database import Database
+
+MAINTENANCE_STARTUP_DELAY = 60  # 秒：服务启动后首次维护前的等待，避免拖慢启动
+MAINTENANCE_TICK = 60  # 秒：调度器检查到期任务的间隔
+WAL_CHECKPOINT_THRESHOLD = 64 * 1024 * 1024  # WAL 文件超过此大小时执行 TRUNCATE checkpoint
+INCREMENTAL_VACUUM_MIN_PAGES = 1024  # 空闲页少于此数时不做增量 vacuum
+ACCESS_FLUSH_THRESHOLD = 512  # 攒够这么多待更新的访问记录就提交一次
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """一类缓存的淘汰策略；key 为记录访问时使用的列，size_sql 为单行占用字节数的 SQL 表达式"""
+
+    name: str
+    model: Any  # ORM 模型类（declarative_base 生成的类在类型检查时是 Any）
+    key: str
+    size_sql: str
+    max_rows: int | None = None
+    max_bytes: int | None = None
+    max_idle_days: int | None = None
+
+    @property
+    def table(self) -> str:
+        """带 schema 的表名（缓存表在 cache.db 中）"""
+        return str(self.model.__table__.fullname)
+
+
+CACHE_POLICIES: dict[str, CachePolicy] = {
+    policy.name: policy
+    for policy in (
+        CachePolicy(
+            "translations",
+            TranslationCache,
+            key="source_text_hash",
+            size_sql="length(source_text) + length(translated_text)",
+            max_rows=200_000,
+            max_idle_days=180,
+        ),
+        CachePolicy(
+            "figures",
+            FigureCache,
+            key="arxiv_id",
+            size_sql="length(figure_url)",
+            max_rows=50_000,
+            max_idle_days=180,
+        ),
+        CachePolicy(
+            "contents",
+            PaperContentCache,
+            key="arxiv_id",
+            size_sql="coalesce(length(full_text_z), 0) + coalesce(length(full_text), 0)",
+            max_bytes=512 * 1024 * 1024,
+            max_idle_days=90,
+        ),
+    )
+}
+
+
+class CacheAccessLog:
+    """缓存命中记录：{缓存名: 键集合}，批量更新到各缓存表的 accessed_at"""
+
+    def __init__(self, flush_threshold: int = ACCESS_FLUSH_THRESHOLD):
+        self.flush_threshold = flush_threshold
+        self._pending: dict[str, set[str]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def touch(self, cache: str, keys) -> bool:
+        """记录命中，返回是否已攒够一批需要提交"""
+        with self._lock:
+            pending = self._pending.setdefault(cache, set())
+            before = len(pending)
+            pending.update(k for k in keys if k)
+            self._count += len(pending) - before
+            return self._count >= self.flush_threshold
+
+    def drain(self) -> dict[str, set[str]]:
+        with self._lock:
+            pending, self._pending, self._count = self._pending, {}, 0
+            return pending
+
+    def flush_op(self):
+        """取出当前记录，返回更新 accessed_at 的写操作（没有记录时返回 None）"""
+        pending = self.drain()
+        if not pending:
+            return None
+
+        def apply(session):
+            now = utcnow()
+            for cache, keys in pending.items():
+                policy = CACHE_POLICIES[cache]
+                column = getattr(policy.model, policy.key)
+                keys = list(keys)
+                for start in range(0, len(keys), 500):
+                    session.query(policy.model).filter(column.in_(keys[start : start + 500])).update(
+                        {policy.model.accessed_at: now}, synchronize_session=False
+                    )
+
+        return apply
+
+
+def _cache_usage(session, policy: CachePolicy) -> tuple[int, int]:
+    rows, size = session.execute(
+        text(f"SELECT count(*), coalesce(sum({policy.size_sql}), 0) FROM {policy.table}")
+    ).one()
+    return rows, size
+
+
+def evict_cache(db: "Database", policy: CachePolicy) -> dict[str, int]:
+    """按策略淘汰一类缓存：先删空闲过期的行，再按 accessed_at 从旧到新删到行数/字节上限以内"""
+
+    def apply(session):
+        rows_before, bytes_before = _cache_usage(session, policy)
+        table = policy.table
+        if policy.max_idle_days:
+            session.execute(
+                text(f"DELETE FROM {table} WHERE accessed_at < :cutoff"),
+                {"cutoff": utcnow() - timedelta(days=policy.max_idle_days)},
+            )
+        if policy.max_rows is not None:
+            session.execute(
+                text(
+                    f"DELETE FROM {table} WHERE id IN ("
+                    f"SELECT id FROM {table} ORDER BY accessed_at DESC, id DESC LIMIT -1 OFFSET :max_rows)"
+                ),
+                {"max_rows": policy.max_rows},
+            )
+        if policy.max_bytes is not None:
+            session.execute(
+                text(
+                    f"DELETE FROM {table} WHERE id IN (SELECT id FROM ("
+                    f"SELECT id, sum({policy.size_sql}) OVER (ORDER BY accessed_at DESC, id DESC) AS total "
+                    f"FROM {table}) WHERE total > :max_bytes)"
+                ),
+                {"max_bytes": policy.max_bytes},
+            )
+        rows_after, bytes_after = _cache_usage(session, policy)
+        return {"rows": rows_before - rows_after, "bytes": bytes_before - bytes_after, "remaining_rows": rows_after}
+
+    result: dict[str, int] = db.write(apply)
+    return result
+
+
+def evict_caches(db: "Database") -> dict[str, Any]:
+    """先提交积攒的访问记录，再逐个缓存淘汰"""
+    db.flush_cache_access()
+    return {name: evict_cache(db, policy) for name, policy in CACHE_POLICIES.items()}
+
+
+def _database_files(conn) -> dict[str, str]:
+    """主库与各附加库：schema -> 文件路径（内存库没有文件，不在其中）"""
+    if conn.dialect.name != "sqlite":
+        return {}
+    return {name: path for _, name, path in conn.execute(text("PRAGMA database_list")) if path}
+
+
+def _connect(db: "Database", autocommit: bool = False) -> Connection:
+    """维护任务使用的独立连接（不经过写线程）；autocommit 用于不能在事务中执行的 PRAGMA / ANALYZE"""
+    conn = db.engine.connect()
+    return conn.execution_options(isolation_level="AUTOCOMMIT") if autocommit else conn
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def checkpoint_wal(db: "Database", threshold: int = WAL_CHECKPOINT_THRESHOLD) -> dict[str, Any]:
+    """主库和附加库中 WAL 文件超过阈值的，做 TRUNCATE checkpoint 把 WAL 截断为 0"""
+    results: dict[str, Any] = {}
+    with _connect(db) as conn:
+        for schema, path in _database_files(conn).items():
+            wal_before = _file_size(f"{path}-wal")
+            if wal_before < threshold:
+                results[schema] = {"wal_bytes": wal_before, "checkpointed": False}
+                continue
+            busy, _, _ = conn.execute(text(f"PRAGMA {schema}.wal_checkpoint(TRUNCATE)")).one()
+            wal_after = _file_size(f"{path}-wal")
+            results[schema] = {
+                "wal_bytes": wal_after,
+                "checkpointed": not busy,
+                "reclaimed_bytes": wal_before - wal_after,
+            }
+    return results
+
+
+def incremental_vacuum(
+    db: "Database",
+    min_pages: int = INCREMENTAL_VACUUM_MIN_PAGES,
+    schemas: tuple[str, ...] = ("main", ARCHIVE_SCHEMA),
+) -> dict[str, Any]:
+    """auto_vacuum=INCREMENTAL 的库把空闲页归还给文件系统"""
+    results: dict[str, Any] = {}
+    with _connect(db, autocommit=True) as conn:
+        files = _database_files(conn)
+        for schema in schemas:
+            if schema not in files:
+                continue
+            if conn.execute(text(f"PRAGMA {schema}.auto_vacuum")).scalar() != 2:
+                results[schema] = {"enabled": False}
+                continue
+            page_size = conn.execute(text(f"PRAGMA {schema}.page_size")).scalar_one()
+            free_before = conn.execute(text(f"PRAGMA {schema}.freelist_count")).scalar_one()
+            if free_before < min_pages:
+                results[schema] = {"free_pages": free_before, "reclaimed_bytes": 0}
+                continue
+            # sqlite3 的 execute() 对该语句只执行一步（只释放一页），executescript 才会执行到底
+            sqlite_conn = conn.connection.driver_connection
+            assert sqlite_conn is not None
+            sqlite_conn.executescript(f"PRAGMA {schema}.incremental_vacuum;")
+            free_after = conn.execute(text(f"PRAGMA {schema}.freelist_count")).scalar_one()
+            results[schema] = {"free_pages": free_after, "reclaimed_bytes": (free_before - free_after) * page_size}
+    return results
+
+
+def vacuum_cache(db: "Database") -> dict[str, Any]:
+    """缓存库单独、更频繁地回收空闲页（缓存淘汰和覆盖写入产生的空闲页最多）"""
+    return incremental_vacuum(db, min_pages=INCREMENTAL_VACUUM_MIN_PAGES // 4, schemas=(CACHE_SCHEMA,))
+
+
+def optimize(db: "Database") -> dict[str, Any]:
+    """PRAGMA optimize：只重新分析统计信息可能已过时的表，开销很小"""
+    with _connect(db, autocommit=True) as conn:
+        conn.execute(text("PRAGMA optimize"))
+    return {"optimized": True}
+
+
+def analyze(db: "Database") -> dict[str, Any]:
+    """完整 ANALYZE，重建全部表和索引的统计信息"""
+    started = time.monotonic()
+    with _connect(db, autocommit=True) as conn:
+        conn.execute(text("ANALYZE"))
+    return {"seconds": round(time.monotonic() - started, 3)}
+
+
+def archive_papers(db: "Database") -> dict[str, Any]:
+    from arxiv_pulse.core.config import Config
+
+    return {"archived": db.archive_old_papers(Config.ARCHIVE_HORIZON_DAYS)}
+
+
+def refresh_paper_index(db: "Database") -> dict[str, Any]:
+    """其他进程（命令行同步等）写入的论文不会经过本进程的增量更新，发现不一致时重建内存索引"""
+    return db.refresh_paper_index()
+
+
+@dataclass(frozen=True)
+class MaintenanceJob:
+    name: str
+    interval: float  # 秒
+    run: Callable[["Database"], dict[str, Any]]
+
+
+# 按顺序执行：先淘汰缓存和归档，再 vacuum 回收它们释放的页
+MAINTENANCE_JOBS: tuple[MaintenanceJob, ...] = (
+    MaintenanceJob("evict_caches", 3600, evict_caches),
+    MaintenanceJob("archive_papers", 86400, archive_papers),
+    MaintenanceJob("incremental_vacuum", 3600, incremental_vacuum),
+    MaintenanceJob("vacuum_cache", 900, vacuum_cache),
+    MaintenanceJob("checkpoint_wal", 300, checkpoint_wal),
+    MaintenanceJob("optimize", 3600, optimize),
+    MaintenanceJob("analyze", 86400, analyze),
+    MaintenanceJob("refresh_paper_index", 300, refresh_paper_index),
+)
+
+
+def _reclaimed_bytes(result: dict[str, Any]) -> int:
+    """累加任务结果（含按缓存、按 schema 嵌套的结果）中的 bytes / reclaimed_bytes"""
+    total: int = result.get("bytes", 0) + result.get("reclaimed_bytes", 0)
+    return total + sum(_reclaimed_bytes(value) for value in result.values() if isinstance(value, dict))
+
+
+@dataclass
+class MaintenanceReport:
+    started_at: str
+    seconds: float = 0.0
+    results: dict[str, dict[str, Any]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        return sum(_reclaimed_bytes(result) for result in self.results.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "seconds": self.seconds,
+            "reclaimed_bytes": self.reclaimed_bytes,
+            "results": self.results,
+            "errors": self.errors,
+        }
+
+
+def run_maintenance(db: "Database", jobs: list[str] | None = None) -> MaintenanceReport:
+    """执行指定的维护任务（默认全部），单个任务失败不影响其余任务"""
+    report = MaintenanceReport(started_at=utcnow().isoformat())
+    started = time.monotonic()
+    for job in MAINTENANCE_JOBS:
+        if jobs is not None and job.name not in jobs:
+            continue
+        try:
+            report.results[job.name] = job.run(db)
+        except Exception as e:
+            report.errors[job.name] = str(e)
+            output.warn(f"维护任务 {job.name} 失败: {e}")
+    report.seconds = round(time.monotonic() - started, 3)
+    if report.reclaimed_bytes:
+        output.info(f"数据库维护: 回收 {report.reclaimed_bytes / 1024 / 1024:.1f} MB（{', '.join(report.results)}）")
+    return report
+
+
+class MaintenanceScheduler:
+    """在事件循环中定时执行到期的维护任务（任务本身在线程池中运行）"""
+
+    def __init__(self, db: "Database", jobs: tuple[MaintenanceJob, ...] = MAINTENANCE_JOBS):
+        self.db = db
+        self.jobs = jobs
+        self.last_run: dict[str, float] = {}  # 任务名 -> 上次执行的 Unix 时间戳
+        self.reports: list[MaintenanceReport] = []
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def due_jobs(self, now: float) -> list[str]:
+        return [job.name for job in self.jobs if now - self.last_run.get(job.name, 0.0) >= job.interval]
+
+    async def run(self, jobs: list[str] | None = None) -> MaintenanceReport:
+        """立即执行指定任务（默认全部）并记录报告"""
+        async with self._lock:
+            now = time.time()
+            report = await asyncio.to_thread(run_maintenance, self.db, jobs)
+            for name in [*report.results, *report.errors]:
+                self.last_run[name] = now
+            self.reports = [*self.reports[-19:], report]
+            return report
+
+    async def _loop(self) -> None:
+        await asyncio.sleep(MAINTENANCE_STARTUP_DELAY)
+        while True:
+            due = self.due_jobs(time.time())
+            if due:
+                await self.run(due)
+            await asyncio.sleep(MAINTENANCE_TICK)
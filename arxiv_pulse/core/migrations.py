@@ -0,0 +1,225 @@
+"""
+数据库 schema 迁移
+
+create_all 只会建新表，不会修改已有数据库。这里按版本号顺序执行迁移，
+已执行的版本记录在 schema_migrations 表中；并提供 EXPLAIN QUERY PLAN 检查，
+确认热点查询都命中索引而不是全表扫描。
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from arxiv_pulse.models import (
+    CACHE_SCHEMA,
+    PAPERS_FTS_DROP,
+    STATS_REBUILD_SQL,
+    STATS_TRIGGERS_DDL,
+    compress_text,
+    utcnow,
+)
+from arxiv_pulse.utils import output
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    statements: tuple[str, ...] = ()
+    apply: Callable[[Connection], None] | None = None
+    vacuum: bool = False  # 迁移后执行 VACUUM 回收空间（不能在事务内执行）
+
+
+class QueryPlanError(RuntimeError):
+    """热点查询的执行计划退化为全表扫描"""
+
+
+def table_exists(conn: Connection, table: str, schema: str = "main") -> bool:
+    return (
+        conn.execute(
+            text(f"SELECT 1 FROM {schema}.sqlite_master WHERE type = 'table' AND name = :name"), {"name": table}
+        ).first()
+        is not None
+    )
+
+
+def add_column(conn: Connection, table: str, column: str, ddl_type: str) -> None:
+    """列不存在时 ALTER TABLE ADD COLUMN（新库由 create_all 建表时已包含该列）"""
+    columns = {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+    if column not in columns:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
+
+
+def compress_paper_content(conn: Connection, batch_size: int = 200) -> None:
+    """把 paper_content_cache.full_text 的未压缩正文转存为 zlib 压缩的 full_text_z"""
+    if not table_exists(conn, "paper_content_cache"):  # 新库的缓存表建在 cache.db 中，已是压缩格式
+        return
+    add_column(conn, "paper_content_cache", "full_text_z", "BLOB")
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            text(
+                "SELECT id, full_text FROM paper_content_cache "
+                "WHERE full_text IS NOT NULL AND id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": batch_size},
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            text("UPDATE paper_content_cache SET full_text_z = :blob, full_text = NULL WHERE id = :id"),
+            [{"id": row_id, "blob": compress_text(full_text)} for row_id, full_text in rows],
+        )
+        last_id = rows[-1][0]
+
+
+CACHE_TABLES = ("translation_cache", "figure_cache", "paper_content_cache")
+
+
+def add_cache_accessed_at(conn: Connection) -> None:
+    """缓存表增加 accessed_at（以写入时间作为初始值）及其索引，供 LRU 淘汰使用"""
+    for table in CACHE_TABLES:
+        if not table_exists(conn, table):
+            continue
+        add_column(conn, table, "accessed_at", "DATETIME")
+        timestamp = "coalesce(updated_at, created_at)" if table != "paper_content_cache" else "created_at"
+        conn.execute(text(f"UPDATE {table} SET accessed_at = coalesce({timestamp}, CURRENT_TIMESTAMP)"))
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_accessed_at ON {table} (accessed_at)"))
+
+
+def move_caches_to_cache_db(conn: Connection) -> None:
+    """把主库中的缓存表数据复制到 cache.db（表已由 create_all 建好）后删除主库中的表"""
+    for table in (*CACHE_TABLES, "recent_results"):
+        if not table_exists(conn, table):
+            continue
+        source = {row[1] for row in conn.execute(text(f"PRAGMA main.table_info({table})"))}
+        target = [row[1] for row in conn.execute(text(f"PRAGMA {CACHE_SCHEMA}.table_info({table})"))]
+        columns = ", ".join(c for c in target if c in source)
+        conn.execute(
+            text(f"INSERT OR IGNORE INTO {CACHE_SCHEMA}.{table} ({columns}) SELECT {columns} FROM main.{table}")
+        )
+        conn.execute(text(f"DROP TABLE main.{table}"))
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(
+        1,
+        "hot query indexes",
+        (
+            "CREATE INDEX IF NOT EXISTS ix_papers_published ON papers (published)",
+            "CREATE INDEX IF NOT EXISTS ix_papers_summarized_published ON papers (summarized, published)",
+            "CREATE INDEX IF NOT EXISTS ix_papers_search_query_published ON papers (search_query, published)",
+            "CREATE INDEX IF NOT EXISTS ix_papers_created_at ON papers (created_at)",
+            "CREATE INDEX IF NOT EXISTS ix_sync_tasks_status_completed_at ON sync_tasks (status, completed_at)",
+            "CREATE INDEX IF NOT EXISTS ix_sync_tasks_status_created_at ON sync_tasks (status, created_at)",
+        ),
+    ),
+    Migration(2, "statistics rollup triggers", (*STATS_TRIGGERS_DDL, *STATS_REBUILD_SQL)),
+    Migration(3, "compress paper full text", apply=compress_paper_content, vacuum=True),
+    # auto_vacuum 模式只有在 VACUUM 时才会切换，之后维护任务可以用 incremental_vacuum 归还空闲页
+    Migration(
+        4,
+        "cache access times, incremental auto-vacuum",
+        ("PRAGMA auto_vacuum = INCREMENTAL",),
+        apply=add_cache_accessed_at,
+        vacuum=True,
+    ),
+    Migration(5, "move derived caches to cache.db", apply=move_caches_to_cache_db, vacuum=True),
+    # 旧的全文索引直接索引 authors JSON；删掉后启动时由 ensure_fulltext_index 按新定义（只索引作者名）重建
+    Migration(6, "full-text index on author names", PAPERS_FTS_DROP),
+]
+
+# 热点查询：名称 -> SQL（参数用常量代替，只用于 EXPLAIN QUERY PLAN）
+HOT_QUERIES: dict[str, str] = {
+    "papers.list_by_published": "SELECT id FROM papers ORDER BY published DESC LIMIT 20",
+    "papers.keyset_page": (
+        "SELECT id FROM papers WHERE (published, id) < ('2000-01-01 00:00:00.000000', 1) "
+        "ORDER BY published DESC, id DESC LIMIT 21"
+    ),
+    "papers.recent": "SELECT id FROM papers WHERE published >= '2000-01-01' ORDER BY published DESC LIMIT 20",
+    "papers.to_summarize": (
+        "SELECT id FROM papers WHERE summarized = 0 AND abstract IS NOT NULL ORDER BY published DESC LIMIT 20"
+    ),
+    "papers.latest_for_query": "SELECT published FROM papers WHERE search_query = 'q' ORDER BY published DESC LIMIT 1",
+    "papers.earliest_created": "SELECT id FROM papers ORDER BY created_at ASC LIMIT 1",
+    "sync_tasks.last_completed": (
+        "SELECT id FROM sync_tasks WHERE status IN ('completed', 'failed') ORDER BY completed_at DESC LIMIT 1"
+    ),
+    "sync_tasks.running": (
+        "SELECT id FROM sync_tasks WHERE status IN ('pending', 'running') ORDER BY created_at DESC LIMIT 1"
+    ),
+    "paper_categories.by_category": "SELECT paper_id FROM paper_categories WHERE category = 'cs.LG'",
+    "paper_authors.by_author": "SELECT paper_id FROM paper_authors WHERE author_id = 1",
+}
+
+SCHEMA_MIGRATIONS_DDL = (
+    "CREATE TABLE IF NOT EXISTS schema_migrations ("
+    "version INTEGER PRIMARY KEY, description VARCHAR(200) NOT NULL, applied_at DATETIME NOT NULL)"
+)
+
+
+def get_schema_version(conn: Connection) -> int:
+    """当前 schema 版本（未迁移过为 0）"""
+    conn.execute(text(SCHEMA_MIGRATIONS_DDL))
+    version: int = conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")).scalar_one()
+    return version
+
+
+def run_migrations(engine: Engine) -> int:
+    """执行所有未应用的迁移，每个迁移一个事务，返回迁移后的版本号"""
+    if engine.dialect.name != "sqlite":
+        return 0
+
+    with engine.begin() as conn:
+        current = get_schema_version(conn)
+
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+        with engine.begin() as conn:
+            for statement in migration.statements:
+                conn.execute(text(statement))
+            if migration.apply:
+                migration.apply(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, description, applied_at) VALUES (:v, :d, :t)"),
+                {"v": migration.version, "d": migration.description, "t": utcnow()},
+            )
+        current = migration.version
+        output.info(f"数据库迁移 v{migration.version}: {migration.description}")
+        if migration.vacuum:
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(text("VACUUM"))
+                conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+
+    return current
+
+
+def full_scans(plan_details: list[str]) -> list[str]:
+    """从 EXPLAIN QUERY PLAN 的 detail 中挑出全表扫描（SCAN 表 且未使用索引）"""
+    return [
+        detail
+        for detail in plan_details
+        if detail.startswith("SCAN ") and " USING " not in detail and not detail.startswith("SCAN CONSTANT")
+    ]
+
+
+def explain_query_plans(engine: Engine) -> dict[str, list[str]]:
+    """返回每个热点查询的 EXPLAIN QUERY PLAN detail 列表"""
+    plans = {}
+    with engine.connect() as conn:
+        for name, sql in HOT_QUERIES.items():
+            plans[name] = [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+    return plans
+
+
+def verify_query_plans(engine: Engine) -> None:
+    """检查热点查询的执行计划，有全表扫描时抛出 QueryPlanError"""
+    if engine.dialect.name != "sqlite":
+        return
+    problems = {name: scans for name, details in explain_query_plans(engine).items() if (scans := full_scans(details))}
+    if problems:
+        lines = [f"{name}: {'; '.join(scans)}" for name, scans in problems.items()]
+        raise QueryPlanError("热点查询存在全表扫描:\n" + "\n".join(lines))
@@ -0,0 +1,308 @@
+"""
+内存列式论文索引
+
+最近论文、论文列表和最近论文缓存刷新都是"发表时间窗口 + 分类过滤 + 按 (published, id) 倒序取一页"，
+在 SQLite 里要先做分类子查询再排序，大库上每次请求都要扫过窗口内的所有行。这里把热库论文的
+id、发表时间（微秒时间戳）、分类位图和 summarized 标记保存为 numpy 数组：过滤是向量化的掩码运算，
+取一页用 argpartition 找出前 k 行再排序，SQLite 只用来按 id 取回最终这一页的数据。
+
+索引在服务启动时后台构建（构建完成前接口照常走 SQL），之后由 Database 的写入方法增量更新
+（入库、归档、总结标记）；其他进程（如命令行同步）写入的论文由维护任务定期核对后重建。
+"""
+
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine, Result, Row
+
+from arxiv_pulse.constants import CategoryTrie
+from arxiv_pulse.models import Paper, PaperCategory
+
+INDEX_CHUNK_SIZE = 50_000  # 构建索引时每次从数据库读取的行数
+COMPACT_RATIO = 0.25  # 已删除行超过这个比例时压缩数组
+
+_NULL_TIME = np.iinfo(np.int64).min  # published 为空：比任何时间都早，与 SQLite 中 NULL 排在最后一致
+
+
+def to_epoch_us(value: datetime | None) -> int:
+    """datetime（naive UTC）-> 微秒时间戳"""
+    if value is None:
+        return _NULL_TIME
+    return int(np.datetime64(value, "us").astype(np.int64))
+
+
+class PaperIndex:
+    """热库论文的列式索引，线程安全；ids 保持升序，便于按 id 二分定位"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._building = False
+        self._pending: list[tuple[str, tuple]] = []  # 构建期间到达的增量更新，构建完成后重放
+        self.ready = False
+        self._reset()
+
+    def _reset(self, capacity: int = 1024) -> None:
+        self._size = 0
+        self._dead = 0
+        self._ids = np.zeros(capacity, np.int64)
+        self._published = np.zeros(capacity, np.int64)
+        self._summarized = np.zeros(capacity, bool)
+        self._alive = np.zeros(capacity, bool)
+        self._bits = np.zeros((capacity, 1), np.uint64)  # 每行的分类位图，每 64 个分类一列
+        self._category_bits: dict[str, int] = {}  # 分类 -> 位号
+        self._category_trie = CategoryTrie()  # 索引中出现过的分类，用于展开 `cond-mat` / `cond-mat.*`
+
+    def __len__(self) -> int:
+        return self._size - self._dead
+
+    @property
+    def max_id(self) -> int:
+        alive = np.flatnonzero(self._alive[: self._size])
+        return int(self._ids[alive[-1]]) if len(alive) else 0
+
+    # ---- 构建 ----
+
+    def build(self, engine: Engine, chunk_size: int = INDEX_CHUNK_SIZE) -> int:
+        """从数据库全量构建索引，返回索引的论文数；构建期间的查询仍使用旧索引（或走 SQL）"""
+        with self._lock:
+            self._building = True
+            self._pending = []
+        try:
+            fresh = PaperIndex()
+            with engine.connect() as conn, conn.begin():
+                result: Result = conn.execution_options(yield_per=chunk_size).execute(
+                    select(Paper.id, Paper.published, Paper.summarized).order_by(Paper.id)
+                )
+                for rows in result.partitions():
+                    ids, published, summarized = zip(*rows, strict=True)
+                    fresh._append(
+                        np.array(ids, np.int64),
+                        np.array(published, "datetime64[us]").astype(np.int64),
+                        np.array(summarized, bool),
+                    )
+                result = conn.execution_options(yield_per=chunk_size).execute(
+                    select(PaperCategory.paper_id, PaperCategory.category)
+                )
+                for rows in result.partitions():
+                    paper_ids, categories = zip(*rows, strict=True)
+                    fresh._set_categories(np.array(paper_ids, np.int64), categories)
+        except BaseException:
+            with self._lock:
+                self._building = False
+                self._pending = []
+            raise
+
+        with self._lock:
+            self._size, self._dead = fresh._size, fresh._dead
+            self._ids, self._published, self._summarized = fresh._ids, fresh._published, fresh._summarized
+            self._alive, self._bits, self._category_bits = fresh._alive, fresh._bits, fresh._category_bits
+            self._category_trie = fresh._category_trie
+            pending, self._pending, self._building = self._pending, [], False
+            self.ready = True
+            for method, args in pending:
+                getattr(self, method)(*args)
+            return len(self)
+
+    def _grow(self, size: int) -> None:
+        capacity = len(self._ids)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        for name in ("_ids", "_published", "_summarized", "_alive"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, array.dtype)
+            grown[: self._size] = array[: self._size]
+            setattr(self, name, grown)
+        bits = np.zeros((capacity, self._bits.shape[1]), np.uint64)
+        bits[: self._size] = self._bits[: self._size]
+        self._bits = bits
+
+    def _append(self, ids: np.ndarray, published: np.ndarray, summarized: np.ndarray) -> None:
+        start, end = self._size, self._size + len(ids)
+        self._grow(end)
+        self._ids[start:end] = ids
+        self._published[start:end] = published
+        self._summarized[start:end] = summarized
+        self._alive[start:end] = True
+        self._bits[start:end] = 0
+        self._size = end
+
+    def _bit_for(self, category: str) -> int:
+        bit = self._category_bits.get(category)
+        if bit is None:
+            bit = self._category_bits[category] = len(self._category_bits)
+            self._category_trie.insert(category)
+            if bit // 64 >= self._bits.shape[1]:
+                self._bits = np.hstack([self._bits, np.zeros((len(self._bits), 1), np.uint64)])
+        return bit
+
+    def _positions(self, ids: np.ndarray) -> np.ndarray:
+        """id -> 数组下标，不在索引中（或已删除）的为 -1"""
+        if not self._size:
+            return np.full(len(ids), -1, np.int64)
+        ids_view = self._ids[: self._size]
+        positions = np.searchsorted(ids_view, ids)
+        positions[positions >= self._size] = 0
+        found = (ids_view[positions] == ids) & self._alive[positions]
+        return np.where(found, positions, -1)
+
+    def _set_categories(self, paper_ids: np.ndarray, categories: Iterable[str]) -> None:
+        bits = np.array([self._bit_for(category) for category in categories], np.int64)
+        positions = self._positions(paper_ids)
+        keep = positions >= 0
+        positions, bits = positions[keep], bits[keep]
+        for word in np.unique(bits // 64):
+            in_word = bits // 64 == word
+            values = np.left_shift(np.uint64(1), (bits[in_word] % 64).astype(np.uint64))
+            np.bitwise_or.at(self._bits[:, word], positions[in_word], values)
+
+    # ---- 增量更新 ----
+
+    def _defer(self, method: str, *args) -> bool:
+        """是否暂不应用这次更新：正在构建时记下更新，构建完成后重放；从未构建过的索引忽略更新"""
+        if self._building:
+            self._pending.append((method, args))
+            return True
+        return not self.ready
+
+    def add(self, papers: Iterable[Paper]) -> None:
+        """新入库的论文（需已有 id）"""
+        papers = [paper for paper in papers if paper.id is not None]
+        if not papers:
+            return
+        with self._lock:
+            if self._defer("add", papers):
+                return
+            papers.sort(key=lambda paper: paper.id)
+            ids = np.array([paper.id for paper in papers], np.int64)
+            self.remove(ids[self._positions(ids) >= 0].tolist())
+            published = np.array([to_epoch_us(paper.published) for paper in papers], np.int64)
+            summarized = np.array([bool(paper.summarized) for paper in papers], bool)
+            if self._size and ids[0] <= self._ids[self._size - 1]:
+                # 新 id 一般递增；否则去掉已删除行、追加后整体按 id 重排
+                self._compact()
+                self._append(ids, published, summarized)
+                self._sort_by_id()
+            else:
+                self._append(ids, published, summarized)
+            rows = [
+                (row["paper_id"], row["category"])
+                for paper in papers
+                for row in PaperCategory.rows_for(paper.id, paper.categories, paper.primary_category)
+            ]
+            if rows:
+                paper_ids, categories = zip(*rows, strict=True)
+                self._set_categories(np.array(paper_ids, np.int64), categories)
+
+    def remove(self, paper_ids: list[int]) -> None:
+        """从热库删除（归档）的论文"""
+        if not paper_ids:
+            return
+        with self._lock:
+            if self._defer("remove", paper_ids):
+                return
+            positions = self._positions(np.array(paper_ids, np.int64))
+            positions = positions[positions >= 0]
+            self._alive[positions] = False
+            self._dead += len(positions)
+            if self._dead > COMPACT_RATIO * self._size:
+                self._compact()
+
+    def set_summarized(self, paper_ids: list[int] | None, summarized: bool) -> None:
+        """更新 summarized 标记，paper_ids 为 None 表示全部论文"""
+        with self._lock:
+            if self._defer("set_summarized", paper_ids, summarized):
+                return
+            if paper_ids is None:
+                self._summarized[: self._size] = summarized
+                return
+            positions = self._positions(np.array(paper_ids, np.int64))
+            self._summarized[positions[positions >= 0]] = summarized
+
+    def _sort_by_id(self) -> None:
+        order = np.argsort(self._ids[: self._size], kind="stable")
+        for name in ("_ids", "_published", "_summarized", "_alive", "_bits"):
+            array = getattr(self, name)
+            array[: self._size] = array[: self._size][order]
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive[: self._size])
+        for name in ("_ids", "_published", "_summarized", "_alive", "_bits"):
+            array = getattr(self, name)
+            array[: len(keep)] = array[keep]
+        self._size, self._dead = len(keep), 0
+
+    # ---- 查询 ----
+
+    def _category_mask(self, categories: list[str]) -> np.ndarray:
+        """属于任一分类的行；与 PaperCategory.condition 一致，不带 "." 的分类（或 `x.*`）匹配整个大类"""
+        words = np.zeros(self._bits.shape[1], np.uint64)
+        for category in categories:
+            for name in self._category_trie.expand(category):
+                bit = self._category_bits[name]
+                words[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+        bits = self._bits[: self._size]
+        mask: np.ndarray = ((bits & words) != 0).any(axis=1)
+        return mask
+
+    def select(
+        self,
+        cutoff: datetime | None = None,
+        categories: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        after: tuple[datetime, int] | None = None,
+        before: tuple[datetime, int] | None = None,
+    ) -> tuple[list[int], int]:
+        """按 (published, id) 倒序取一页论文 id，与 keyset_query 的语义相同
+
+        after / before 为解码后的游标；多取一行用于判断 has_more，before 翻页时按正序返回
+        （由 keyset_page 翻转）。返回 (论文 id 列表, 不含游标条件时的匹配总数)。
+        """
+        with self._lock:
+            size = self._size
+            ids = self._ids[:size]
+            published = self._published[:size]
+            mask = self._alive[:size].copy()
+            if cutoff is not None:
+                mask &= published >= to_epoch_us(cutoff)
+            if categories:
+                mask &= self._category_mask(categories)
+            total = int(np.count_nonzero(mask))
+
+            cursor = after or before
+            if cursor:
+                value, row_id = to_epoch_us(cursor[0]), cursor[1]
+                if after:
+                    mask &= (published < value) | ((published == value) & (ids < row_id))
+                else:
+                    mask &= (published > value) | ((published == value) & (ids > row_id))
+
+            rows = np.flatnonzero(mask)
+            descending = before is None
+            k = offset + limit + 1
+            if len(rows) > k:
+                # argpartition 取出前 k 个发表时间，再补上与第 k 个时间相同的行，保证按 id 排序时不漏行
+                # 倒序时取反；published 为空（_NULL_TIME）取反会溢出，改为最大值排在最后
+                keys = (
+                    np.where(published[rows] == _NULL_TIME, np.iinfo(np.int64).max, -published[rows])
+                    if descending
+                    else published[rows]
+                )
+                kth = keys[np.argpartition(keys, k - 1)[k - 1]]
+                rows = rows[keys <= kth]
+            order = np.lexsort((ids[rows], published[rows]))
+            if descending:
+                order = order[::-1]
+            return ids[rows[order][offset:k]].tolist(), total
+
+
+def count_and_max_id(engine: Engine) -> tuple[int, int]:
+    """数据库中热库论文的 (篇数, 最大 id)，用于判断索引是否落后于数据库"""
+    with engine.connect() as conn:
+        row: Row = conn.execute(select(func.count(), func.coalesce(func.max(Paper.id), 0))).one()
+    count, max_id = row
+    return count, max_id
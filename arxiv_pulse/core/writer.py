@@ -0,0 +1,151 @@
+"""
+数据库写线程
+
+SQLite 同一时刻只允许一个写事务。爬虫入库、AI 总结、图片/翻译缓存、任务进度如果各自开事务，
+会在 busy_timeout 上互相排队，大批量同步时界面能卡住数秒。这里由一个后台线程按队列顺序执行
+进程内的写操作，并把排队中的多个写操作合并到同一个事务里提交。
+
+写操作是接收 Session 的函数，不要自行 commit:
+    writer.submit(op)            低优先级，立即返回 Future（缓存写入、任务进度等）
+    writer.write(op)             提交并等待落库，返回 op 的返回值（写后需要马上读回时使用）
+    writer.flush()               等待此前提交的所有写入落库
+"""
+
+import asyncio
+import atexit
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from arxiv_pulse.utils import output
+
+WriteOp = Callable[[Session], Any]
+
+WRITER_MAX_BATCH = 200  # 每个事务最多合并的写操作数
+WRITER_LINGER = 0.05  # 秒：队列里只有低优先级写入时，等待更多写入一起提交的最长时间
+
+
+class _Write:
+    __slots__ = ("op", "future", "urgent")
+
+    def __init__(self, op: WriteOp, urgent: bool):
+        self.op = op
+        self.future: Future = Future()
+        self.urgent = urgent
+
+
+class DatabaseWriter:
+    """单写线程，首次提交写操作时启动，进程退出前自动写完队列"""
+
+    def __init__(self, session_factory, max_batch: int = WRITER_MAX_BATCH, linger: float = WRITER_LINGER):
+        self._session_factory = session_factory
+        self.max_batch = max_batch
+        self.linger = linger
+        self._queue: queue.Queue[_Write | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+
+    def submit(self, op: WriteOp, urgent: bool = False) -> Future:
+        """排队一个写操作，返回在事务提交后完成的 Future"""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("写操作内部不能再向写线程提交写操作")
+        self.start()
+        write = _Write(op, urgent)
+        self._queue.put(write)
+        return write.future
+
+    def write(self, op: WriteOp, timeout: float | None = None) -> Any:
+        """提交并等待落库，返回 op 的返回值
+
+        调用方不要在持有未提交写事务的会话时调用，否则两边会互等 SQLite 写锁。
+        """
+        return self.submit(op, urgent=True).result(timeout)
+
+    async def write_async(self, op: WriteOp) -> Any:
+        return await asyncio.wrap_future(self.submit(op, urgent=True))
+
+    def flush(self, timeout: float | None = None) -> None:
+        """等待此前提交的所有写入落库（写线程未启动时直接返回）"""
+        if self.running:
+            self.write(lambda session: None, timeout)
+
+    async def flush_async(self) -> None:
+        if self.running:
+            await self.write_async(lambda session: None)
+
+    def stop(self, timeout: float | None = 10) -> None:
+        """写完队列中的写入后停止写线程"""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, stopping = self._collect(first)
+            self._commit(batch)
+            if stopping:
+                return
+
+    def _collect(self, first: _Write) -> tuple[list[_Write], bool]:
+        """从队列中再取出一批写入；有等待中的写入时只取已排队的，不再等待"""
+        batch = [first]
+        urgent = first.urgent
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.max_batch:
+            try:
+                if urgent:
+                    write = self._queue.get_nowait()
+                else:
+                    write = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if write is None:
+                return batch, True
+            batch.append(write)
+            urgent = urgent or write.urgent
+        return batch, False
+
+    def _commit(self, batch: list[_Write]) -> None:
+        try:
+            with self._session_factory() as session:
+                results = [write.op(session) for write in batch]
+                session.commit()
+        except Exception as e:
+            if len(batch) > 1:
+                # 合并的事务失败时逐个重试，只让出错的写操作失败
+                for write in batch:
+                    self._commit([write])
+                return
+            write = batch[0]
+            if not write.urgent:
+                output.warn(f"后台写入失败: {e}")
+            write.future.set_exception(e)
+            return
+
+        for write, result in zip(batch, results, strict=True):
+            write.future.set_result(result)
@@ -1,3 +1,5 @@
 from arxiv_pulse.crawler.arxiv import ArXivCrawler
+from arxiv_pulse.crawler.oai import OAIHarvester
+from arxiv_pulse.crawler.pipeline import SyncPipeline, TokenBucket, arxiv_rate_limiter
 
-__all__ = ["ArXivCrawler"]
+__all__ = ["ArXivCrawler", "OAIHarvester", "SyncPipeline", "TokenBucket", "arxiv_rate_limiter"]
@@ -1,24 +1,49 @@
 import logging
 import os
-import time
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import arxiv
-from tqdm import tqdm
 
+from arxiv_pulse.constants import get_category_query
 from arxiv_pulse.core import Config, Database
-from arxiv_pulse.models import Paper
+from arxiv_pulse.crawler.known_ids import KnownArxivIds
+from arxiv_pulse.crawler.oai import OAIHarvester
+from arxiv_pulse.crawler.pipeline import RateLimitedClient, SyncPipeline
+from arxiv_pulse.crawler.shards import SHARD_PLAN_SPAN, iter_windows, plan_windows
+from arxiv_pulse.models import Paper, SyncCheckpoint, normalize_arxiv_id, utcnow
 from arxiv_pulse.utils import output
 
 logger = logging.getLogger(__name__)
 
+SYNC_CHUNK_SIZE = 500  # 每抓取这么多篇（一页）入库一次并推进检查点
+SYNC_CHECKPOINT_MAX_AGE = timedelta(days=7)  # 更早中断的同步不再继续，重新开始
+
+
+@dataclass
+class QuerySync:
+    """一个查询的同步进度"""
+
+    query: str
+    cutoff_date: datetime
+    force: bool
+    max_results: int  # 本次最多抓取的论文数（不含从检查点继续前已完成的部分）
+    offset: int = 0  # 分页位置：这之前的搜索结果都已入库
+    until_date: datetime | None = None  # 按提交日期倒序抓取时，从检查点继续的上界（最后入库论文的提交时间）
+    found: int = 0
+    new: int = 0
+    saved: list[Paper] = field(default_factory=list)
+
 
 class ArXivCrawler:
-    def __init__(self):
+    def __init__(self) -> None:
         self.db = Database()
-        self.client = arxiv.Client(page_size=500, delay_seconds=3.0, num_retries=3)
+        self.client = RateLimitedClient(page_size=500, num_retries=3)
         self.config = Config
+        self._known_ids: KnownArxivIds | None = None
 
         logging.getLogger("arxiv").setLevel(logging.WARNING)
         logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -39,6 +64,11 @@ class ArXivCrawler:
             cutoff_date: Optional UTC datetime cutoff; papers older than this will be skipped
                          and iteration will stop early due to descending date order.
         """
+        results = list(self.iter_arxiv(query, max_results, cutoff_date))
+        output.debug(f"Found {len(results)} papers for query: {query}")
+        return results
+
+    def _sort_options(self) -> tuple[arxiv.SortCriterion, arxiv.SortOrder]:
         sort_by_map = {
             "submittedDate": arxiv.SortCriterion.SubmittedDate,
             "lastUpdatedDate": arxiv.SortCriterion.LastUpdatedDate,
@@ -51,16 +81,36 @@ class ArXivCrawler:
             "ascending": arxiv.SortOrder.Ascending,
         }
         sort_order = sort_order_map.get(Config.ARXIV_SORT_ORDER, arxiv.SortOrder.Descending)
+        return sort_by, sort_order
+
+    def shardable(self) -> bool:
+        """结果按提交日期倒序时才能按日期窗口分片（以及按提交日期从检查点继续）"""
+        return self._sort_options() == (arxiv.SortCriterion.SubmittedDate, arxiv.SortOrder.Descending)
+
+    def count_results(self, query: str) -> int:
+        """Total number of results arXiv reports for a query"""
+        return self.client.total_results(arxiv.Search(query=query, max_results=1))
+
+    def iter_arxiv(
+        self, query: str, max_results: int = 100, cutoff_date: datetime | None = None, offset: int = 0
+    ) -> Iterator[arxiv.Result]:
+        """Lazily iterate search results, starting `offset` results into the listing (resuming a sync)
 
+        Args:
+            max_results: Maximum number of results to yield, not counting the skipped offset
+        """
+        sort_by, sort_order = self._sort_options()
         search = arxiv.Search(
             query=query,
-            max_results=max_results,
+            max_results=offset + max_results,
             sort_by=sort_by,
             sort_order=sort_order,
         )
 
-        results = []
-        for paper in self.client.results(search):
+        count = 0
+        if max_results <= 0:
+            return
+        for paper in self.client.results(search, offset=offset):
             if cutoff_date is not None and hasattr(paper, "published") and paper.published:
                 if paper.published.tzinfo is None:
                     paper_date = paper.published.replace(tzinfo=UTC)
@@ -71,45 +121,109 @@ class ArXivCrawler:
                     output.debug(f"遇到旧论文 ({paper_date.date()})，停止爬取")
                     break
 
-            results.append(paper)
+            yield paper
+            count += 1
 
-            if len(results) >= max_results:
+            if count >= max_results:
                 break
 
-        output.debug(f"Found {len(results)} papers for query: {query}")
-        return results
+    def iter_sharded(
+        self, query: str, max_results: int, cutoff_date: datetime, until_date: datetime | None = None
+    ) -> Iterator[arxiv.Result]:
+        """按提交日期倒序抓取 [cutoff_date, until_date]，范围较大时按结果数切成日期窗口并发抓取
+
+        不超过 SHARD_PLAN_SPAN 且没有上界的范围（日常增量同步）与不分片时完全相同，不额外请求总数。
+        """
+        end = until_date or datetime.now(UTC)
+        if until_date is None and end - cutoff_date <= SHARD_PLAN_SPAN:
+            yield from self.iter_arxiv(query, max_results, cutoff_date)
+            return
+        if end - cutoff_date <= SHARD_PLAN_SPAN:
+            windows = [(cutoff_date, end)]
+        else:
+            windows = plan_windows(self.count_results, query, cutoff_date, end)
+
+        def fetch(window: str, limit: int, cancel: threading.Event) -> list[arxiv.Result]:
+            papers = []
+            for paper in self.iter_arxiv(window, limit, cutoff_date):
+                papers.append(paper)
+                # 一页的结果取完后才会请求下一页：停止迭代就不再翻页
+                if cancel.is_set():
+                    break
+            return papers
+
+        yield from iter_windows(fetch, query, windows, max_results)
+
+    def fetch_chunks(self, run: QuerySync) -> Iterator[tuple[list[arxiv.Result], int]]:
+        """按 SYNC_CHUNK_SIZE 分段产出一个查询的搜索结果：(本段论文, 本段结束时已抓取的篇数)
+
+        默认的提交日期倒序下按日期窗口分片抓取，从检查点继续时以 run.until_date 为上界；
+        其他排序方式整体翻页，从检查点继续时跳过 run.offset 条结果。
+        """
+        if self.shardable():
+            papers = self.iter_sharded(run.query, run.max_results, run.cutoff_date, run.until_date)
+        else:
+            papers = self.iter_arxiv(run.query, run.max_results, run.cutoff_date, run.offset)
+
+        offset = run.offset
+        chunk = []
+        for paper in papers:
+            chunk.append(paper)
+            if len(chunk) >= SYNC_CHUNK_SIZE:
+                offset += len(chunk)
+                yield chunk, offset
+                chunk = []
+        if chunk:
+            yield chunk, offset + len(chunk)
+
+    @property
+    def known_ids(self) -> KnownArxivIds:
+        """热库和归档库中已有的 arXiv ID，首次使用时从数据库加载一次，之后随入库更新"""
+        if self._known_ids is None:
+            self._known_ids = KnownArxivIds.load(self.db)
+            output.debug(f"已加载 {len(self._known_ids)} 个已有论文 ID")
+        return self._known_ids
+
+    def reset_known_ids(self) -> None:
+        """丢弃已加载的 ID 集合，下次过滤时重新从数据库加载（其他进程可能已写入新论文）"""
+        self._known_ids = None
 
     def filter_new_papers(self, papers: list[arxiv.Result]) -> list[arxiv.Result]:
-        """Filter out papers already in database"""
+        """Filter out papers already in database (or repeated within this batch), without querying it"""
+        known = self.known_ids
+        seen = set()
         new_papers = []
         for paper in papers:
-            arxiv_id = paper.entry_id.split("/")[-1]
-            if not self.db.paper_exists(arxiv_id):
-                new_papers.append(paper)
-            else:
+            arxiv_id = normalize_arxiv_id(paper.entry_id)
+            if arxiv_id in known or arxiv_id in seen:
                 output.debug(f"Paper {arxiv_id} already exists in database")
+                continue
+            seen.add(arxiv_id)
+            new_papers.append(paper)
 
         output.debug(f"Filtered to {len(new_papers)} new papers")
         return new_papers
 
     def save_papers(self, papers: list[arxiv.Result], search_query: str) -> list[Paper]:
-        """Save papers to database"""
-        saved_papers = []
-        for paper in tqdm(papers, desc="Saving papers"):
-            try:
-                arxiv_id = paper.entry_id.split("/")[-1]
-                if self.db.paper_exists(arxiv_id):
-                    continue
+        """Save papers to database in batched transactions
 
-                paper_obj = Paper.from_arxiv_entry(paper, search_query)
-                self.db.add_paper(paper_obj)
-                saved_papers.append(paper_obj)
+        A failed batch is retried paper by paper; papers that still fail are logged and skipped,
+        and everything committed is returned.
+        """
+        return self._save_papers(papers, search_query, skip_errors=True)
 
-            except Exception as e:
-                output.error(
-                    "保存论文失败",
-                    details={"paper_id": paper.entry_id, "exception": str(e)},
-                )
+    def _save_papers(self, papers: list[arxiv.Result], search_query: str, skip_errors: bool = False) -> list[Paper]:
+        """Without skip_errors a failed batch raises (a checkpoint must not advance past a failed save)"""
+        saved_papers = []
+        reports = self.db.bulk_upsert_papers(papers, search_query, skip_errors=skip_errors)
+        for i, report in enumerate(reports, 1):
+            saved_papers.extend(report["inserted"])
+            if self._known_ids is not None:
+                self._known_ids.add(paper.arxiv_id for paper in report["inserted"])
+            output.debug(
+                f"批次 {i}/{len(reports)}: 新增 {len(report['inserted'])} 篇，跳过 {report['skipped']} 篇，"
+                f"失败 {report['failed']} 篇"
+            )
 
         output.done(f"保存完成: {len(saved_papers)} 篇新论文")
         return saved_papers
@@ -128,7 +242,6 @@ class ArXivCrawler:
                 all_saved.extend(saved)
 
                 output.done(f"保存: {len(saved)} 篇论文")
-                time.sleep(1)
 
             except Exception as e:
                 output.error(f"爬取查询失败: {query}", details={"exception": str(e)})
@@ -164,7 +277,6 @@ class ArXivCrawler:
                 all_saved.extend(saved)
 
                 output.done(f"保存: {len(saved)} 篇新论文")
-                time.sleep(1)
 
             except Exception as e:
                 output.error(f"每日更新失败: {query}", details={"exception": str(e)})
@@ -191,7 +303,6 @@ class ArXivCrawler:
                 all_saved.extend(saved)
 
                 output.done(f"保存: {len(saved)} 篇论文")
-                time.sleep(1)
 
             except Exception as e:
                 output.error(f"爬取类别失败: {category}", details={"exception": str(e)})
@@ -247,6 +358,8 @@ class ArXivCrawler:
     ) -> dict[str, Any]:
         """Sync papers for a specific query, fetching missing papers from recent years
 
+        An interrupted sync of the same query (same mode and years_back) resumes from its checkpoint.
+
         Args:
             query: arXiv search query
             years_back: Number of years to look back
@@ -257,7 +370,21 @@ class ArXivCrawler:
         output.do(f"同步查询: {query}" + (" (强制模式)" if force else ""))
 
         max_results = int(arxiv_max_results) if arxiv_max_results is not None else int(Config.ARXIV_MAX_RESULTS)
+        output.debug(f"最大返回论文数: {max_results}")
+
+        run = None
+        try:
+            run = self.start_sync(query, years_back, force, max_results)
+            for papers, offset in self.fetch_chunks(run):
+                self.store_sync_chunk(run, papers, offset)
+            return self.finish_sync(run)
+
+        except Exception as e:
+            output.error(f"同步查询失败: {query}", details={"exception": str(e)})
+            return {"query": query, "error": str(e), "new_papers": len(run.saved) if run else 0, "force_mode": force}
 
+    def plan_sync(self, query: str, years_back: int, force: bool) -> datetime:
+        """确定同步的起始日期：强制模式回溯 years_back 年，否则从该查询已有的最新论文前一天开始"""
         cutoff_date = datetime.now(UTC) - timedelta(days=365 * years_back)
 
         if force:
@@ -271,43 +398,82 @@ class ArXivCrawler:
             else:
                 output.debug(f"首次同步: 获取最近 {years_back} 年的论文 ({cutoff_date.strftime('%Y-%m-%d')} 到现在)")
 
-        output.debug(f"最大返回论文数: {max_results}")
+        return cutoff_date
 
-        try:
-            papers = self.search_arxiv(
-                query,
-                max_results=max_results,
-                cutoff_date=cutoff_date,
+    def resumable_checkpoint(self, key: str, force: bool, years_back: int) -> SyncCheckpoint | None:
+        """上次同步（同一模式、同样的回溯年数）中断留下的检查点，超过 SYNC_CHECKPOINT_MAX_AGE 的不再使用"""
+        checkpoint = self.db.get_sync_checkpoint(key)
+        if checkpoint is None or checkpoint.completed or checkpoint.cutoff_date is None:
+            return None
+        if bool(checkpoint.force) != force or checkpoint.years_back != years_back:
+            return None
+        if checkpoint.updated_at is None or utcnow() - checkpoint.updated_at > SYNC_CHECKPOINT_MAX_AGE:
+            return None
+        return checkpoint
+
+    def start_sync(self, query: str, years_back: int, force: bool, max_results: int) -> QuerySync:
+        """开始同步一个查询：有可继续的检查点时沿用它的起始日期和分页位置，否则新建检查点
+
+        增量同步中断后不能重新按"已有最新论文"定起点：已入库的是最新的一段，会把中间没抓到的部分跳过。
+        """
+        checkpoint = self.resumable_checkpoint(query, force, years_back)
+        if checkpoint is not None:
+            output.info(f"从检查点继续: {query}，已完成 {checkpoint.offset} 篇 (最后一篇 {checkpoint.last_arxiv_id})")
+            until_date = checkpoint.reached_date.replace(tzinfo=UTC) if checkpoint.reached_date else None
+            return QuerySync(
+                query, checkpoint.cutoff_date.replace(tzinfo=UTC), force, max_results, checkpoint.offset, until_date
             )
 
-            new_papers = self.filter_new_papers(papers)
-            saved = self.save_papers(new_papers, query)
-
-            output.done(f"同步完成: 查询 {len(papers)} 篇，新增 {len(saved)} 篇")
-
-            if force:
-                existing_count = len(papers) - len(new_papers)
-                if existing_count > 0:
-                    output.info(f"跳过 {existing_count} 篇已存在的论文")
-                if len(papers) >= max_results:
-                    output.info(f"达到最大返回限制 ({max_results})，可能还有更多论文")
-            elif len(new_papers) < len(papers) and len(papers) < max_results:
-                output.info(f"遇到已有论文，提前停止。已查询 {len(papers)} 篇")
-
-            time.sleep(1)
-
-            return {
-                "query": query,
-                "start_date": cutoff_date,
-                "total_found": len(papers),
-                "new_papers": len(saved),
-                "saved_papers": saved,
-                "force_mode": force,
-            }
+        cutoff_date = self.plan_sync(query, years_back, force)
+        self.db.save_sync_checkpoint(
+            query,
+            force=force,
+            years_back=years_back,
+            cutoff_date=cutoff_date.astimezone(UTC).replace(tzinfo=None),
+            offset=0,
+            reached_date=None,
+            last_arxiv_id=None,
+            completed=False,
+        )
+        return QuerySync(query, cutoff_date, force, max_results)
+
+    def store_sync_chunk(self, run: QuerySync, papers: list[arxiv.Result], offset: int) -> None:
+        """过滤并保存一段抓取结果，随后把检查点推进到 offset（这一段之前的结果都已入库）"""
+        new_papers = self.filter_new_papers(papers)
+        if new_papers:
+            run.saved.extend(self._save_papers(new_papers, run.query))
+        run.found += len(papers)
+        run.new += len(new_papers)
+        run.offset = offset
+
+        last = papers[-1]
+        published = last.published.astimezone(UTC).replace(tzinfo=None) if last.published else None
+        self.db.save_sync_checkpoint(
+            run.query, offset=offset, reached_date=published, last_arxiv_id=normalize_arxiv_id(last.entry_id)
+        )
 
-        except Exception as e:
-            output.error(f"同步查询失败: {query}", details={"exception": str(e)})
-            return {"query": query, "error": str(e), "new_papers": 0, "force_mode": force}
+    def finish_sync(self, run: QuerySync) -> dict[str, Any]:
+        """标记检查点完成，返回同步结果"""
+        self.db.save_sync_checkpoint(run.query, completed=True)
+        output.done(f"同步完成: 查询 {run.found} 篇，新增 {len(run.saved)} 篇")
+
+        if run.force:
+            existing_count = run.found - run.new
+            if existing_count > 0:
+                output.info(f"跳过 {existing_count} 篇已存在的论文")
+            if run.found >= run.max_results:
+                output.info(f"达到最大返回限制 ({run.max_results})，可能还有更多论文")
+        elif run.new < run.found and run.found < run.max_results:
+            output.info(f"遇到已有论文，提前停止。已查询 {run.found} 篇")
+
+        return {
+            "query": run.query,
+            "start_date": run.cutoff_date,
+            "total_found": run.found,
+            "new_papers": len(run.saved),
+            "saved_papers": run.saved,
+            "force_mode": run.force,
+        }
 
     def sync_all_queries(
         self, years_back: int = 3, force: bool = False, arxiv_max_results: int | None = None
@@ -326,13 +492,12 @@ class ArXivCrawler:
         if arxiv_max_results is None:
             arxiv_max_results = Config.ARXIV_MAX_RESULTS
 
-        all_results = []
-        total_new = 0
+        self.reset_known_ids()
+        pipeline = SyncPipeline(self, self.config.SEARCH_QUERIES, years_back, force, arxiv_max_results)
+        all_results = list(pipeline)
+        total_new = pipeline.total_new
 
-        for query in self.config.SEARCH_QUERIES:
-            result = self.sync_query(query, years_back, force, arxiv_max_results)
-            all_results.append(result)
-            total_new += result.get("new_papers", 0)
+        self.db.archive_old_papers(Config.ARCHIVE_HORIZON_DAYS)
 
         output.done(f"同步完成: 共 {total_new} 篇论文")
         return {
@@ -343,6 +508,82 @@ class ArXivCrawler:
             "arxiv_max_results": arxiv_max_results,
         }
 
+    def harvest_fields(
+        self, fields: list[str], years_back: int = 3, max_results: int | None = None, base_url: str | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """用 OAI-PMH 批量采集选中领域最近 years_back 年的论文（初次同步 / 大范围回溯）
+
+        每采集一页产出一次进度：{"set", "from", "until", "window_index", "windows", "scanned", "new_papers",
+        "total_new"}。论文的 search_query 记为所属领域的查询，与按查询同步入库的论文一致。
+        每完成一个日期窗口记一次检查点，同样的领域和回溯年数中断（或因 max_results 提前停止）后
+        再次采集时跳过已完成的窗口；全部集合和窗口采集完才把检查点标记为完成。
+
+        Args:
+            fields: 选中的领域（分类 ID，如 cs.AI、cond-mat）
+            max_results: 合计最多新增的论文数
+            base_url: OAI-PMH 接口地址（默认 ARXIV_OAI_URL）
+        """
+        key = f"oai:{','.join(sorted(fields))}"
+        checkpoint = self.resumable_checkpoint(key, False, years_back)
+        resume = None
+        if checkpoint is not None:
+            cutoff = checkpoint.cutoff_date.date()
+            if checkpoint.reached_date is not None:
+                resume = (checkpoint.offset, checkpoint.reached_date.date())
+                output.info(f"从检查点继续: 第 {checkpoint.offset + 1} 个集合，{checkpoint.reached_date.date()} 之后")
+        else:
+            cutoff = (datetime.now(UTC) - timedelta(days=365 * years_back)).date()
+            self.db.save_sync_checkpoint(
+                key,
+                force=False,
+                years_back=years_back,
+                cutoff_date=datetime.combine(cutoff, datetime.min.time()),
+                offset=0,
+                reached_date=None,
+                last_arxiv_id=None,
+                completed=False,
+            )
+        output.do(f"OAI-PMH 批量采集: {len(fields)} 个领域，从 {cutoff} 到现在")
+        self.reset_known_ids()
+
+        total_new = 0
+        for batch in OAIHarvester(base_url).harvest(fields, cutoff, resume=resume):
+            new_papers = 0
+            truncated = False  # 这一页因 max_results 只保存了一部分，窗口不能记为完成
+            for field_id, papers in batch.papers.items():
+                new = self.filter_new_papers(papers)
+                if max_results is not None:
+                    remaining = max(0, max_results - total_new - new_papers)
+                    truncated = truncated or len(new) > remaining
+                    new = new[:remaining]
+                if new:
+                    new_papers += len(self._save_papers(new, get_category_query(field_id)))
+            total_new += new_papers
+            if batch.last_page and not truncated:
+                self.db.save_sync_checkpoint(
+                    key, offset=batch.set_index, reached_date=datetime.combine(batch.window[1], datetime.min.time())
+                )
+            yield {
+                "set": batch.set_spec,
+                "from": batch.window[0],
+                "until": batch.window[1],
+                "window_index": batch.window_index,
+                "windows": batch.windows,
+                "last_page": batch.last_page,
+                "scanned": batch.scanned,
+                "new_papers": new_papers,
+                "total_new": total_new,
+            }
+            if max_results is not None and total_new >= max_results:
+                # 检查点保持未完成：下次从最后一个完成的窗口之后继续采集剩下的集合和窗口
+                output.info(f"达到最大新增数 ({max_results})，停止采集")
+                break
+        else:
+            self.db.save_sync_checkpoint(key, completed=True)
+
+        self.db.archive_old_papers(Config.ARCHIVE_HORIZON_DAYS)
+        output.done(f"批量采集完成: 共 {total_new} 篇论文")
+
     def fetch_paper_by_id(self, arxiv_id: str) -> Paper | None:
         """Fetch a single paper from arXiv by ID and save to database
 
@@ -367,10 +608,10 @@ class ArXivCrawler:
         if "v" in clean_id:
             clean_id = clean_id.split("v")[0]
 
-        if self.db.paper_exists(clean_id):
+        existing = self.db.get_papers_by_arxiv_ids([clean_id])
+        if existing:
             output.debug(f"论文已在数据库中: {clean_id}")
-            with self.db.get_session() as session:
-                return session.query(Paper).filter_by(arxiv_id=clean_id).first()
+            return existing[0]
 
         try:
             search = arxiv.Search(id_list=[clean_id])
@@ -378,10 +619,12 @@ class ArXivCrawler:
             output.debug(f"arXiv API 返回 {len(results)} 条结果")
 
             if results:
-                paper = results[0]
-                paper_obj = Paper.from_arxiv_entry(paper, "quick_fetch")
-                paper_id = self.db.add_paper(paper_obj)
-                output.done(f"已获取论文: {clean_id} (ID: {paper_id})")
+                report = self.db.bulk_upsert_papers(results[:1], "quick_fetch")[0]
+                papers = report["inserted"] or self.db.get_papers_by_arxiv_ids([clean_id])
+                if not papers:
+                    return None
+                paper_obj = papers[0]
+                output.done(f"已获取论文: {clean_id} (ID: {paper_obj.id})")
                 return paper_obj
             else:
                 output.warn(f"未找到论文: {clean_id}")
@@ -410,31 +653,18 @@ class ArXivCrawler:
                 return [], 0, 0
 
             total = len(results)
-            new_papers = []
-            saved_papers = []
-
-            with self.db.get_session() as session:
-                for result in results:
-                    arxiv_id = result.entry_id.split("/")[-1]
-                    if "v" in arxiv_id:
-                        arxiv_id = arxiv_id.split("v")[0]
-
-                    existing = session.query(Paper).filter_by(arxiv_id=arxiv_id).first()
-                    if existing:
-                        saved_papers.append(existing)
-                    else:
-                        paper_obj = Paper.from_arxiv_entry(result, f"remote_search:{query}")
-                        session.add(paper_obj)
-                        new_papers.append(paper_obj)
-                        saved_papers.append(paper_obj)
+            reports = self.db.bulk_upsert_papers(results, f"remote_search:{query}")
+            new_count = sum(len(report["inserted"]) for report in reports)
 
-                session.commit()
+            arxiv_ids = []
+            for result in results:
+                arxiv_id = normalize_arxiv_id(result.entry_id)
+                if arxiv_id not in arxiv_ids:
+                    arxiv_ids.append(arxiv_id)
+            saved_papers = self.db.get_papers_by_arxiv_ids(arxiv_ids)
 
-                for p in saved_papers:
-                    session.refresh(p)
-
-            output.debug(f"远程搜索 '{query}': 找到 {total} 篇，新增 {len(new_papers)} 篇")
-            return saved_papers, total, len(new_papers)
+            output.debug(f"远程搜索 '{query}': 找到 {total} 篇，新增 {new_count} 篇")
+            return saved_papers, total, new_count
 
         except Exception as e:
             output.error(f"远程搜索失败: {query}", details={"exception": str(e)})
@@ -442,20 +672,13 @@ class ArXivCrawler:
 
     def get_crawler_stats(self) -> dict[str, Any]:
         """Get crawler statistics"""
+        today_start = datetime.combine(datetime.now().date(), datetime.min.time())
         with self.db.get_session() as session:
-            total = session.query(Paper).count()
-            today = datetime.now().date()
-            today_start = datetime.combine(today, datetime.min.time())
+            # created_at 有索引，只扫描今天入库的部分
             today_count = session.query(Paper).filter(Paper.created_at >= today_start).count()
 
-            by_query = {}
-            papers = session.query(Paper).all()
-            for paper in papers:
-                query = paper.search_query
-                by_query[query] = by_query.get(query, 0) + 1
-
-            return {
-                "total_papers": total,
-                "papers_today": today_count,
-                "papers_by_query": by_query,
-            }
+        return {
+            "total_papers": self.db.get_stat_counters().get("papers", 0),
+            "papers_today": today_count,
+            "papers_by_query": {query: stat["papers"] for query, stat in self.db.get_query_stats().items()},
+        }
@@ -0,0 +1,84 @@
+"""
+已入库论文的 arXiv ID 集合
+
+同步时按 ID 过滤已有论文原本每篇都要查一次数据库。这里每次同步开始时把热库和归档库中的
+全部 arxiv_id 读入内存一次，之后去重只查内存：新格式 ID（YYMM.NNNN / YYMM.NNNNN）编码为整数，
+存进有序 numpy 数组（每个 8 字节，二分查找）；旧格式 ID（hep-th/9901001 等）和同步期间新入库的 ID
+放在普通集合里。键统一是 normalize_arxiv_id 之后不带版本号的 ID。
+"""
+
+import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from arxiv_pulse.models import normalize_arxiv_id
+
+if TYPE_CHECKING:
+    from arxiv_pulse.core.database import Database
+
+_NEW_STYLE_ID = re.compile(r"(\d{4})\.(\d{4,5})")
+
+
+def _encode(arxiv_id: str) -> int | None:
+    """新格式 ID -> 整数（末位区分 4 位 / 5 位序号），其他格式返回 None"""
+    match = _NEW_STYLE_ID.fullmatch(arxiv_id)
+    if match is None:
+        return None
+    yymm, number = match.groups()
+    return (int(yymm) * 100_000 + int(number)) * 2 + (len(number) == 5)
+
+
+class KnownArxivIds:
+    """不带版本号的 arXiv ID 集合，`entry_id in known` 可直接传入 entry_id 或带版本号的 ID"""
+
+    def __init__(self, arxiv_ids: Iterable[str] = ()):
+        self._codes = np.empty(0, np.int64)
+        self._others: set[str] = set()
+        self._added: set[int] = set()
+        self._freeze([self._encode_chunk(arxiv_ids)])
+
+    @classmethod
+    def load(cls, db: "Database") -> "KnownArxivIds":
+        """从数据库加载热库和归档库中的全部 ID"""
+        known = cls()
+        known._freeze([known._encode_chunk(chunk) for chunk in db.iter_arxiv_ids()])
+        return known
+
+    def _encode_chunk(self, arxiv_ids: Iterable[str]) -> np.ndarray:
+        codes = []
+        for arxiv_id in arxiv_ids:
+            code = _encode(arxiv_id)
+            if code is None:
+                self._others.add(arxiv_id)
+            else:
+                codes.append(code)
+        return np.array(codes, np.int64)
+
+    def _freeze(self, chunks: list[np.ndarray]) -> None:
+        """各块编码合并、排序去重后作为二分查找的数组"""
+        self._codes = np.unique(np.concatenate([self._codes, *chunks]))
+
+    def __len__(self) -> int:
+        return len(self._codes) + len(self._added) + len(self._others)
+
+    def __contains__(self, entry_id: str) -> bool:
+        arxiv_id = normalize_arxiv_id(entry_id)
+        code = _encode(arxiv_id)
+        if code is None:
+            return arxiv_id in self._others
+        if code in self._added:
+            return True
+        position = np.searchsorted(self._codes, code)
+        return bool(position < len(self._codes) and self._codes[position] == code)
+
+    def add(self, arxiv_ids: Iterable[str]) -> None:
+        """记录同步期间新入库的 ID（不重排数组）"""
+        for arxiv_id in arxiv_ids:
+            arxiv_id = normalize_arxiv_id(arxiv_id)
+            code = _encode(arxiv_id)
+            if code is None:
+                self._others.add(arxiv_id)
+            else:
+                self._added.add(code)
@@ -0,0 +1,237 @@
+"""
+OAI-PMH 批量采集
+
+初次同步和多年回溯用搜索 API 逐页翻（每页 500 条、每 3 秒一次请求），大类查询还会碰到 API 的结果上限。
+arXiv 的 OAI-PMH 接口按集合（cs、math、physics:cond-mat 等大类）和日期窗口返回全部记录
+（ListRecords，arXiv 元数据格式，每次请求约 1000 条，用 resumptionToken 翻页）。这里把记录转换成
+arxiv.Result，按选中的分类过滤后交给爬虫原有的过滤 / 入库流程。请求同样从全局令牌桶取令牌。
+
+OAI 的 from / until 是记录的最后修改日期（datestamp），不是提交日期：回溯时取截止日期之后修改过的记录，
+再丢掉提交日期（created）早于截止日期的旧论文。提交于截止日期之后的论文 datestamp 一定不早于截止日期，不会漏。
+"""
+
+import os
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
+
+import arxiv
+import requests
+
+from arxiv_pulse.constants import expand_category
+from arxiv_pulse.crawler.pipeline import TokenBucket, arxiv_rate_limiter
+from arxiv_pulse.utils import output
+
+ARXIV_OAI_URL = os.getenv("ARXIV_OAI_URL", "https://oaipmh.arxiv.org/oai")
+OAI_WINDOW_DAYS = 90  # 每个日期窗口单独翻页：resumptionToken 会过期，失败时也只需重来一个窗口
+OAI_MAX_RETRIES = 5
+OAI_RETRY_AFTER = 30  # 秒：503 没有给出 Retry-After 时的等待
+
+_OAI = "{http://www.openarchives.org/OAI/2.0/}"
+_ARXIV = "{http://arxiv.org/OAI/arXiv/}"
+
+# 不属于 physics 的顶级集合，其余大类（cond-mat、quant-ph、hep-th 等）的集合是 physics:<大类>
+_TOP_LEVEL_SETS = frozenset({"cs", "econ", "eess", "math", "q-bio", "q-fin", "stat"})
+
+
+def oai_set_for(category: str) -> str:
+    """分类 -> 所属的 OAI 集合（"cs.AI" -> "cs"，"cond-mat.str-el" -> "physics:cond-mat"）"""
+    archive = category.strip().removesuffix(".*").split(".")[0]
+    return archive if archive in _TOP_LEVEL_SETS else f"physics:{archive}"
+
+
+@lru_cache(maxsize=256)
+def _field_categories(field_id: str) -> frozenset[str]:
+    """领域展开为分类代码（`cond-mat` / `cond-mat.*` 为整个大类）；分类表以外的代码只匹配它本身"""
+    return expand_category(field_id) or frozenset({field_id.strip().removesuffix(".*")})
+
+
+def match_field(fields: list[str], categories: list[str]) -> str | None:
+    """论文分类属于的第一个选中领域；领域按分类表展开，不带 "." 的领域匹配整个大类"""
+    for field_id in fields:
+        if not _field_categories(field_id).isdisjoint(categories):
+            return field_id
+    return None
+
+
+def _parse_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=UTC)
+
+
+def parse_record(record: ET.Element) -> arxiv.Result | None:
+    """OAI 记录（arXiv 元数据格式）-> arxiv.Result，已删除的记录返回 None"""
+    header = record.find(f"{_OAI}header")
+    if header is not None and header.get("status") == "deleted":
+        return None
+    metadata = record.find(f"{_OAI}metadata/{_ARXIV}arXiv")
+    if metadata is None:
+        return None
+
+    def text(element: ET.Element, tag: str) -> str | None:
+        child = element.find(f"{_ARXIV}{tag}")
+        value = " ".join(child.text.split()) if child is not None and child.text else ""
+        return value or None
+
+    arxiv_id = text(metadata, "id")
+    if not arxiv_id:
+        return None
+    created = _parse_date(text(metadata, "created"))
+    categories = (text(metadata, "categories") or "").split()
+    authors = [
+        arxiv.Result.Author(
+            " ".join(
+                part for part in (text(author, "forenames"), text(author, "keyname"), text(author, "suffix")) if part
+            )
+        )
+        for author in metadata.iterfind(f"{_ARXIV}authors/{_ARXIV}author")
+    ]
+    return arxiv.Result(
+        entry_id=f"http://arxiv.org/abs/{arxiv_id}",
+        updated=_parse_date(text(metadata, "updated")) or created,
+        published=created,
+        title=text(metadata, "title") or "",
+        authors=authors,
+        summary=text(metadata, "abstract") or "",
+        comment=text(metadata, "comments"),
+        journal_ref=text(metadata, "journal-ref"),
+        doi=text(metadata, "doi"),
+        primary_category=categories[0] if categories else "",
+        categories=categories,
+        links=[arxiv.Result.Link(f"https://arxiv.org/pdf/{arxiv_id}", title="pdf", content_type="application/pdf")],
+    )
+
+
+def date_windows(start: date, end: date, window_days: int = OAI_WINDOW_DAYS) -> list[tuple[date, date]]:
+    """[start, end] 切成首尾相接的日期窗口（OAI 的 from / until 都包含当天）"""
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=window_days - 1), end)
+        windows.append((start, window_end))
+        start = window_end + timedelta(days=1)
+    return windows
+
+
+@dataclass
+class HarvestBatch:
+    """一次 ListRecords 请求的结果"""
+
+    set_spec: str
+    set_index: int  # 集合在本次采集中的序号，从 0 开始
+    window: tuple[date, date]
+    window_index: int  # 从 1 开始，在所有集合的全部窗口中的序号
+    windows: int
+    scanned: int  # 本页的记录数（含不属于选中领域的）
+    papers: dict[str, list[arxiv.Result]] = field(default_factory=dict)  # 选中领域 -> 属于它的论文
+    last_page: bool = False  # 是否为这个窗口的最后一页
+
+
+class OAIHarvester:
+    """arXiv OAI-PMH ListRecords 采集器；base_url 可指向本地的测试服务"""
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        limiter: TokenBucket = arxiv_rate_limiter,
+        timeout: float = 120,
+        max_retries: int = OAI_MAX_RETRIES,
+    ):
+        self.base_url = base_url or ARXIV_OAI_URL
+        self.limiter = limiter
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.session = requests.Session()
+
+    def _request(self, params: dict[str, str]) -> ET.Element:
+        """发送一次请求；503（流量控制）按 Retry-After 等待后重试，网络错误退避重试"""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+            except requests.RequestException as e:
+                if attempt == self.max_retries:
+                    raise
+                output.debug(f"OAI 请求失败，重试 ({attempt + 1}/{self.max_retries}): {e}")
+                time.sleep(self.limiter.interval * (attempt + 1))
+                continue
+            if response.status_code == 503 and attempt < self.max_retries:
+                retry_after = response.headers.get("Retry-After", "")
+                wait = int(retry_after) if retry_after.isdigit() else OAI_RETRY_AFTER
+                output.debug(f"OAI 服务要求等待 {wait} 秒")
+                time.sleep(wait)
+                continue
+            response.raise_for_status()
+            return ET.fromstring(response.content)
+        raise RuntimeError("OAI 请求重试次数已用完")
+
+    def list_records(self, set_spec: str, from_date: date, until_date: date) -> Iterator[tuple[list[ET.Element], bool]]:
+        """逐页产出集合在日期窗口内的记录：(记录元素列表, 是否最后一页)"""
+        params = {
+            "verb": "ListRecords",
+            "metadataPrefix": "arXiv",
+            "set": set_spec,
+            "from": from_date.isoformat(),
+            "until": until_date.isoformat(),
+        }
+        while True:
+            root = self._request(params)
+            error = root.find(f"{_OAI}error")
+            if error is not None:
+                if error.get("code") == "noRecordsMatch":
+                    yield [], True
+                    return
+                raise RuntimeError(f"OAI 错误 {error.get('code')}: {(error.text or '').strip()}")
+
+            records = root.find(f"{_OAI}ListRecords")
+            resumption = records.find(f"{_OAI}resumptionToken") if records is not None else None
+            token = (resumption.text or "").strip() if resumption is not None else ""
+            yield (list(records.iterfind(f"{_OAI}record")) if records is not None else []), not token
+            if not token:
+                return
+            params = {"verb": "ListRecords", "resumptionToken": token}
+
+    def harvest(
+        self,
+        fields: list[str],
+        from_date: date,
+        until_date: date | None = None,
+        window_days: int = OAI_WINDOW_DAYS,
+        resume: tuple[int, date] | None = None,
+    ) -> Iterator[HarvestBatch]:
+        """采集属于 fields 且提交日期不早于 from_date 的论文，每页产出一个 HarvestBatch
+
+        每个领域所属的集合只采集一次，同一页中的论文归入第一个匹配的领域。
+        resume=(集合序号, 日期) 从检查点继续：跳过之前的集合，以及该集合中在这个日期及之前结束的窗口
+        （窗口从 from_date 起划分，from_date 相同时边界一致）。
+        """
+        until_date = until_date or datetime.now(UTC).date()
+        set_specs = list(dict.fromkeys(oai_set_for(field_id) for field_id in fields))
+        windows = date_windows(from_date, until_date, window_days)
+        cutoff = datetime.combine(from_date, datetime.min.time(), UTC)
+
+        for set_index, set_spec in enumerate(set_specs):
+            for window_index, window in enumerate(windows, set_index * len(windows) + 1):
+                if resume is not None and (set_index, window[1]) <= resume:
+                    continue
+                for records, last_page in self.list_records(set_spec, *window):
+                    batch = HarvestBatch(
+                        set_spec,
+                        set_index,
+                        window,
+                        window_index,
+                        len(set_specs) * len(windows),
+                        len(records),
+                        last_page=last_page,
+                    )
+                    for record in records:
+                        paper = parse_record(record)
+                        if paper is None or paper.published is None or paper.published < cutoff:
+                            continue
+                        field_id = match_field(fields, paper.categories)
+                        if field_id is not None:
+                            batch.papers.setdefault(field_id, []).append(paper)
+                    yield batch
@@ -0,0 +1,211 @@
+"""
+多查询流水线同步
+
+逐个查询同步时，每个查询都是"抓取（网络）→ 过滤 → 入库"串行执行，入库和解析期间网络空闲。
+这里由一个抓取线程按顺序抓取各查询，调用方线程同时过滤、保存上一个查询的结果；
+所有对 arXiv 的请求（包括分页和重试）都先从进程内全局令牌桶取令牌，多个查询、多个爬虫实例
+合起来也不超过 arXiv 要求的每 3 秒一次请求。
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import arxiv
+
+from arxiv_pulse.utils import output
+
+if TYPE_CHECKING:
+    from arxiv_pulse.crawler.arxiv import ArXivCrawler, QuerySync
+
+ARXIV_REQUEST_INTERVAL = 3.0  # 秒：arXiv API 要求的请求间隔
+SYNC_PIPELINE_DEPTH = 2  # 抓取线程最多领先入库的段数（每段一页，抓好待入库的结果占内存）
+
+
+class TokenBucket:
+    """线程安全的令牌桶：每 interval 秒补充一个令牌，最多攒 capacity 个
+
+    取不到令牌的调用方预定下一个令牌后在锁外等待，多个线程按到达顺序依次放行。
+    """
+
+    def __init__(self, interval: float, capacity: int = 1):
+        self.interval = interval
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """取一个令牌，必要时阻塞等待，返回等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) / self.interval)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens * self.interval if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+arxiv_rate_limiter = TokenBucket(ARXIV_REQUEST_INTERVAL)
+
+
+class RateLimitedClient(arxiv.Client):
+    """每次请求（含分页和重试）先从全局令牌桶取令牌，取代 arxiv.Client 按实例计算的 delay_seconds"""
+
+    def __init__(self, limiter: TokenBucket = arxiv_rate_limiter, **kwargs):
+        super().__init__(delay_seconds=0.0, **kwargs)
+        self.limiter = limiter
+
+    def _parse_feed(self, url: str, first_page: bool = True, _try_index: int = 0):
+        self.limiter.acquire()
+        return super()._parse_feed(url, first_page=first_page, _try_index=_try_index)
+
+    def total_results(self, search: arxiv.Search) -> int:
+        """查询的结果总数：只请求 1 条，读 opensearch:totalResults"""
+        feed = self._parse_feed(self._format_url(search, 0, 1), first_page=True)
+        return int(feed.feed.get("opensearch_totalresults", 0))
+
+
+@dataclass
+class _Fetched:
+    """抓取线程交给入库方的一段结果；每个查询以 last=True 的一项结束"""
+
+    index: int
+    query: str
+    run: "QuerySync | None" = None
+    papers: list[arxiv.Result] | None = None
+    offset: int = 0
+    last: bool = False
+    error: Exception | None = None
+
+
+class SyncPipeline:
+    """按顺序同步多个查询，抓取下一页（或下一个查询）的同时过滤、保存上一页的结果
+
+    迭代得到每个查询的同步结果（与 ArXivCrawler.sync_query 的返回值相同，另加 index，从 1 开始），
+    顺序与 queries 一致。每页入库后推进该查询的检查点，中断（包括提前结束迭代）后下次同步从检查点继续；
+    提前结束迭代时抓取线程在当前请求完成后退出。
+
+    Args:
+        total_limit: 所有查询合计最多新增的论文数；抓取下一个查询时按已入库的篇数收紧它的上限
+            （已在抓取中的查询可能略超出），达到后不再抓取后续查询
+    """
+
+    def __init__(
+        self,
+        crawler: "ArXivCrawler",
+        queries: list[str],
+        years_back: int = 3,
+        force: bool = False,
+        max_results: int | None = None,
+        total_limit: int | None = None,
+        depth: int = SYNC_PIPELINE_DEPTH,
+    ):
+        from arxiv_pulse.core import Config
+
+        self.crawler = crawler
+        self.queries = list(queries)
+        self.years_back = years_back
+        self.force = force
+        self.max_results = int(max_results) if max_results is not None else int(Config.ARXIV_MAX_RESULTS)
+        self.total_limit = total_limit
+        self.depth = depth
+        self.total_new = 0
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        fetched: queue.Queue[_Fetched | None] = queue.Queue(maxsize=self.depth)
+        stop = threading.Event()
+        abandoned: set[int] = set()  # 入库失败的查询，抓取线程跳过它剩下的部分
+        thread = threading.Thread(
+            target=self._fetch_all, args=(fetched, stop, abandoned), name="arxiv-fetch", daemon=True
+        )
+        thread.start()
+        announced = 0
+        try:
+            while (item := fetched.get()) is not None:
+                if item.index in abandoned:
+                    continue
+                if item.index != announced:
+                    announced = item.index
+                    output.do(f"同步查询: {item.query}" + (" (强制模式)" if self.force else ""))
+                result = self._store(item, abandoned)
+                if result is not None:
+                    yield result
+        finally:
+            stop.set()
+
+    async def stream(self) -> AsyncIterator[dict[str, Any]]:
+        """在工作线程中迭代，供 SSE 等异步调用方使用，不阻塞事件循环"""
+        iterator = iter(self)
+        while (result := await asyncio.to_thread(next, iterator, None)) is not None:
+            yield result
+
+    def _put(self, fetched: queue.Queue, stop: threading.Event, item: _Fetched | None) -> bool:
+        """放入队列（队列满时等待入库），调用方已停止迭代时返回 False"""
+        while not stop.is_set():
+            try:
+                fetched.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fetch_all(self, fetched: queue.Queue, stop: threading.Event, abandoned: set[int]) -> None:
+        for index, query in enumerate(self.queries, 1):
+            if stop.is_set():
+                return
+            limit = self.max_results
+            if self.total_limit is not None:
+                remaining = self.total_limit - self.total_new
+                if remaining <= 0:
+                    break
+                limit = min(limit, remaining)
+
+            run = None
+            try:
+                run = self.crawler.start_sync(query, self.years_back, self.force, limit)
+                for papers, offset in self.crawler.fetch_chunks(run):
+                    if index in abandoned:
+                        break
+                    if not self._put(fetched, stop, _Fetched(index, query, run, papers, offset)):
+                        return
+                item = _Fetched(index, query, run, last=True)
+            except Exception as e:
+                item = _Fetched(index, query, run, last=True, error=e)
+            if not self._put(fetched, stop, item):
+                return
+        self._put(fetched, stop, None)
+
+    def _store(self, item: _Fetched, abandoned: set[int]) -> dict[str, Any] | None:
+        """保存一段结果并推进检查点；查询结束（或入库失败）时返回它的同步结果"""
+        if item.papers:
+            assert item.run is not None  # 有结果说明 start_sync 已经返回
+            try:
+                saved = len(item.run.saved)
+                self.crawler.store_sync_chunk(item.run, item.papers, item.offset)
+                self.total_new += len(item.run.saved) - saved
+            except Exception as e:
+                item.error, item.last = e, True
+                abandoned.add(item.index)
+        if not item.last:
+            return None
+
+        if item.error is None:
+            assert item.run is not None  # start_sync 失败时 error 已经设置
+            try:
+                result = self.crawler.finish_sync(item.run)
+            except Exception as e:
+                item.error = e
+        if item.error is not None:
+            output.error(f"同步查询失败: {item.query}", details={"exception": str(item.error)})
+            saved = len(item.run.saved) if item.run else 0
+            result = {"query": item.query, "error": str(item.error), "new_papers": saved, "force_mode": self.force}
+        result["index"] = item.index
+        return result
@@ -0,0 +1,103 @@
+"""
+按提交日期分片抓取大查询
+
+一个查询按 submittedDate 倒序一路翻到截止日期，大类查询（如 cat:cond-mat.* 回溯 5 年）结果数远超
+arXiv API 能可靠翻页的范围，越往后越容易出现空页、重复页。这里先按各时间段报告的结果总数
+（只请求 1 条，读 opensearch:totalResults）把时间范围递归切成 submittedDate:[A TO B] 窗口，
+每个窗口的结果数不超过 SHARD_MAX_RESULTS；窗口由几个工作线程各自独立抓取（请求仍从全局令牌桶取令牌，
+总速率不变，只是网络等待和解析互相重叠），按从新到旧的顺序依次产出，与不分片时的结果顺序一致。
+"""
+
+import math
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import arxiv
+
+from arxiv_pulse.utils import output
+
+SHARD_MAX_RESULTS = 10_000  # 单个窗口（或不分片的查询）最多的结果数
+SHARD_TARGET_RESULTS = 5_000  # 需要切分时，每个窗口的目标结果数（按均匀分布估算，留出余量）
+SHARD_MIN_SPAN = timedelta(days=1)  # 窗口不再切分的最小时长
+SHARD_PLAN_SPAN = timedelta(days=30)  # 短于这个时间范围的同步（如日常增量同步）不统计总数、不分片
+SHARD_WORKERS = 2  # 同时抓取的窗口数，也是领先产出位置预取的窗口数
+
+Window = tuple[datetime, datetime]
+
+
+def window_query(query: str, start: datetime, end: datetime) -> str:
+    """查询限定到 [start, end] 提交的论文（API 按分钟计，两端都包含）"""
+    return f"({query}) AND submittedDate:[{start:%Y%m%d%H%M} TO {end:%Y%m%d%H%M}]"
+
+
+def _floor_minute(moment: datetime) -> datetime:
+    return moment.replace(second=0, microsecond=0)
+
+
+def plan_windows(count: Callable[[str], int], query: str, start: datetime, end: datetime) -> list[Window]:
+    """把 [start, end] 切成结果数都不超过 SHARD_MAX_RESULTS 的窗口，从新到旧排列
+
+    count(query) 返回查询的结果总数。超出的时间段按总数均匀切成若干段，每段再统计、必要时继续切分。
+    窗口端点取整到分钟，相邻窗口首尾相差一分钟：API 的两端都包含，共享端点会让那一分钟的论文被抓取两次。
+    """
+
+    def split(start: datetime, end: datetime, total: int) -> list[Window]:
+        if total <= SHARD_MAX_RESULTS or end - start <= SHARD_MIN_SPAN:
+            return [(start, end)]
+        parts = math.ceil(total / SHARD_TARGET_RESULTS)
+        step = (end - start) / parts
+        splits = {_floor_minute(end - step * i) for i in range(1, parts)}
+        windows = []
+        window_end = end
+        for window_start in sorted({point for point in splits if point > start} | {start}, reverse=True):
+            windows.extend(split(window_start, window_end, count(window_query(query, window_start, window_end))))
+            window_end = window_start - timedelta(minutes=1)
+        return windows
+
+    start, end = _floor_minute(start), _floor_minute(end)
+    windows = split(start, end, count(window_query(query, start, end)))
+    if len(windows) > 1:
+        output.debug(f"按提交日期分成 {len(windows)} 个窗口: {query}")
+    return windows
+
+
+def iter_windows(
+    fetch: Callable[[str, int, threading.Event], list[arxiv.Result]],
+    query: str,
+    windows: list[Window],
+    max_results: int,
+    workers: int = SHARD_WORKERS,
+) -> Iterator[arxiv.Result]:
+    """多个线程各自抓取窗口，按窗口顺序产出最多 max_results 条结果
+
+    fetch(窗口查询, 最多条数, cancel) 抓取一个窗口，每翻一页前检查 cancel。最多条数是 max_results 减去
+    提交时已抓完的窗口的结果数；已抓完的结果够 max_results 条后不再提交新窗口。
+    提前结束迭代或达到上限时设置 cancel 并取消尚未开始的窗口，正在抓取的窗口在当前页之后停止。
+    """
+    pool = ThreadPoolExecutor(workers, thread_name_prefix="arxiv-shard")
+    cancel = threading.Event()
+    pending: deque[Future] = deque()
+    remaining = iter(windows)
+    fetched = 0  # 已抓完的窗口的结果数
+
+    def submit() -> None:
+        window = next(remaining, None)
+        if window is not None:
+            pending.append(pool.submit(fetch, window_query(query, *window), max_results - fetched, cancel))
+
+    try:
+        for _ in range(workers):
+            submit()
+        while pending:
+            papers = pending.popleft().result()
+            yield from papers[: max_results - fetched]
+            fetched += len(papers)
+            if fetched >= max_results:
+                return
+            submit()
+    finally:
+        cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
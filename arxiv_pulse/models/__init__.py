@@ -1,22 +1,75 @@
-from arxiv_pulse.models.base import DEFAULT_CONFIG, Base, utcnow
+from arxiv_pulse.models.archive import ARCHIVE_SCHEMA, ArchivedPaper
+from arxiv_pulse.models.base import CACHE_SCHEMA, DEFAULT_CONFIG, Base, utcnow
 from arxiv_pulse.models.chat import ChatMessage, ChatSession
 from arxiv_pulse.models.collection import Collection, CollectionPaper
-from arxiv_pulse.models.paper import FigureCache, Paper, PaperContentCache, TranslationCache
-from arxiv_pulse.models.system import RecentResult, SyncTask, SystemConfig
+from arxiv_pulse.models.paper import (
+    PAPERS_FTS_COLUMNS,
+    PAPERS_FTS_DDL,
+    PAPERS_FTS_DROP,
+    PAPERS_FTS_REBUILD,
+    Author,
+    FigureCache,
+    Paper,
+    PaperAuthor,
+    PaperCard,
+    PaperCategory,
+    PaperContentCache,
+    TranslationCache,
+    compress_text,
+    decompress_text,
+    normalize_arxiv_id,
+    normalize_author_name,
+    papers_fts,
+)
+from arxiv_pulse.models.stats import (
+    STAT_ALL_CATEGORIES,
+    STATS_REBUILD_SQL,
+    STATS_TRIGGERS_DDL,
+    CollectionStat,
+    DailyCategoryStat,
+    QueryStat,
+    StatCounter,
+)
+from arxiv_pulse.models.system import CONFIG_VERSION_KEY, RecentResult, SyncCheckpoint, SyncTask, SystemConfig
 
 __all__ = [
     "Base",
     "DEFAULT_CONFIG",
+    "CACHE_SCHEMA",
     "utcnow",
     "Paper",
+    "PaperCategory",
+    "ArchivedPaper",
+    "ARCHIVE_SCHEMA",
+    "PaperCard",
+    "Author",
+    "PaperAuthor",
+    "normalize_author_name",
+    "normalize_arxiv_id",
+    "PAPERS_FTS_COLUMNS",
+    "PAPERS_FTS_DDL",
+    "PAPERS_FTS_DROP",
+    "PAPERS_FTS_REBUILD",
+    "papers_fts",
     "TranslationCache",
     "FigureCache",
     "PaperContentCache",
+    "compress_text",
+    "decompress_text",
     "ChatSession",
     "ChatMessage",
     "Collection",
     "CollectionPaper",
     "SyncTask",
+    "SyncCheckpoint",
     "RecentResult",
     "SystemConfig",
+    "CONFIG_VERSION_KEY",
+    "StatCounter",
+    "DailyCategoryStat",
+    "QueryStat",
+    "CollectionStat",
+    "STAT_ALL_CATEGORIES",
+    "STATS_TRIGGERS_DDL",
+    "STATS_REBUILD_SQL",
 ]
@@ -0,0 +1,44 @@
+from sqlalchemy import Index, func, literal, or_
+
+from arxiv_pulse.models.base import Base
+from arxiv_pulse.models.paper import Paper
+
+# 归档库：超过保留期且不在任何论文集中的论文移入 archive.db，热库 papers 只保留近期论文。
+# Database 在每个 SQLite 连接上 ATTACH archive.db 为 ARCHIVE_SCHEMA，表结构与 papers 相同、id 保持不变。
+
+ARCHIVE_SCHEMA = "archive"
+
+archived_papers = Paper.__table__.to_metadata(Base.metadata, schema=ARCHIVE_SCHEMA)
+Index("ix_archive_papers_published", archived_papers.c.published)
+
+
+class ArchivedPaper(Base):
+    __table__ = archived_papers
+
+    def to_dict(self):
+        return {**Paper.to_dict(self), "archived": True}
+
+    @classmethod
+    def category_condition(cls, categories: list[str]):
+        """属于任一分类的条件，语义与 PaperCategory.condition 相同
+
+        归档库没有分类索引：把 categories 和 primary_category 拼成 ",cs.AI,cs.LG,cs.AI," 后按完整的分类代码查找，
+        不会把 cond-mat.str 当成 cond-mat.str-el 的一部分；不带 "." 的分类（或 `x.*`）匹配整个大类。
+        """
+        codes = (
+            literal(",")
+            + func.replace(func.coalesce(cls.categories, ""), " ", "")
+            + ","
+            + func.coalesce(cls.primary_category, "")
+            + ","
+        )
+        conditions = []
+        for category in categories:
+            category = category.strip().removesuffix(".*")
+            conditions.append(func.instr(codes, f",{category},") > 0)
+            if "." not in category:
+                conditions.append(func.instr(codes, f",{category}.") > 0)
+        return or_(*conditions)
+
+    def __repr__(self):
+        return f"<ArchivedPaper(arxiv_id={self.arxiv_id})>"
@@ -17,6 +17,9 @@ from sqlalchemy.orm import sessionmaker
 
 Base = declarative_base()
 
+# 派生缓存（翻译、图片、正文、最近论文结果）所在的附加库 cache.db，其中数据都可重建
+CACHE_SCHEMA = "cache"
+
 DEFAULT_CONFIG = {
     "ai_api_key": "",
     "ai_model": "DeepSeek-V3.2",
@@ -24,6 +27,7 @@ DEFAULT_CONFIG = {
     "search_queries": 'condensed matter physics AND cat:cond-mat.*; (ti:"density functional" OR abs:"density functional") AND (cat:physics.comp-ph OR cat:cond-mat.mtrl-sci OR cat:physics.chem-ph); (ti:"machine learning" OR abs:"machine learning") AND (cat:physics.comp-ph OR cat:cond-mat.mtrl-sci OR cat:physics.chem-ph)',
     "arxiv_max_results": "10000",
     "years_back": "5",
+    "archive_horizon_days": "0",
     "is_initialized": "false",
     "selected_fields": "[]",
 }
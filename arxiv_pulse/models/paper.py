@@ -1,8 +1,38 @@
 import json
+import re
+import unicodedata
+import zlib
+from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    Select,
+    String,
+    Text,
+    case,
+    column,
+    func,
+    or_,
+    select,
+    table,
+)
 
-from arxiv_pulse.models.base import Base, utcnow
+from arxiv_pulse.models.base import CACHE_SCHEMA, Base, utcnow
+
+
+def normalize_arxiv_id(entry_id: str) -> str:
+    """entry_id / 带版本号的 ID -> 入库用的不带版本号的 arXiv ID（"http://arxiv.org/abs/2401.01234v2" -> "2401.01234"）"""
+    arxiv_id = entry_id.split("/")[-1]
+    if "v" in arxiv_id:
+        arxiv_id = arxiv_id.split("v")[0]
+    return arxiv_id
 
 
 class Paper(Base):
@@ -58,13 +88,11 @@ class Paper(Base):
     @classmethod
     def from_arxiv_entry(cls, entry, search_query):
         authors = [{"name": author.name, "affiliation": getattr(author, "affiliation", "")} for author in entry.authors]
-        arxiv_id = entry.entry_id.split("/")[-1]
-        if "v" in arxiv_id:
-            arxiv_id = arxiv_id.split("v")[0]
+        arxiv_id = normalize_arxiv_id(entry.entry_id)
         return cls(
             arxiv_id=arxiv_id,
             title=entry.title,
-            authors=json.dumps(authors),
+            authors=json.dumps(authors, ensure_ascii=False),
             abstract=entry.summary,
             categories=", ".join(entry.categories) if hasattr(entry, "categories") else entry.primary_category,
             primary_category=entry.primary_category if hasattr(entry, "primary_category") else "",
@@ -79,8 +107,278 @@ class Paper(Base):
         )
 
 
+def _summary_field(path: str):
+    """在 SQL 中从 summary JSON 取出单个字段（summary 不是合法 JSON 时为 NULL）"""
+    return case((func.json_valid(Paper.summary), func.json_extract(Paper.summary, path)))
+
+
+class PaperCard:
+    """列表视图用的精简只读模型
+
+    只投影卡片渲染需要的列，comment / doi / journal_ref / 完整 summary 等重列留给详情页；
+    用 Core select 取回元组，不构造 ORM 对象、不进入 identity map。
+    summary 中卡片用到的 key_findings / methodology / keywords 由 json_extract 在查询时取出。
+    """
+
+    __slots__ = (
+        "id",
+        "arxiv_id",
+        "title",
+        "authors",
+        "abstract",
+        "categories",
+        "primary_category",
+        "published",
+        "pdf_url",
+        "summarized",
+        "key_findings",
+        "methodology",
+        "keywords",
+    )
+
+    id: int
+    arxiv_id: str
+    title: str
+    authors: str | None
+    abstract: str | None
+    categories: str | None
+    primary_category: str | None
+    published: datetime | None
+    pdf_url: str | None
+    summarized: bool | None
+    key_findings: str | None
+    methodology: str | None
+    keywords: str | None
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values, strict=True):
+            setattr(self, name, value)
+
+    @staticmethod
+    def columns() -> tuple:
+        """与 __slots__ 顺序一致的投影列"""
+        return (
+            Paper.id,
+            Paper.arxiv_id,
+            Paper.title,
+            Paper.authors,
+            Paper.abstract,
+            Paper.categories,
+            Paper.primary_category,
+            Paper.published,
+            Paper.pdf_url,
+            Paper.summarized,
+            _summary_field("$.key_findings").label("key_findings"),
+            _summary_field("$.methodology").label("methodology"),
+            _summary_field("$.keywords").label("keywords"),
+        )
+
+    @classmethod
+    def query(cls, *extra):
+        """select(卡片列, *extra)；extra 追加在卡片列之后"""
+        return select(*cls.columns(), *extra)
+
+    @classmethod
+    def from_row(cls, row) -> "PaperCard":
+        return cls(*row[: len(cls.__slots__)])
+
+    @staticmethod
+    def _json_list(value: str | None, limit: int) -> list:
+        if not value:
+            return []
+        try:
+            data = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return []
+        return data[:limit] if isinstance(data, list) else []
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "arxiv_id": self.arxiv_id,
+            "title": self.title,
+            "authors": json.loads(self.authors) if self.authors else [],
+            "abstract": self.abstract,
+            "categories": self.categories,
+            "primary_category": self.primary_category,
+            "published": self.published.isoformat() if self.published else None,
+            "pdf_url": self.pdf_url,
+            "summarized": self.summarized,
+            "key_findings": self._json_list(self.key_findings, 5),
+            "methodology": self.methodology or "",
+            "keywords": self._json_list(self.keywords, 10),
+        }
+
+    def __repr__(self):
+        return f"<PaperCard(arxiv_id={self.arxiv_id})>"
+
+
+# FTS5 外部内容表：索引 papers 的 title / abstract / authors / keywords，由触发器保持同步。
+# authors 列是 JSON（[{"name": ..., "affiliation": ...}]），只索引拼接后的作者名，否则 name、affiliation
+# 这些键也会成为词条；内容表因此是同样拼接作者名的视图 papers_fts_source。
+PAPERS_FTS_COLUMNS = ("title", "abstract", "authors", "keywords")
+
+papers_fts = table("papers_fts", column("rowid"), column("papers_fts"), *[column(c) for c in PAPERS_FTS_COLUMNS])
+
+
+def _author_names_sql(value: str) -> str:
+    """authors JSON -> 空格分隔的作者名；元素不是对象（或整列不是 JSON）时按原文索引"""
+    return (
+        "(SELECT group_concat(CASE type WHEN 'object' THEN json_extract(value, '$.name') ELSE value END, ' ') "
+        f"FROM json_each(CASE WHEN json_valid({value}) THEN {value} ELSE json_array({value}) END))"
+    )
+
+
+def _fts_values(row: str) -> list[str]:
+    """写入 FTS 的各列取值：row 为 new / old（触发器）或 papers（视图）"""
+    return [_author_names_sql(f"{row}.{c}") if c == "authors" else f"{row}.{c}" for c in PAPERS_FTS_COLUMNS]
+
+
+PAPERS_FTS_DDL = [
+    f"""CREATE VIEW IF NOT EXISTS papers_fts_source AS
+        SELECT papers.id AS id, {", ".join(f"{v} AS {c}" for v, c in zip(_fts_values("papers"), PAPERS_FTS_COLUMNS))}
+        FROM papers""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+        {", ".join(PAPERS_FTS_COLUMNS)},
+        content='papers_fts_source', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS papers_fts_ai AFTER INSERT ON papers BEGIN
+        INSERT INTO papers_fts(rowid, {", ".join(PAPERS_FTS_COLUMNS)})
+        VALUES (new.id, {", ".join(_fts_values("new"))});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS papers_fts_ad AFTER DELETE ON papers BEGIN
+        INSERT INTO papers_fts(papers_fts, rowid, {", ".join(PAPERS_FTS_COLUMNS)})
+        VALUES ('delete', old.id, {", ".join(_fts_values("old"))});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS papers_fts_au AFTER UPDATE OF {", ".join(PAPERS_FTS_COLUMNS)} ON papers BEGIN
+        INSERT INTO papers_fts(papers_fts, rowid, {", ".join(PAPERS_FTS_COLUMNS)})
+        VALUES ('delete', old.id, {", ".join(_fts_values("old"))});
+        INSERT INTO papers_fts(rowid, {", ".join(PAPERS_FTS_COLUMNS)})
+        VALUES (new.id, {", ".join(_fts_values("new"))});
+    END""",
+]
+
+# 从内容视图重建索引。FTS5 的 'rebuild' 命令扫描不了含 json_each 的视图（SQL logic error），这里清空后逐行插入
+PAPERS_FTS_REBUILD = (
+    "INSERT INTO papers_fts(papers_fts) VALUES ('delete-all')",
+    f"""INSERT INTO papers_fts(rowid, {", ".join(PAPERS_FTS_COLUMNS)})
+        SELECT id, {", ".join(PAPERS_FTS_COLUMNS)} FROM papers_fts_source""",
+)
+
+# 删除全文索引及其触发器、内容视图（迁移时用于换掉旧定义，随后由 ensure_fulltext_index 重建）
+PAPERS_FTS_DROP = (
+    "DROP TRIGGER IF EXISTS papers_fts_ai",
+    "DROP TRIGGER IF EXISTS papers_fts_ad",
+    "DROP TRIGGER IF EXISTS papers_fts_au",
+    "DROP TABLE IF EXISTS papers_fts",
+    "DROP VIEW IF EXISTS papers_fts_source",
+)
+
+
+class PaperCategory(Base):
+    __tablename__ = "paper_categories"
+
+    paper_id = Column(Integer, ForeignKey("papers.id"), primary_key=True)
+    category = Column(String(100), primary_key=True)
+    is_primary = Column(Boolean, default=False)
+
+    __table_args__ = (Index("ix_paper_categories_category_paper", "category", "paper_id"),)
+
+    @staticmethod
+    def rows_for(paper_id: int, categories: str | None, primary_category: str | None) -> list[dict]:
+        """把逗号分隔的 categories 字符串拆成 paper_categories 行"""
+        cats = [c.strip() for c in (categories or "").split(",") if c.strip()]
+        if primary_category and primary_category not in cats:
+            cats.insert(0, primary_category)
+        return [
+            {"paper_id": paper_id, "category": cat, "is_primary": cat == primary_category}
+            for cat in dict.fromkeys(cats)
+        ]
+
+    @classmethod
+    def condition(cls, category: str):
+        """单个分类的匹配条件，`cond-mat` 或 `cond-mat.*` 匹配整个大类（前缀范围查询）"""
+        category = category.strip()
+        if category.endswith(".*"):
+            category = category[:-2]
+        if "." in category:
+            return cls.category == category
+        # "." 的下一个字符是 "/"，[prefix., prefix/) 恰好覆盖所有子分类
+        return or_(
+            cls.category == category,
+            (cls.category >= f"{category}.") & (cls.category < f"{category}/"),
+        )
+
+    @classmethod
+    def paper_ids_matching(cls, categories: list[str]):
+        """属于任一分类的 paper_id 子查询，用于 Paper.id.in_(...)"""
+        return select(cls.paper_id).where(or_(*[cls.condition(cat) for cat in categories])).distinct()
+
+    def __repr__(self):
+        return f"<PaperCategory(paper_id={self.paper_id}, category={self.category})>"
+
+
+def normalize_author_name(name: str) -> str:
+    """作者名归一化：去重音、小写、去标点、合并空白（"Bob Müller" -> "bob muller"）"""
+    name = unicodedata.normalize("NFKD", name or "")
+    name = "".join(ch for ch in name if not unicodedata.combining(ch))
+    name = re.sub(r"[^\w\s-]", " ", name.lower(), flags=re.UNICODE)
+    return " ".join(name.split())
+
+
+class Author(Base):
+    __tablename__ = "authors"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(300), nullable=False)
+    normalized_name = Column(String(300), nullable=False, unique=True, index=True)
+
+    def __repr__(self):
+        return f"<Author(id={self.id}, name={self.name})>"
+
+
+class PaperAuthor(Base):
+    __tablename__ = "paper_authors"
+
+    paper_id = Column(Integer, ForeignKey("papers.id"), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    author_id = Column(Integer, ForeignKey("authors.id"), nullable=False)
+
+    __table_args__ = (Index("ix_paper_authors_author_paper", "author_id", "paper_id"),)
+
+    @staticmethod
+    def author_names(authors_json: str | None) -> list[str]:
+        """从 Paper.authors 的 JSON 中按顺序取出作者名"""
+        try:
+            authors = json.loads(authors_json) if authors_json else []
+        except (TypeError, ValueError):
+            return []
+        names = []
+        for author in authors:
+            name = author.get("name") if isinstance(author, dict) else author
+            if isinstance(name, str) and normalize_author_name(name):
+                names.append(name.strip())
+        return names
+
+    @classmethod
+    def paper_ids_by_author(cls, name: str, exact: bool = True):
+        """某作者的 paper_id 子查询；exact=False 时按归一化名的子串匹配"""
+        normalized = normalize_author_name(name)
+        author_ids: Select = select(Author.id)
+        if exact:
+            author_ids = author_ids.where(Author.normalized_name == normalized)
+        else:
+            author_ids = author_ids.where(Author.normalized_name.contains(normalized, autoescape=True))
+        return select(cls.paper_id).where(cls.author_id.in_(author_ids))
+
+    def __repr__(self):
+        return f"<PaperAuthor(paper_id={self.paper_id}, author_id={self.author_id}, position={self.position})>"
+
+
 class TranslationCache(Base):
     __tablename__ = "translation_cache"
+    __table_args__ = {"schema": CACHE_SCHEMA}
 
     id = Column(Integer, primary_key=True)
     source_text = Column(Text, nullable=False)
@@ -89,6 +387,7 @@ class TranslationCache(Base):
     target_language = Column(String(10), default="zh")
     created_at = Column(DateTime, default=utcnow)
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+    accessed_at = Column(DateTime, default=utcnow, index=True)  # 最近命中时间，缓存淘汰按它做 LRU
 
     def __repr__(self):
         return f"<TranslationCache(id={self.id}, hash={self.source_text_hash[:16]}...)>"
@@ -96,24 +395,51 @@ class TranslationCache(Base):
 
 class FigureCache(Base):
     __tablename__ = "figure_cache"
+    __table_args__ = {"schema": CACHE_SCHEMA}
 
     id = Column(Integer, primary_key=True)
     arxiv_id = Column(String(50), nullable=False, unique=True, index=True)
     figure_url = Column(Text, nullable=False)
     created_at = Column(DateTime, default=utcnow)
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+    accessed_at = Column(DateTime, default=utcnow, index=True)
 
     def __repr__(self):
         return f"<FigureCache(id={self.id}, arxiv_id={self.arxiv_id})>"
 
 
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), 6)
+
+
+def decompress_text(blob: bytes) -> str:
+    return zlib.decompress(blob).decode("utf-8")
+
+
 class PaperContentCache(Base):
+    """PDF 提取的正文缓存，以 zlib 压缩后存为 BLOB（正文动辄上百 KB）"""
+
     __tablename__ = "paper_content_cache"
+    __table_args__ = {"schema": CACHE_SCHEMA}
 
     id = Column(Integer, primary_key=True)
     arxiv_id = Column(String(50), nullable=False, unique=True, index=True)
-    full_text = Column(Text)
+    full_text = Column(Text)  # 旧版未压缩正文，迁移 v3 后为 NULL
+    full_text_z = Column(LargeBinary)
     created_at = Column(DateTime, default=utcnow)
+    accessed_at = Column(DateTime, default=utcnow, index=True)
+
+    @property
+    def text(self) -> str | None:
+        """正文，读取时才解压"""
+        if self.full_text_z is not None:
+            return decompress_text(self.full_text_z)
+        return self.full_text
+
+    @text.setter
+    def text(self, value: str | None) -> None:
+        self.full_text_z = compress_text(value) if value else None
+        self.full_text = None
 
     def __repr__(self):
         return f"<PaperContentCache(id={self.id}, arxiv_id={self.arxiv_id})>"
@@ -0,0 +1,163 @@
+from sqlalchemy import Column, Date, DateTime, Integer, String
+
+from arxiv_pulse.models.base import Base
+
+# 统计汇总表：由下方触发器在 papers / paper_categories / collections / collection_papers
+# 写入时就地增减，/api/stats 只读这些表，开销与论文总数无关
+
+STAT_ALL_CATEGORIES = "*"  # stat_daily_categories 中表示“当天全部论文”的分类值
+
+
+class StatCounter(Base):
+    __tablename__ = "stat_counters"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<StatCounter({self.name}={self.value})>"
+
+
+class DailyCategoryStat(Base):
+    __tablename__ = "stat_daily_categories"
+
+    day = Column(Date, primary_key=True)
+    category = Column(String(100), primary_key=True)
+    paper_count = Column(Integer, nullable=False, default=0)
+    summarized_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<DailyCategoryStat(day={self.day}, category={self.category}, count={self.paper_count})>"
+
+
+class QueryStat(Base):
+    __tablename__ = "stat_queries"
+
+    search_query = Column(String(200), primary_key=True)
+    paper_count = Column(Integer, nullable=False, default=0)
+    summarized_count = Column(Integer, nullable=False, default=0)
+    latest_published = Column(DateTime)
+
+    def __repr__(self):
+        return f"<QueryStat(query={self.search_query}, count={self.paper_count})>"
+
+
+class CollectionStat(Base):
+    __tablename__ = "stat_collections"
+
+    collection_id = Column(Integer, primary_key=True)
+    paper_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<CollectionStat(collection_id={self.collection_id}, count={self.paper_count})>"
+
+
+def _bump_counter(name: str, delta: str) -> str:
+    return (
+        f"INSERT INTO stat_counters(name, value) VALUES ('{name}', {delta}) "
+        "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value;"
+    )
+
+
+_NEW_SUMMARIZED = "coalesce(new.summarized, 0)"
+_OLD_SUMMARIZED = "coalesce(old.summarized, 0)"
+_NEW_SUMMARY_CHARS = "CASE WHEN new.summarized THEN length(coalesce(new.summary, '')) ELSE 0 END"
+_OLD_SUMMARY_CHARS = "CASE WHEN old.summarized THEN length(coalesce(old.summary, '')) ELSE 0 END"
+
+STATS_TRIGGERS_DDL = [
+    f"""CREATE TRIGGER IF NOT EXISTS stats_papers_ai AFTER INSERT ON papers BEGIN
+        {_bump_counter("papers", "1")}
+        {_bump_counter("summarized", _NEW_SUMMARIZED)}
+        {_bump_counter("summary_chars", _NEW_SUMMARY_CHARS)}
+        INSERT INTO stat_daily_categories(day, category, paper_count, summarized_count)
+        VALUES (date(new.published), '{STAT_ALL_CATEGORIES}', 1, {_NEW_SUMMARIZED})
+        ON CONFLICT(day, category) DO UPDATE SET
+            paper_count = paper_count + 1, summarized_count = summarized_count + excluded.summarized_count;
+        INSERT INTO stat_queries(search_query, paper_count, summarized_count, latest_published)
+        VALUES (coalesce(new.search_query, ''), 1, {_NEW_SUMMARIZED}, new.published)
+        ON CONFLICT(search_query) DO UPDATE SET
+            paper_count = paper_count + 1,
+            summarized_count = summarized_count + excluded.summarized_count,
+            latest_published = max(coalesce(latest_published, excluded.latest_published), excluded.latest_published);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS stats_papers_ad AFTER DELETE ON papers BEGIN
+        {_bump_counter("papers", "-1")}
+        {_bump_counter("summarized", f"-{_OLD_SUMMARIZED}")}
+        {_bump_counter("summary_chars", f"-({_OLD_SUMMARY_CHARS})")}
+        UPDATE stat_daily_categories
+        SET paper_count = paper_count - 1, summarized_count = summarized_count - {_OLD_SUMMARIZED}
+        WHERE day = date(old.published) AND category = '{STAT_ALL_CATEGORIES}';
+        UPDATE stat_queries
+        SET paper_count = paper_count - 1, summarized_count = summarized_count - {_OLD_SUMMARIZED}
+        WHERE search_query = coalesce(old.search_query, '');
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS stats_papers_au_summarized AFTER UPDATE OF summarized ON papers
+    WHEN {_OLD_SUMMARIZED} != {_NEW_SUMMARIZED} BEGIN
+        {_bump_counter("summarized", f"{_NEW_SUMMARIZED} - {_OLD_SUMMARIZED}")}
+        UPDATE stat_daily_categories
+        SET summarized_count = summarized_count + {_NEW_SUMMARIZED} - {_OLD_SUMMARIZED}
+        WHERE day = date(new.published)
+            AND (category = '{STAT_ALL_CATEGORIES}'
+                 OR category IN (SELECT category FROM paper_categories WHERE paper_id = new.id));
+        UPDATE stat_queries
+        SET summarized_count = summarized_count + {_NEW_SUMMARIZED} - {_OLD_SUMMARIZED}
+        WHERE search_query = coalesce(new.search_query, '');
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS stats_papers_au_summary AFTER UPDATE OF summarized, summary ON papers BEGIN
+        {_bump_counter("summary_chars", f"({_NEW_SUMMARY_CHARS}) - ({_OLD_SUMMARY_CHARS})")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS stats_paper_categories_ai AFTER INSERT ON paper_categories BEGIN
+        INSERT INTO stat_daily_categories(day, category, paper_count, summarized_count)
+        SELECT date(p.published), new.category, 1, coalesce(p.summarized, 0) FROM papers p WHERE p.id = new.paper_id
+        ON CONFLICT(day, category) DO UPDATE SET
+            paper_count = paper_count + 1, summarized_count = summarized_count + excluded.summarized_count;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS stats_paper_categories_ad AFTER DELETE ON paper_categories BEGIN
+        UPDATE stat_daily_categories
+        SET paper_count = paper_count - 1,
+            summarized_count = summarized_count - coalesce((SELECT summarized FROM papers WHERE id = old.paper_id), 0)
+        WHERE category = old.category AND day = (SELECT date(published) FROM papers WHERE id = old.paper_id);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS stats_collection_papers_ai AFTER INSERT ON collection_papers BEGIN
+        {_bump_counter("collection_papers", "1")}
+        INSERT INTO stat_collections(collection_id, paper_count) VALUES (new.collection_id, 1)
+        ON CONFLICT(collection_id) DO UPDATE SET paper_count = paper_count + 1;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS stats_collection_papers_ad AFTER DELETE ON collection_papers BEGIN
+        {_bump_counter("collection_papers", "-1")}
+        UPDATE stat_collections SET paper_count = paper_count - 1 WHERE collection_id = old.collection_id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS stats_collections_ai AFTER INSERT ON collections BEGIN
+        {_bump_counter("collections", "1")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS stats_collections_ad AFTER DELETE ON collections BEGIN
+        {_bump_counter("collections", "-1")}
+        DELETE FROM stat_collections WHERE collection_id = old.id;
+    END""",
+]
+
+# 从原始表整体重算汇总表（迁移时及手动刷新时使用）
+STATS_REBUILD_SQL = [
+    "DELETE FROM stat_counters",
+    "DELETE FROM stat_daily_categories",
+    "DELETE FROM stat_queries",
+    "DELETE FROM stat_collections",
+    """INSERT INTO stat_counters(name, value) VALUES
+        ('papers', (SELECT count(*) FROM papers)),
+        ('summarized', (SELECT coalesce(sum(coalesce(summarized, 0)), 0) FROM papers)),
+        ('summary_chars', (SELECT coalesce(sum(length(coalesce(summary, ''))), 0) FROM papers WHERE summarized)),
+        ('collections', (SELECT count(*) FROM collections)),
+        ('collection_papers', (SELECT count(*) FROM collection_papers))""",
+    f"""INSERT INTO stat_daily_categories(day, category, paper_count, summarized_count)
+        SELECT date(published), '{STAT_ALL_CATEGORIES}', count(*), sum(coalesce(summarized, 0))
+        FROM papers GROUP BY date(published)""",
+    """INSERT INTO stat_daily_categories(day, category, paper_count, summarized_count)
+        SELECT date(p.published), pc.category, count(*), sum(coalesce(p.summarized, 0))
+        FROM paper_categories pc JOIN papers p ON p.id = pc.paper_id
+        GROUP BY date(p.published), pc.category""",
+    """INSERT INTO stat_queries(search_query, paper_count, summarized_count, latest_published)
+        SELECT coalesce(search_query, ''), count(*), sum(coalesce(summarized, 0)), max(published)
+        FROM papers GROUP BY coalesce(search_query, '')""",
+    """INSERT INTO stat_collections(collection_id, paper_count)
+        SELECT collection_id, count(*) FROM collection_papers GROUP BY collection_id""",
+]
@@ -1,8 +1,8 @@
 import json
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
 
-from arxiv_pulse.models.base import Base, utcnow
+from arxiv_pulse.models.base import CACHE_SCHEMA, Base, utcnow
 
 
 class SyncTask(Base):
@@ -35,8 +35,42 @@ class SyncTask(Base):
         return f"<SyncTask(id={self.id}, type={self.task_type}, status={self.status})>"
 
 
+class SyncCheckpoint(Base):
+    """同步进度检查点：每个查询（或一次 OAI 批量采集）一行，同步中断后下次从这里继续"""
+
+    __tablename__ = "sync_checkpoints"
+
+    key = Column(String(500), primary_key=True)  # 搜索查询，或 "oai:<领域,...>"
+    force = Column(Boolean, default=False)
+    years_back = Column(Integer)
+    cutoff_date = Column(DateTime)  # 本次同步范围的起始日期（UTC）
+    offset = Column(Integer, default=0)  # 搜索 API：已入库的结果数（分页位置）；OAI：当前集合的序号
+    reached_date = Column(DateTime)  # 搜索 API：最后入库论文的发表时间；OAI：已完成的日期窗口的结束日期
+    last_arxiv_id = Column(String(50))
+    completed = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+
+    def to_dict(self):
+        return {
+            "key": self.key,
+            "force": self.force,
+            "years_back": self.years_back,
+            "cutoff_date": self.cutoff_date.isoformat() if self.cutoff_date else None,
+            "offset": self.offset,
+            "reached_date": self.reached_date.isoformat() if self.reached_date else None,
+            "last_arxiv_id": self.last_arxiv_id,
+            "completed": self.completed,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    def __repr__(self):
+        return f"<SyncCheckpoint(key={self.key}, offset={self.offset}, completed={self.completed})>"
+
+
 class RecentResult(Base):
     __tablename__ = "recent_results"
+    __table_args__ = {"schema": CACHE_SCHEMA}
 
     id = Column(Integer, primary_key=True)
     days_back = Column(Integer, default=7)
@@ -59,6 +93,10 @@ class RecentResult(Base):
         return f"<RecentResult(id={self.id}, days_back={self.days_back}, count={self.total_count})>"
 
 
+# system_config 中的配置版本号，每次修改配置时加一（见 Database.set_configs）
+CONFIG_VERSION_KEY = "config_version"
+
+
 class SystemConfig(Base):
     __tablename__ = "system_config"
 
@@ -2,14 +2,24 @@
 增强搜索引擎 - 提供高级搜索和过滤功能
 """
 
+import re
+from copy import copy
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import and_, asc, desc, func, not_, or_
+from sqlalchemy import and_, asc, desc, func, literal_column, or_
 from sqlalchemy.orm import Session
 
-from arxiv_pulse.models import Paper
+from arxiv_pulse.models import (
+    PAPERS_FTS_COLUMNS,
+    ArchivedPaper,
+    Paper,
+    PaperAuthor,
+    PaperCategory,
+    normalize_author_name,
+    papers_fts,
+)
 from arxiv_pulse.utils import output
 
 
@@ -37,6 +47,7 @@ class SearchFilter:
     limit: int = 20
     offset: int = 0
 
+    # "relevance" 在全文索引可用时按 bm25 排序
     sort_by: str = "published"
     sort_order: str = "desc"
 
@@ -46,6 +57,13 @@ class SearchFilter:
     match_all: bool = False
     strict_match: bool = False
 
+    # 同时搜索归档库（archive.db），结果按发表时间与热库结果合并
+    include_archive: bool = False
+
+
+# bm25 列权重，顺序与 PAPERS_FTS_COLUMNS 一致: title, abstract, authors, keywords
+FTS_COLUMN_WEIGHTS = (10.0, 1.0, 2.0, 5.0)
+
 
 class SearchEngine:
     """增强的论文搜索引擎"""
@@ -53,6 +71,50 @@ class SearchEngine:
     def __init__(self, db_session: Session):
         self.session = db_session
 
+    @property
+    def fts_enabled(self) -> bool:
+        from arxiv_pulse.core import Database
+
+        bind = self.session.get_bind()
+        return Database.fts_enabled and bind.dialect.name == "sqlite"
+
+    def build_fts_query(self, query: str, search_fields: list[str], strict_match: bool = False) -> str | None:
+        """构建 FTS5 MATCH 表达式
+
+        - 引号内的内容作为短语匹配: "density functional"
+        - 以 * 结尾的词作为前缀匹配: magnet*
+        - 其余词：严格匹配时按完整词匹配，否则按前缀匹配（对应原来的 %word%）
+        所有词之间为 AND 关系。search_fields 包含 FTS 未索引的字段时返回 None。
+        """
+        if not query or not search_fields:
+            return None
+        if any(f not in PAPERS_FTS_COLUMNS for f in search_fields):
+            return None
+
+        terms = []
+        for phrase in re.findall(r'"([^"]+)"', query):
+            words = re.findall(r"\w+", phrase, flags=re.UNICODE)
+            if words:
+                terms.append('"' + " ".join(words) + '"')
+
+        remainder = re.sub(r'"[^"]*"', " ", query)
+        for token in re.findall(r"\w+\*?", remainder, flags=re.UNICODE):
+            word = token.rstrip("*")
+            if len(word) <= 1:
+                continue
+            if token.endswith("*") or not strict_match:
+                terms.append(f'"{word}"*')
+            else:
+                terms.append(f'"{word}"')
+
+        if not terms:
+            return None
+
+        expr = " AND ".join(terms)
+        if set(search_fields) != set(PAPERS_FTS_COLUMNS):
+            expr = "{" + " ".join(search_fields) + "} : (" + expr + ")"
+        return expr
+
     def build_text_filter(
         self, query: str, search_fields: list[str], match_all: bool = False, strict_match: bool = False
     ):
@@ -62,8 +124,6 @@ class SearchEngine:
 
         query_lower = query.lower()
 
-        import re
-
         words = re.split(r"[^\w]+", query_lower, flags=re.UNICODE)
         words = [w for w in words if w and len(w) > 1]
 
@@ -109,7 +169,7 @@ class SearchEngine:
                 elif field == "search_query":
                     field_filters.append(Paper.search_query.ilike(f"%{word}%"))
                 elif field == "authors":
-                    field_filters.append(Paper.authors.ilike(f"%{word}%"))
+                    field_filters.append(Paper.id.in_(PaperAuthor.paper_ids_by_author(word, exact=False)))
 
             if field_filters:
                 return or_(*field_filters)
@@ -126,7 +186,7 @@ class SearchEngine:
             elif field == "search_query":
                 phrase_filters.append(Paper.search_query.ilike(f"%{query_lower}%"))
             elif field == "authors":
-                phrase_filters.append(Paper.authors.ilike(f"%{query_lower}%"))
+                phrase_filters.append(Paper.id.in_(PaperAuthor.paper_ids_by_author(query_lower, exact=False)))
 
         sequence_filters = []
         if len(words) > 1:
@@ -140,8 +200,6 @@ class SearchEngine:
                     sequence_filters.append(Paper.categories.ilike(sequence_pattern))
                 elif field == "search_query":
                     sequence_filters.append(Paper.search_query.ilike(sequence_pattern))
-                elif field == "authors":
-                    sequence_filters.append(Paper.authors.ilike(sequence_pattern))
 
         word_and_filters = []
         for field in search_fields:
@@ -162,7 +220,7 @@ class SearchEngine:
                 if search_query_filters:
                     word_and_filters.append(and_(*search_query_filters))
             elif field == "authors":
-                author_filters = [Paper.authors.ilike(f"%{word}%") for word in words]
+                author_filters = [Paper.id.in_(PaperAuthor.paper_ids_by_author(word, exact=False)) for word in words]
                 if author_filters:
                     word_and_filters.append(and_(*author_filters))
 
@@ -194,18 +252,10 @@ class SearchEngine:
         filters = []
 
         if categories:
-            category_filters = []
-            for cat in categories:
-                category_filters.append(Paper.categories.contains(cat))
-            if category_filters:
-                filters.append(or_(*category_filters))
+            filters.append(Paper.id.in_(PaperCategory.paper_ids_matching(categories)))
 
         if exclude_categories:
-            exclude_filters = []
-            for cat in exclude_categories:
-                exclude_filters.append(not_(Paper.categories.contains(cat)))
-            if exclude_filters:
-                filters.append(and_(*exclude_filters))
+            filters.append(Paper.id.notin_(PaperCategory.paper_ids_matching(exclude_categories)))
 
         if primary_category:
             filters.append(Paper.primary_category == primary_category)
@@ -219,10 +269,10 @@ class SearchEngine:
 
         filters = []
         for author in authors:
-            if match_type == "exact":
-                filters.append(Paper.authors.contains(f'"name": "{author}"'))
-            else:
-                filters.append(Paper.authors.contains(author))
+            if not normalize_author_name(author):
+                continue
+            paper_ids = PaperAuthor.paper_ids_by_author(author, exact=match_type == "exact")
+            filters.append(Paper.id.in_(paper_ids))
 
         if not filters:
             return None
@@ -232,20 +282,24 @@ class SearchEngine:
         return and_(*filters)
 
     def build_date_filter(
-        self, date_from: datetime | None = None, date_to: datetime | None = None, days_back: int | None = None
+        self,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        days_back: int | None = None,
+        column=Paper.published,
     ):
         """构建时间过滤器"""
         filters = []
 
         if days_back:
             cutoff_date = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days_back)
-            filters.append(Paper.published >= cutoff_date)
+            filters.append(column >= cutoff_date)
 
         if date_from:
-            filters.append(Paper.published >= date_from)
+            filters.append(column >= date_from)
 
         if date_to:
-            filters.append(Paper.published <= date_to)
+            filters.append(column <= date_to)
 
         return and_(*filters) if filters else None
 
@@ -284,16 +338,26 @@ class SearchEngine:
             query = self.session.query(Paper)
 
             filters = []
+            fts_query = None
 
             if filter_config.query:
-                text_filter = self.build_text_filter(
-                    filter_config.query,
-                    filter_config.search_fields,
-                    filter_config.match_all,
-                    filter_config.strict_match,
-                )
-                if text_filter is not None:
-                    filters.append(text_filter)
+                if self.fts_enabled:
+                    fts_query = self.build_fts_query(
+                        filter_config.query, filter_config.search_fields, filter_config.strict_match
+                    )
+
+                if fts_query:
+                    query = query.join(papers_fts, papers_fts.c.rowid == Paper.id)
+                    filters.append(papers_fts.c.papers_fts.op("MATCH")(fts_query))
+                else:
+                    text_filter = self.build_text_filter(
+                        filter_config.query,
+                        filter_config.search_fields,
+                        filter_config.match_all,
+                        filter_config.strict_match,
+                    )
+                    if text_filter is not None:
+                        filters.append(text_filter)
 
             cat_filter = self.build_category_filter(
                 filter_config.categories, filter_config.exclude_categories, filter_config.primary_category
@@ -318,8 +382,14 @@ class SearchEngine:
             if filters:
                 query = query.filter(and_(*filters))
 
-            sort_column = self.get_sort_column(filter_config.sort_by, filter_config.sort_order)
-            query = query.order_by(sort_column)
+            if fts_query and filter_config.sort_by == "relevance":
+                # bm25 越小越相关
+                query = query.order_by(
+                    func.bm25(literal_column("papers_fts"), *FTS_COLUMN_WEIGHTS), desc(Paper.published)
+                )
+            else:
+                sort_column = self.get_sort_column(filter_config.sort_by, filter_config.sort_order)
+                query = query.order_by(sort_column)
 
             query = query.offset(filter_config.offset).limit(filter_config.limit)
 
@@ -334,8 +404,77 @@ class SearchEngine:
             output.debug(f"搜索失败详情: {traceback.format_exc()}")
             return []
 
+    def search_archive(self, filter_config: SearchFilter) -> list[ArchivedPaper]:
+        """在归档库中搜索
+
+        归档库没有全文索引和分类/作者索引，这里用 LIKE 匹配（查询词须全部出现），只在显式请求时使用。
+        """
+        filters = []
+
+        if filter_config.query:
+            query_lower = filter_config.query.lower()
+            words = [w for w in re.split(r"[^\w]+", query_lower, flags=re.UNICODE) if len(w) > 1] or [query_lower]
+            columns = [
+                getattr(ArchivedPaper, f)
+                for f in filter_config.search_fields
+                if f in ("title", "abstract", "categories", "search_query", "authors")
+            ]
+            if columns:
+                filters.extend(or_(*[c.ilike(f"%{word}%") for c in columns]) for word in words)
+
+        if filter_config.categories:
+            filters.append(ArchivedPaper.category_condition(filter_config.categories))
+        if filter_config.exclude_categories:
+            filters.append(~ArchivedPaper.category_condition(filter_config.exclude_categories))
+        if filter_config.primary_category:
+            filters.append(ArchivedPaper.primary_category == filter_config.primary_category)
+
+        author_filters = [ArchivedPaper.authors.ilike(f"%{a}%") for a in filter_config.authors or [] if a.strip()]
+        if author_filters:
+            filters.append(or_(*author_filters) if filter_config.author_match == "any" else and_(*author_filters))
+
+        date_filter = self.build_date_filter(
+            filter_config.date_from, filter_config.date_to, filter_config.days_back, column=ArchivedPaper.published
+        )
+        if date_filter is not None:
+            filters.append(date_filter)
+        if filter_config.summarized_only:
+            filters.append(ArchivedPaper.summarized == True)
+        if filter_config.downloaded_only:
+            filters.append(ArchivedPaper.downloaded == True)
+
+        order = asc if filter_config.sort_order == "asc" else desc
+        try:
+            return (
+                self.session.query(ArchivedPaper)
+                .filter(and_(*filters))
+                .order_by(order(ArchivedPaper.published))
+                .offset(filter_config.offset)
+                .limit(filter_config.limit)
+                .all()
+            )
+        except Exception as e:
+            output.error(f"归档库搜索失败: {e!s}")
+            return []
+
     def search_papers(self, filter_config: SearchFilter) -> list[Paper]:
-        """执行搜索并返回论文列表，支持严格匹配分级排序"""
+        """执行搜索并返回论文列表；include_archive 时并入归档库的结果
+
+        按发表时间排序时两边结果按时间合并，其他排序方式下归档结果排在热库结果之后。
+        """
+        if not filter_config.include_archive:
+            return self._search_hot_papers(filter_config)
+
+        window = copy(filter_config)
+        window.offset = 0
+        window.limit = filter_config.offset + filter_config.limit
+        papers = self._search_hot_papers(window) + self.search_archive(window)
+        if filter_config.sort_by == "published":
+            papers.sort(key=lambda p: p.published, reverse=filter_config.sort_order != "asc")
+        return papers[filter_config.offset : filter_config.offset + filter_config.limit]
+
+    def _search_hot_papers(self, filter_config: SearchFilter) -> list[Paper]:
+        """在热库中搜索，支持严格匹配分级排序"""
         try:
             if not filter_config.strict_match:
                 return self._search_papers_basic(filter_config)
@@ -343,9 +482,6 @@ class SearchEngine:
             if not filter_config.query:
                 return self._search_papers_basic(filter_config)
 
-            import re
-            from copy import copy
-
             fuzzy_config = copy(filter_config)
             fuzzy_config.strict_match = False
             fuzzy_config.limit = 1000000
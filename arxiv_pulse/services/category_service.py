@@ -1,9 +1,17 @@
 """
 Category service - 分类解释服务
+
+解释结果按分类字符串缓存：列表渲染时每篇论文都要解释一次分类，而不同的分类组合并不多。
 """
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 from arxiv_pulse.constants import get_all_categories
 
+CATEGORY_EXPLANATION_CACHE_SIZE = 4096
+
 _CATEGORY_NAMES = {
     "cs.AI": ("人工智能", "Artificial Intelligence"),
     "cs.CL": ("计算语言学", "Computation and Language"),
@@ -49,15 +57,16 @@ _CATEGORY_NAMES = {
 }
 
 
-def get_category_explanations(category_code: str) -> dict[str, str]:
+@lru_cache(maxsize=CATEGORY_EXPLANATION_CACHE_SIZE)
+def get_category_explanations(category_code: str) -> Mapping[str, str]:
     """
-    获取分类代码的中文和英文解释
+    获取分类代码的中文和英文解释（结果被缓存共享，只读）
 
     Returns:
         dict: {"zh": "中文 (英文)", "en": "英文"}
     """
     if not category_code:
-        return {"zh": "", "en": ""}
+        return MappingProxyType({"zh": "", "en": ""})
 
     categories = [c.strip() for c in category_code.split(",")]
     zh_parts = []
@@ -68,9 +77,10 @@ def get_category_explanations(category_code: str) -> dict[str, str]:
         zh_parts.append(zh_name)
         en_parts.append(en_name)
 
-    return {"zh": "; ".join(zh_parts), "en": "; ".join(en_parts)}
+    return MappingProxyType({"zh": "; ".join(zh_parts), "en": "; ".join(en_parts)})
 
 
+@lru_cache(maxsize=CATEGORY_EXPLANATION_CACHE_SIZE)
 def _get_single_category_names(cat: str) -> tuple[str, str]:
     """获取单个分类的中英文名称，返回 (中文名称, 英文名称)"""
     if cat in _CATEGORY_NAMES:
@@ -82,11 +92,10 @@ def _get_single_category_names(cat: str) -> tuple[str, str]:
         zh_main, en_main = _CATEGORY_NAMES[main_cat]
         return f"{cat} ({zh_main})", f"{cat} ({en_main})"
 
-    all_cats = get_all_categories()
-    if cat in all_cats:
-        info = all_cats[cat]
-        zh_name = info.get("name", cat)
-        en_name = info.get("name_en", cat)
+    info = get_all_categories().get(cat)
+    if info is not None:
+        zh_name = info["name"]
+        en_name = info["name_en"]
         return f"{zh_name} ({en_name})", en_name
 
     return cat, cat
@@ -0,0 +1,256 @@
+"""
+Corpus service - 论文库整体导出 / 导入（Parquet 或 Arrow IPC）
+
+导出把论文、分类、作者、论文集和归档论文逐表分块读出并写成列式文件（每表一个文件，外加 corpus.json 清单），
+整个导出在同一个读事务内完成，各表数据一致；导入把这些文件批量写入一个全新的数据目录：
+导入期间先删除 papers 等表上的触发器，写完后重建统计汇总表和全文索引，再恢复触发器。
+
+需要 pyarrow（pip install "arxiv-pulse[corpus]"）。
+"""
+
+import json
+import os
+import tempfile
+import zipfile
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, LargeBinary, Table, select, text
+from sqlalchemy.engine import Engine
+
+from arxiv_pulse.__version__ import __version__
+from arxiv_pulse.core import Database
+from arxiv_pulse.models import (
+    PAPERS_FTS_REBUILD,
+    STATS_REBUILD_SQL,
+    ArchivedPaper,
+    Author,
+    Collection,
+    CollectionPaper,
+    Paper,
+    PaperAuthor,
+    PaperCategory,
+    utcnow,
+)
+
+CorpusFormat = Literal["parquet", "arrow"]
+
+CORPUS_MANIFEST = "corpus.json"
+CORPUS_CHUNK_SIZE = 50_000
+CORPUS_SUFFIXES: dict[str, str] = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# 导出 / 导入的表，按导入顺序排列；缓存、配置（含 API Key）、对话和任务记录不导出
+CORPUS_TABLES: dict[str, Table] = {
+    "papers": Paper.__table__,
+    "paper_categories": PaperCategory.__table__,
+    "authors": Author.__table__,
+    "paper_authors": PaperAuthor.__table__,
+    "collections": Collection.__table__,
+    "collection_papers": CollectionPaper.__table__,
+    "archived_papers": ArchivedPaper.__table__,
+}
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ModuleNotFoundError as e:
+        raise RuntimeError('论文库导出/导入需要 pyarrow: pip install "arxiv-pulse[corpus]"') from e
+    return pa
+
+
+def arrow_schema(table: Table):
+    """按 SQLAlchemy 列类型生成 Arrow schema，各分块类型一致，不依赖逐块推断"""
+    pa = _pyarrow()
+    fields = []
+    for column in table.columns:
+        column_type = column.type
+        if isinstance(column_type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(column_type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column_type, Float):
+            arrow_type = pa.float64()
+        elif isinstance(column_type, DateTime):
+            arrow_type = pa.timestamp("us")
+        elif isinstance(column_type, Date):
+            arrow_type = pa.date32()
+        elif isinstance(column_type, LargeBinary):
+            arrow_type = pa.binary()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable or column.primary_key))
+    return pa.schema(fields)
+
+
+def _iter_batches(conn, table: Table, schema, chunk_size: int) -> Iterator:
+    pa = _pyarrow()
+    result = conn.execution_options(yield_per=chunk_size).execute(select(table))
+    for rows in result.partitions():
+        columns = list(zip(*rows, strict=True))
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema, strict=True)], schema=schema
+        )
+
+
+class _BatchWriter:
+    """Parquet 与 Arrow IPC 两种格式统一的分块写入"""
+
+    def __init__(self, path: Path, schema, fmt: CorpusFormat):
+        pa = _pyarrow()
+        if fmt == "parquet":
+            self._writer = pa.parquet.ParquetWriter(path, schema, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_file(path, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+
+    def write(self, batch) -> None:
+        if hasattr(self._writer, "write_batch"):
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _read_batches(path: Path, fmt: CorpusFormat, chunk_size: int) -> Iterator:
+    pa = _pyarrow()
+    if fmt == "parquet":
+        yield from pa.parquet.ParquetFile(path).iter_batches(batch_size=chunk_size)
+        return
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+
+
+def export_corpus(
+    engine: Engine,
+    output_dir: str | os.PathLike,
+    fmt: CorpusFormat = "parquet",
+    chunk_size: int = CORPUS_CHUNK_SIZE,
+    progress: Callable[[str, int], None] | None = None,
+) -> dict[str, Any]:
+    """把论文库逐表分块导出到 output_dir，返回写入的清单（同时保存为 corpus.json）"""
+    if fmt not in CORPUS_SUFFIXES:
+        raise ValueError(f"不支持的格式: {fmt}")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    tables = {}
+    with engine.connect() as conn, conn.begin():
+        for name, table in CORPUS_TABLES.items():
+            schema = arrow_schema(table)
+            filename = f"{name}{CORPUS_SUFFIXES[fmt]}"
+            writer = _BatchWriter(output_dir / filename, schema, fmt)
+            rows = 0
+            try:
+                for batch in _iter_batches(conn, table, schema, chunk_size):
+                    writer.write(batch)
+                    rows += batch.num_rows
+                    if progress:
+                        progress(name, rows)
+            finally:
+                writer.close()
+            tables[name] = {"file": filename, "rows": rows}
+
+        schema_version = conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")).scalar()
+
+    manifest = {
+        "format": fmt,
+        "app_version": __version__,
+        "schema_version": schema_version,
+        "exported_at": utcnow().isoformat(),
+        "tables": tables,
+    }
+    (output_dir / CORPUS_MANIFEST).write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return manifest
+
+
+def zip_corpus(corpus_dir: str | os.PathLike, zip_path: str | os.PathLike) -> None:
+    """把导出目录打成 zip（列式文件已压缩，直接存储）"""
+    corpus_dir = Path(corpus_dir)
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        for path in sorted(corpus_dir.iterdir()):
+            archive.write(path, path.name)
+
+
+def _table_triggers(conn, tables: list[Table]) -> list[tuple[str, str]]:
+    """主库中这些表上的触发器：(触发器名, 建触发器 SQL)"""
+    names = [table.name for table in tables if table.schema is None]
+    rows = conn.execute(
+        text("SELECT name, tbl_name, sql FROM main.sqlite_master WHERE type = 'trigger' ORDER BY name")
+    ).all()
+    return [(name, sql) for name, tbl_name, sql in rows if tbl_name in names]
+
+
+def import_corpus(
+    engine: Engine,
+    source: str | os.PathLike,
+    chunk_size: int = CORPUS_CHUNK_SIZE,
+    progress: Callable[[str, int], None] | None = None,
+) -> dict[str, int]:
+    """把 export_corpus 导出的目录（或其 zip）导入到空数据库，返回各表导入的行数
+
+    整个导入在一个事务内完成，失败时数据库保持原样。
+    """
+    source = Path(source)
+    if zipfile.is_zipfile(source):
+        with tempfile.TemporaryDirectory() as tmp:
+            with zipfile.ZipFile(source) as archive:
+                archive.extractall(tmp)
+            return import_corpus(engine, tmp, chunk_size, progress)
+
+    manifest_path = source / CORPUS_MANIFEST
+    if not manifest_path.exists():
+        raise ValueError(f"{source} 中没有 {CORPUS_MANIFEST}，不是论文库导出目录")
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    fmt = manifest["format"]
+
+    counts = {}
+    # pysqlite 不会在 DDL 前自动 BEGIN，这里显式开启事务，让删除/恢复触发器也在同一事务内
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            for name in ("papers", "collections", "archived_papers"):
+                if conn.execute(select(CORPUS_TABLES[name]).limit(1)).first() is not None:
+                    raise ValueError("目标数据库中已有论文或论文集，只能导入到新的数据目录")
+
+            tables = [CORPUS_TABLES[name] for name in manifest["tables"] if name in CORPUS_TABLES]
+            triggers = _table_triggers(conn, tables)
+            for name, _ in triggers:
+                conn.execute(text(f"DROP TRIGGER main.{name}"))
+
+            for name, entry in manifest["tables"].items():
+                table = CORPUS_TABLES.get(name)
+                if table is None:
+                    continue
+                rows = 0
+                for batch in _read_batches(source / entry["file"], fmt, chunk_size):
+                    if not batch.num_rows:
+                        continue
+                    # 只导入两边都有的列，兼容其他版本导出的文件
+                    batch = batch.select([c for c in batch.schema.names if c in table.columns])
+                    conn.execute(table.insert(), batch.to_pylist())
+                    rows += batch.num_rows
+                    if progress:
+                        progress(name, rows)
+                counts[name] = rows
+
+            for _, sql in triggers:
+                conn.execute(text(sql))
+            for statement in STATS_REBUILD_SQL:
+                conn.execute(text(statement))
+            if conn.execute(text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'papers_fts'")).first():
+                for statement in PAPERS_FTS_REBUILD:
+                    conn.execute(text(statement))
+        except BaseException:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+        conn.exec_driver_sql("COMMIT")
+
+    Database.papers_changed()
+    return counts
@@ -18,12 +18,18 @@ _figure_cache: dict[str, str] = {}
 def get_figure_url_cached(arxiv_id: str, session) -> str | None:
     """获取缓存的图片URL"""
     figure = session.query(FigureCache).filter_by(arxiv_id=arxiv_id).first()
-    return figure.figure_url if figure else None
+    if figure is None:
+        return None
+    Database().touch_cache("figures", [arxiv_id])
+    url: str = figure.figure_url
+    return url
 
 
 def fetch_and_cache_figure(arxiv_id: str, use_cache: bool = True) -> str | None:
-    """获取论文图片并缓存到数据库"""
-    return get_first_figure_url(arxiv_id, use_cache=use_cache)
+    """获取论文图片并缓存到数据库（等待缓存写入落库，调用方随后会从数据库读回）"""
+    figure_url = get_first_figure_url(arxiv_id, use_cache=use_cache)
+    Database().flush_writes()
+    return figure_url
 
 
 def get_first_figure_url(arxiv_id: str, use_cache: bool = True) -> str | None:
@@ -2,11 +2,13 @@
 Paper service - 论文数据处理和增强
 """
 
+import asyncio
 import json
+from collections.abc import Iterator
 from typing import Any
 
 from arxiv_pulse.core import Config
-from arxiv_pulse.models import CollectionPaper, FigureCache, Paper
+from arxiv_pulse.models import CollectionPaper, FigureCache, Paper, PaperCard
 from arxiv_pulse.services.category_service import get_category_explanations
 from arxiv_pulse.services.figure_service import get_figure_url_cached
 
@@ -35,7 +37,7 @@ def summarize_and_cache_paper(paper: Paper) -> bool:
 
 def enhance_paper_data(paper: Paper, session=None, translation_service=None, lang: str | None = None) -> dict[str, Any]:
     """增强论文数据，添加翻译、关键发现、图片等"""
-    from arxiv_pulse.services.translation_service import translate_text
+    from arxiv_pulse.services.translation_service import translate_text, warm_translation_cache
     from arxiv_pulse.web.dependencies import get_db
 
     data = paper.to_dict()
@@ -65,6 +67,7 @@ def enhance_paper_data(paper: Paper, session=None, translation_service=None, lan
         data["methodology"] = ""
         data["keywords"] = []
 
+    warm_translation_cache([paper.title, paper.abstract], Config.TRANSLATE_LANGUAGE)
     data["title_translation"] = translate_text(paper.title, Config.TRANSLATE_LANGUAGE)
     data["abstract_translation"] = translate_text(paper.abstract, Config.TRANSLATE_LANGUAGE) if paper.abstract else ""
 
@@ -79,5 +82,75 @@ def enhance_paper_data(paper: Paper, session=None, translation_service=None, lan
             data["figure_url"] = figure.figure_url if figure else None
             collection_ids = [cp.collection_id for cp in s.query(CollectionPaper).filter_by(paper_id=paper.id).all()]
             data["collection_ids"] = collection_ids
+    if figure:
+        get_db().touch_cache("figures", [paper.arxiv_id])
 
     return data
+
+
+def enhance_papers(papers: list[Paper]) -> list[dict[str, Any]]:
+    """批量增强论文数据，先一次性预热整批标题和摘要的翻译缓存"""
+    from arxiv_pulse.services.translation_service import warm_translation_cache
+
+    warm_translation_cache([text for p in papers for text in (p.title, p.abstract)], Config.TRANSLATE_LANGUAGE)
+    return [enhance_paper_data(p) for p in papers]
+
+
+async def enhance_papers_async(papers: list[Paper]) -> list[dict[str, Any]]:
+    """在线程池中批量增强论文数据（翻译、图片等为同步调用），不阻塞事件循环"""
+    if not papers:
+        return []
+    return await asyncio.to_thread(enhance_papers, papers)
+
+
+def iter_paper_cards(cards: list[PaperCard], session) -> Iterator[dict[str, Any]]:
+    """逐张生成列表卡片数据；图片、论文集归属和翻译缓存对整页各查询一次，而不是每篇论文一次"""
+    from arxiv_pulse.services.translation_service import translate_text, warm_translation_cache
+    from arxiv_pulse.web.dependencies import get_db
+
+    arxiv_ids = [card.arxiv_id for card in cards]
+    figures = dict(
+        session.query(FigureCache.arxiv_id, FigureCache.figure_url).filter(FigureCache.arxiv_id.in_(arxiv_ids)).all()
+    )
+    get_db().touch_cache("figures", figures)
+    collection_ids: dict[int, list[int]] = {}
+    rows = session.query(CollectionPaper.paper_id, CollectionPaper.collection_id).filter(
+        CollectionPaper.paper_id.in_([card.id for card in cards])
+    )
+    for paper_id, collection_id in rows:
+        collection_ids.setdefault(paper_id, []).append(collection_id)
+
+    translate_language = Config.TRANSLATE_LANGUAGE
+    warm_translation_cache([text for card in cards for text in (card.title, card.abstract)], translate_language)
+
+    ai_available = bool(Config.AI_API_KEY)
+    for card in cards:
+        data = card.to_dict()
+        cat_explanations = get_category_explanations(card.categories or "")
+        data["category_explanation_zh"] = cat_explanations["zh"]
+        data["category_explanation_en"] = cat_explanations["en"]
+        data["ai_available"] = ai_available
+        data["title_translation"] = translate_text(card.title, translate_language)
+        data["abstract_translation"] = translate_text(card.abstract, translate_language) if card.abstract else ""
+        data["figure_url"] = figures.get(card.arxiv_id)
+        data["collection_ids"] = collection_ids.get(card.id, [])
+        yield data
+
+
+def enhance_paper_cards(cards: list[PaperCard], session=None) -> list[dict[str, Any]]:
+    """增强列表卡片数据（只含卡片字段，详情页仍用 enhance_paper_data）"""
+    from arxiv_pulse.web.dependencies import get_db
+
+    if not cards:
+        return []
+    if session:
+        return list(iter_paper_cards(cards, session))
+    with get_db().get_session() as s:
+        return list(iter_paper_cards(cards, s))
+
+
+async def enhance_paper_cards_async(cards: list[PaperCard]) -> list[dict[str, Any]]:
+    """在线程池中增强列表卡片数据，不阻塞事件循环"""
+    if not cards:
+        return []
+    return await asyncio.to_thread(enhance_paper_cards, cards)
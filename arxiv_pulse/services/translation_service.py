@@ -3,10 +3,89 @@ Translation service - 文本翻译服务
 """
 
 import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 
 from arxiv_pulse.core import Config
+from arxiv_pulse.core.database import translation_cache_key
 from arxiv_pulse.web.dependencies import get_db
 
+TRANSLATION_LRU_SIZE = 4096
+
+
+class TranslationLRU:
+    """翻译缓存的进程内 LRU 层，位于 TranslationCache 表之前
+
+    键为 translation_cache_key(原文, 语言)。批量预热时库中没有的键记为未命中，
+    MISS_TTL 秒内不再逐条查库；不永久记住未命中，因为其他进程（CLI）可能随后写入译文。
+    """
+
+    MISS_TTL = 60.0
+
+    def __init__(self, maxsize: int = TRANSLATION_LRU_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, str | float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[bool, str | None]:
+        """返回 (是否命中, 译文)；命中但译文为 None 表示近期确认库中没有"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                return False, None
+            if isinstance(value, float):
+                if value < time.monotonic():
+                    del self._entries[key]
+                    return False, None
+                return True, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def put(self, key: str, translated_text: str) -> None:
+        self._store(key, translated_text)
+
+    def put_miss(self, key: str) -> None:
+        self._store(key, time.monotonic() + self.MISS_TTL)
+
+    def _store(self, key: str, value: str | float) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+translation_lru = TranslationLRU()
+
+
+def _needs_translation(text: str | None, target_lang: str) -> bool:
+    return bool(text and text.strip()) and target_lang != "en"
+
+
+def warm_translation_cache(texts: Iterable[str | None], target_lang: str = "zh") -> None:
+    """一次 IN (...) 查询把一整页文本的翻译缓存装入 LRU，之后逐条 translate_text 不再查库"""
+    keys = {}
+    for text in texts:
+        if text is not None and _needs_translation(text, target_lang):
+            key = translation_cache_key(text, target_lang)
+            if not translation_lru.get(key)[0]:
+                keys[key] = text
+    if not keys:
+        return
+
+    found = get_db().get_translation_cache_many(keys.values(), target_lang)
+    for key, text in keys.items():
+        if text in found:
+            translation_lru.put(key, found[text])
+        else:
+            translation_lru.put_miss(key)
+
 
 def _is_valid_translation(text: str, original: str) -> bool:
     """验证翻译结果是否有效"""
@@ -38,15 +117,20 @@ def _is_valid_translation(text: str, original: str) -> bool:
 
 def translate_text(text: str, target_lang: str = "zh") -> str:
     """使用AI API翻译文本，优先使用缓存"""
-    if not text or not text.strip():
-        return ""
-
-    if target_lang == "en":
+    if not _needs_translation(text, target_lang):
         return ""
 
     db = get_db()
 
-    cached_translation = db.get_translation_cache(text, target_lang)
+    key = translation_cache_key(text, target_lang)
+    found, cached_translation = translation_lru.get(key)
+    if found and cached_translation:
+        # LRU 命中不经过数据库，同样记下访问，否则常用译文的 accessed_at 不更新，会被当作闲置缓存淘汰
+        db.touch_cache("translations", [key])
+    if not found:
+        cached_translation = db.get_translation_cache(text, target_lang)
+        if cached_translation:
+            translation_lru.put(key, cached_translation)
     if cached_translation:
         return cached_translation
 
@@ -77,6 +161,7 @@ def translate_text(text: str, target_lang: str = "zh") -> str:
         translated = response.choices[0].message.content or ""
         if translated and not translated.startswith("*") and _is_valid_translation(translated, text):
             db.set_translation_cache(text, translated, target_lang)
+            translation_lru.put(key, translated)
             return translated
         return ""
     except Exception:
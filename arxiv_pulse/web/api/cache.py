@@ -4,9 +4,10 @@ Cache API Router
 
 from typing import Literal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
+from arxiv_pulse.core.maintenance import MAINTENANCE_JOBS
 from arxiv_pulse.web.dependencies import get_db
 
 router = APIRouter(prefix="/cache", tags=["cache"])
@@ -14,6 +15,11 @@ router = APIRouter(prefix="/cache", tags=["cache"])
 
 class ClearCacheRequest(BaseModel):
     cache_type: Literal["translations", "summaries", "figures", "contents", "all"]
+    include_recent: bool = False  # "all" 时是否也清空最近论文列表
+
+
+class MaintenanceRequest(BaseModel):
+    jobs: list[str] | None = None
 
 
 @router.get("/stats")
@@ -26,19 +32,53 @@ async def get_cache_stats():
 @router.post("/clear")
 async def clear_cache(request: ClearCacheRequest):
     """清理缓存"""
+    from arxiv_pulse.services.translation_service import translation_lru
+
     db = get_db()
     results = {}
 
-    if request.cache_type == "translations" or request.cache_type == "all":
+    if request.cache_type == "all":
+        # 所有派生缓存都在 cache.db 中，整库重建比逐表 DELETE 快得多
+        results.update(db.reset_cache_database(include_recent=request.include_recent))
+        results["summaries"] = db.clear_all_summaries()
+        translation_lru.clear()
+        return {"success": True, "cleared": results}
+
+    if request.cache_type == "translations":
         results["translations"] = db.clear_all_translation_cache()
+        translation_lru.clear()
 
-    if request.cache_type == "summaries" or request.cache_type == "all":
+    if request.cache_type == "summaries":
         results["summaries"] = db.clear_all_summaries()
 
-    if request.cache_type == "figures" or request.cache_type == "all":
+    if request.cache_type == "figures":
         results["figures"] = db.clear_all_figure_cache()
 
-    if request.cache_type == "contents" or request.cache_type == "all":
+    if request.cache_type == "contents":
         results["contents"] = db.clear_all_content_cache()
 
     return {"success": True, "cleared": results}
+
+
+@router.get("/maintenance")
+async def get_maintenance(request: Request):
+    """获取维护任务计划与最近的维护报告"""
+    scheduler = request.app.state.maintenance
+    return {
+        "jobs": [
+            {"name": job.name, "interval": job.interval, "last_run": scheduler.last_run.get(job.name)}
+            for job in MAINTENANCE_JOBS
+        ],
+        "reports": [report.to_dict() for report in scheduler.reports],
+    }
+
+
+@router.post("/maintenance/run")
+async def run_maintenance(request: Request, body: MaintenanceRequest | None = None):
+    """立即执行维护任务（未指定时执行全部）"""
+    jobs = body.jobs if body else None
+    known = {job.name for job in MAINTENANCE_JOBS}
+    if jobs is not None and (unknown := set(jobs) - known):
+        raise HTTPException(status_code=400, detail=f"Unknown maintenance jobs: {', '.join(sorted(unknown))}")
+    report = await request.app.state.maintenance.run(jobs)
+    return report.to_dict()
@@ -11,14 +11,10 @@ from datetime import UTC, datetime
 import requests
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import select
 
 from arxiv_pulse.core import Config
-from arxiv_pulse.models import (
-    ChatMessage,
-    ChatSession,
-    Paper,
-    PaperContentCache,
-)
+from arxiv_pulse.models import ChatMessage, ChatSession, Paper
 from arxiv_pulse.utils import sse_event, sse_response
 from arxiv_pulse.web.dependencies import get_db
 
@@ -38,9 +34,9 @@ class RenameSessionRequest(BaseModel):
 @router.get("/sessions")
 async def list_sessions():
     """获取对话会话列表"""
-    with get_db().get_session() as session:
-        sessions = session.query(ChatSession).order_by(ChatSession.updated_at.desc()).all()
-        return [s.to_dict() for s in sessions]
+    async with get_db().get_async_session() as session:
+        sessions = (await session.scalars(select(ChatSession).order_by(ChatSession.updated_at.desc()))).all()
+    return [s.to_dict() for s in sessions]
 
 
 @router.post("/sessions")
@@ -57,19 +53,21 @@ async def create_session():
 @router.get("/sessions/{session_id}")
 async def get_session(session_id: int):
     """获取对话会话详情"""
-    with get_db().get_session() as session:
-        chat_session = session.query(ChatSession).filter_by(id=session_id).first()
+    async with get_db().get_async_session() as session:
+        chat_session = await session.get(ChatSession, session_id)
         if not chat_session:
             raise HTTPException(status_code=404, detail="Session not found")
 
         messages = (
-            session.query(ChatMessage).filter_by(session_id=session_id).order_by(ChatMessage.created_at.asc()).all()
-        )
+            await session.scalars(
+                select(ChatMessage).where(ChatMessage.session_id == session_id).order_by(ChatMessage.created_at.asc())
+            )
+        ).all()
 
-        return {
-            "session": chat_session.to_dict(),
-            "messages": [m.to_dict() for m in messages],
-        }
+    return {
+        "session": chat_session.to_dict(),
+        "messages": [m.to_dict() for m in messages],
+    }
 
 
 @router.delete("/sessions/{session_id}")
@@ -193,23 +191,19 @@ async def send_message(session_id: int, data: SendMessageRequest):
                 )
                 await asyncio.sleep(0.2)
 
-                content = None
                 text_length = 0
-
-                with get_db().get_session() as session:
-                    cache = session.query(PaperContentCache).filter_by(arxiv_id=arxiv_id).first()
-                    if cache and cache.full_text:
-                        content = cache.full_text if isinstance(cache.full_text, str) else str(cache.full_text)
-                        text_length = len(content)
-                        yield sse_event(
-                            "progress",
-                            {
-                                "stage": "cached",
-                                "arxiv_id": arxiv_id,
-                                "message": m["cached"](arxiv_id, text_length),
-                            },
-                        )
-                        await asyncio.sleep(0.2)
+                content = get_db().get_paper_content(arxiv_id)
+                if content:
+                    text_length = len(content)
+                    yield sse_event(
+                        "progress",
+                        {
+                            "stage": "cached",
+                            "arxiv_id": arxiv_id,
+                            "message": m["cached"](arxiv_id, text_length),
+                        },
+                    )
+                    await asyncio.sleep(0.2)
 
                 if not content:
                     pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
@@ -277,10 +271,7 @@ async def send_message(session_id: int, data: SendMessageRequest):
                                 )
                                 await asyncio.sleep(0.2)
 
-                                with get_db().get_session() as session:
-                                    cache = PaperContentCache(arxiv_id=arxiv_id, full_text=content)
-                                    session.add(cache)
-                                    session.commit()
+                                get_db().set_paper_content(arxiv_id, content)
                             finally:
                                 if os.path.exists(tmp_path):
                                     os.unlink(tmp_path)
@@ -402,7 +393,15 @@ IMPORTANT: Always respond in English."""
 
 @router.get("/papers/{arxiv_id}/content")
 async def get_paper_content_api(arxiv_id: str):
-    """获取论文 PDF 内容"""
+    """获取论文 PDF 内容（优先读取正文缓存）"""
+    cached = await asyncio.to_thread(get_db().get_paper_content, arxiv_id)
+    if cached:
+        return {
+            "arxiv_id": arxiv_id,
+            "content": cached[:5000] + "..." if len(cached) > 5000 else cached,
+            "full_length": len(cached),
+        }
+
     pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
 
     try:
@@ -424,11 +423,7 @@ async def get_paper_content_api(arxiv_id: str):
             doc.close()
 
             content = full_text.strip()
-
-            with get_db().get_session() as session:
-                cache = PaperContentCache(arxiv_id=arxiv_id, full_text=content)
-                session.add(cache)
-                session.commit()
+            get_db().set_paper_content(arxiv_id, content)
 
             return {
                 "arxiv_id": arxiv_id,
@@ -7,19 +7,93 @@ from datetime import UTC, datetime
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, field_validator
+from sqlalchemy import ColumnElement, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from arxiv_pulse.models import Collection, CollectionPaper, Paper
-from arxiv_pulse.services.paper_service import enhance_paper_data
+from arxiv_pulse.models import Collection, CollectionPaper, CollectionStat, Paper, PaperCard
+from arxiv_pulse.services.paper_service import enhance_paper_cards_async, enhance_paper_data
 from arxiv_pulse.web.dependencies import get_db
+from arxiv_pulse.web.pagination import keyset_page, keyset_query
 
 router = APIRouter()
 
 
-def refresh_stats_cache():
-    """Refresh stats cache after collection changes"""
-    from arxiv_pulse.web.api.stats import update_stats_cache
+def total_pages(total_count: int | None, page_size: int) -> int | None:
+    if total_count is None:
+        return None
+    return (total_count + page_size - 1) // page_size if total_count > 0 else 1
 
-    update_stats_cache()
+
+async def load_collection_papers(
+    session: AsyncSession,
+    collection_id: int,
+    page: int,
+    page_size: int,
+    search: str | None,
+    sort_by: str,
+    sort_order: str,
+    after: str | None = None,
+    before: str | None = None,
+    with_total: bool = True,
+) -> dict:
+    """查询论文集中的论文（搜索、排序、分页都在 SQL 中完成）
+
+    传入 after / before 游标时按 (排序列, CollectionPaper.id) 做 keyset 分页，否则按 page 偏移。
+
+    Returns:
+        {"papers": [...], "total_count": int | None, "has_more": bool, "next_cursor": ..., "prev_cursor": ...}
+    """
+    query = (
+        PaperCard.query(CollectionPaper)
+        .select_from(CollectionPaper)
+        .join(Paper, Paper.id == CollectionPaper.paper_id)
+        .where(CollectionPaper.collection_id == collection_id)
+    )
+
+    if search:
+        query = query.where(
+            or_(
+                Paper.title.contains(search, autoescape=True),
+                Paper.authors.contains(search, autoescape=True),
+                Paper.summary.contains(search, autoescape=True),
+            )
+        )
+
+    by_published = sort_by == "published"
+    sort_column: ColumnElement = Paper.published if by_published else CollectionPaper.added_at
+    descending = sort_order == "desc"
+
+    total_count = None
+    if with_total:
+        total_count = await session.scalar(select(func.count()).select_from(query.subquery()))
+
+    if page > 1 and not (after or before):
+        order = (sort_column.desc(), CollectionPaper.id.desc()) if descending else (sort_column, CollectionPaper.id)
+        page_query = query.order_by(*order).offset((page - 1) * page_size).limit(page_size + 1)
+    else:
+        page_query = keyset_query(
+            query, sort_column, CollectionPaper.id, page_size, after=after, before=before, descending=descending
+        )
+    rows = (await session.execute(page_query)).all()
+
+    result = keyset_page(
+        rows,
+        page_size,
+        lambda row: (row.published if by_published else row.CollectionPaper.added_at, row.CollectionPaper.id),
+        after=after,
+        before=before,
+    )
+    papers = await enhance_paper_cards_async([PaperCard.from_row(row) for row in result["items"]])
+    for paper_data, row in zip(papers, result["items"]):
+        paper_data["collection_info"] = row.CollectionPaper.to_dict()
+
+    return {
+        "papers": papers,
+        "total_count": total_count,
+        "has_more": result["has_more"],
+        "next_cursor": result["next_cursor"],
+        "prev_cursor": result["prev_cursor"],
+    }
 
 
 class CollectionCreate(BaseModel):
@@ -63,15 +137,20 @@ class UpdateCollectionPaper(BaseModel):
 @router.get("")
 async def list_collections():
     """List all collections"""
-    with get_db().get_session() as session:
-        collections = session.query(Collection).order_by(Collection.sort_order, Collection.created_at.desc()).all()
-        result = []
-        for c in collections:
-            paper_count = session.query(CollectionPaper).filter_by(collection_id=c.id).count()
-            data = c.to_dict()
-            data["paper_count"] = paper_count
-            result.append(data)
-        return result
+    async with get_db().get_async_session() as session:
+        collections = (
+            await session.scalars(select(Collection).order_by(Collection.sort_order, Collection.created_at.desc()))
+        ).all()
+        paper_counts = dict(
+            (await session.execute(select(CollectionStat.collection_id, CollectionStat.paper_count))).all()
+        )
+
+    result = []
+    for c in collections:
+        data = c.to_dict()
+        data["paper_count"] = paper_counts.get(c.id, 0)
+        result.append(data)
+    return result
 
 
 @router.post("")
@@ -91,7 +170,6 @@ async def create_collection(data: CollectionCreate):
         session.add(collection)
         session.commit()
         session.refresh(collection)
-        refresh_stats_cache()
         return collection.to_dict()
 
 
@@ -103,65 +181,25 @@ async def get_collection(
     search: str | None = Query(None),
     sort_by: str = Query("published"),
     sort_order: str = Query("desc"),
+    after: str | None = Query(None),
+    before: str | None = Query(None),
+    with_total: bool = Query(True),
 ):
     """Get collection by ID with papers (paginated, searchable, sortable)"""
-    with get_db().get_session() as session:
-        collection = session.query(Collection).filter_by(id=collection_id).first()
+    async with get_db().get_async_session() as session:
+        collection = await session.get(Collection, collection_id)
         if not collection:
             raise HTTPException(status_code=404, detail="Collection not found")
+        page_data = await load_collection_papers(
+            session, collection_id, page, page_size, search, sort_by, sort_order, after, before, with_total
+        )
 
-        # Base query
-        query = session.query(CollectionPaper).filter_by(collection_id=collection_id)
-
-        # Get all collection papers first for search
-        all_cp = query.all()
-
-        # Filter by search keyword
-        if search:
-            search_lower = search.lower()
-            filtered_cp = []
-            for cp in all_cp:
-                paper = session.query(Paper).filter_by(id=cp.paper_id).first()
-                if paper:
-                    title = (paper.title or "").lower()
-                    authors = (paper.authors or "").lower()
-                    summary = (paper.summary or "").lower()
-                    if search_lower in title or search_lower in authors or search_lower in summary:
-                        filtered_cp.append(cp)
-            all_cp = filtered_cp
-
-        # Sort
-        def get_sort_key(cp):
-            paper = session.query(Paper).filter_by(id=cp.paper_id).first()
-            if sort_by == "published":
-                return paper.published if paper and paper.published else datetime.min.replace(tzinfo=None)
-            else:
-                return cp.added_at or datetime.min.replace(tzinfo=None)
-
-        all_cp.sort(key=get_sort_key, reverse=(sort_order == "desc"))
-
-        # Get total count
-        total_count = len(all_cp)
-
-        # Paginate
-        offset = (page - 1) * page_size
-        paginated_cp = all_cp[offset : offset + page_size]
-
-        papers = []
-        for cp in paginated_cp:
-            paper = session.query(Paper).filter_by(id=cp.paper_id).first()
-            if paper:
-                paper_data = enhance_paper_data(paper)
-                paper_data["collection_info"] = cp.to_dict()
-                papers.append(paper_data)
-
-        result = collection.to_dict()
-        result["papers"] = papers
-        result["total_count"] = total_count
-        result["page"] = page
-        result["page_size"] = page_size
-        result["total_pages"] = (total_count + page_size - 1) // page_size if total_count > 0 else 1
-        return result
+    result = collection.to_dict()
+    result.update(page_data)
+    result["page"] = page
+    result["page_size"] = page_size
+    result["total_pages"] = total_pages(page_data["total_count"], page_size)
+    return result
 
 
 @router.put("/{collection_id}")
@@ -203,7 +241,6 @@ async def delete_collection(collection_id: int):
         session.query(CollectionPaper).filter_by(collection_id=collection_id).delete()
         session.delete(collection)
         session.commit()
-        refresh_stats_cache()
         return {"message": "Collection deleted"}
 
 
@@ -215,65 +252,24 @@ async def get_collection_papers(
     search: str | None = Query(None),
     sort_by: str = Query("published"),
     sort_order: str = Query("desc"),
+    after: str | None = Query(None),
+    before: str | None = Query(None),
+    with_total: bool = Query(True),
 ):
     """Get papers in a collection (paginated, searchable, sortable)"""
-    with get_db().get_session() as session:
-        collection = session.query(Collection).filter_by(id=collection_id).first()
-        if not collection:
+    async with get_db().get_async_session() as session:
+        if not await session.get(Collection, collection_id):
             raise HTTPException(status_code=404, detail="Collection not found")
+        page_data = await load_collection_papers(
+            session, collection_id, page, page_size, search, sort_by, sort_order, after, before, with_total
+        )
 
-        # Base query
-        query = session.query(CollectionPaper).filter_by(collection_id=collection_id)
-
-        # Get all collection papers first for search
-        all_cp = query.all()
-
-        # Filter by search keyword
-        if search:
-            search_lower = search.lower()
-            filtered_cp = []
-            for cp in all_cp:
-                paper = session.query(Paper).filter_by(id=cp.paper_id).first()
-                if paper:
-                    title = (paper.title or "").lower()
-                    authors = (paper.authors or "").lower()
-                    summary = (paper.summary or "").lower()
-                    if search_lower in title or search_lower in authors or search_lower in summary:
-                        filtered_cp.append(cp)
-            all_cp = filtered_cp
-
-        # Sort
-        def get_sort_key(cp):
-            paper = session.query(Paper).filter_by(id=cp.paper_id).first()
-            if sort_by == "published":
-                return paper.published if paper and paper.published else datetime.min.replace(tzinfo=None)
-            else:
-                return cp.added_at or datetime.min.replace(tzinfo=None)
-
-        all_cp.sort(key=get_sort_key, reverse=(sort_order == "desc"))
-
-        # Get total count
-        total_count = len(all_cp)
-
-        # Paginate
-        offset = (page - 1) * page_size
-        paginated_cp = all_cp[offset : offset + page_size]
-
-        papers = []
-        for cp in paginated_cp:
-            paper = session.query(Paper).filter_by(id=cp.paper_id).first()
-            if paper:
-                paper_data = enhance_paper_data(paper)
-                paper_data["collection_info"] = cp.to_dict()
-                papers.append(paper_data)
-
-        return {
-            "papers": papers,
-            "total_count": total_count,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total_count + page_size - 1) // page_size if total_count > 0 else 1,
-        }
+    return {
+        **page_data,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages(page_data["total_count"], page_size),
+    }
 
 
 @router.post("/{collection_id}/papers")
@@ -301,7 +297,6 @@ async def add_paper_to_collection(collection_id: int, data: AddPaperToCollection
         session.add(cp)
         collection.updated_at = datetime.now(UTC).replace(tzinfo=None)
         session.commit()
-        refresh_stats_cache()
         return {"message": "Paper added to collection"}
 
 
@@ -336,7 +331,6 @@ async def batch_add_papers_to_collection(collection_id: int, data: BatchAddPaper
         if added_count > 0:
             collection.updated_at = datetime.now(UTC).replace(tzinfo=None)
             session.commit()
-            refresh_stats_cache()
 
         return {
             "added_count": added_count,
@@ -358,7 +352,6 @@ async def remove_paper_from_collection(collection_id: int, paper_id: int):
         if collection:
             collection.updated_at = datetime.now(UTC).replace(tzinfo=None)
         session.commit()
-        refresh_stats_cache()
         return {"message": "Paper removed from collection"}
 
 
@@ -529,8 +522,6 @@ async def merge_papers_to_collection(collection_id: int, data: MergePapersReques
         target_collection.updated_at = datetime.now(UTC)
         session.commit()
 
-        refresh_stats_cache()
-
         return {
             "merged_count": merged_count,
             "total_papers": len(source_papers),
@@ -3,7 +3,7 @@ Config API Router
 """
 
 import json
-from typing import Any
+from typing import Any, Literal
 
 import openai
 from fastapi import APIRouter, HTTPException
@@ -34,6 +34,7 @@ class ConfigUpdate(BaseModel):
     recent_papers_limit: int | None = None
     search_limit: int | None = None
     years_back: int | None = None
+    archive_horizon_days: int | None = None
     selected_fields: list[str] | None = None
     ui_language: str | None = None
     translate_language: str | None = None
@@ -74,6 +75,7 @@ async def get_config():
         "recent_papers_limit": int(config.get("recent_papers_limit", 50)),
         "search_limit": int(config.get("search_limit", 20)),
         "years_back": int(config.get("years_back", 5)),
+        "archive_horizon_days": int(config.get("archive_horizon_days", 0)),
         "selected_fields": db.get_selected_fields(),
         "is_initialized": db.is_initialized(),
         "ui_language": config.get("ui_language", "zh"),
@@ -86,33 +88,40 @@ async def update_config(config_update: ConfigUpdate):
     """更新配置"""
     db = get_db()
 
+    updates: dict[str, str] = {}
     if config_update.ai_api_key is not None and config_update.ai_api_key != "***":
-        db.set_config("ai_api_key", config_update.ai_api_key)
+        updates["ai_api_key"] = config_update.ai_api_key
     if config_update.ai_model is not None:
-        db.set_config("ai_model", config_update.ai_model)
+        updates["ai_model"] = config_update.ai_model
     if config_update.ai_base_url is not None:
-        db.set_config("ai_base_url", config_update.ai_base_url)
+        updates["ai_base_url"] = config_update.ai_base_url
     if config_update.search_queries is not None:
-        db.set_search_queries(config_update.search_queries)
+        updates["search_queries"] = "; ".join(config_update.search_queries)
     if config_update.arxiv_max_results is not None:
-        db.set_config("arxiv_max_results", str(config_update.arxiv_max_results))
+        updates["arxiv_max_results"] = str(config_update.arxiv_max_results)
     if config_update.arxiv_max_results_per_field is not None:
-        db.set_config("arxiv_max_results_per_field", str(config_update.arxiv_max_results_per_field))
+        updates["arxiv_max_results_per_field"] = str(config_update.arxiv_max_results_per_field)
     if config_update.recent_papers_limit is not None:
-        db.set_config("recent_papers_limit", str(config_update.recent_papers_limit))
+        updates["recent_papers_limit"] = str(config_update.recent_papers_limit)
     if config_update.search_limit is not None:
-        db.set_config("search_limit", str(config_update.search_limit))
+        updates["search_limit"] = str(config_update.search_limit)
     if config_update.years_back is not None:
-        db.set_config("years_back", str(config_update.years_back))
+        updates["years_back"] = str(config_update.years_back)
+    if config_update.archive_horizon_days is not None:
+        updates["archive_horizon_days"] = str(max(0, config_update.archive_horizon_days))
     if config_update.selected_fields is not None:
-        db.set_selected_fields(config_update.selected_fields)
+        updates["selected_fields"] = json.dumps(config_update.selected_fields)
         search_queries = get_queries_for_fields(config_update.selected_fields)
         if search_queries:
-            db.set_search_queries(search_queries)
+            updates["search_queries"] = "; ".join(search_queries)
     if config_update.ui_language is not None:
-        db.set_config("ui_language", config_update.ui_language)
+        updates["ui_language"] = config_update.ui_language
     if config_update.translate_language is not None:
-        db.set_config("translate_language", config_update.translate_language)
+        updates["translate_language"] = config_update.translate_language
+
+    # 一个事务写入，配置版本号只加一次
+    if updates:
+        db.set_configs(updates)
 
     return {"success": True, "message": "配置已更新"}
 
@@ -202,31 +211,33 @@ async def initialize_system(init_config: InitConfig):
     if db.is_initialized():
         raise HTTPException(status_code=400, detail="系统已初始化")
 
-    db.set_config("ai_api_key", init_config.ai_api_key)
-    db.set_config("ai_model", init_config.ai_model)
-    db.set_config("ai_base_url", init_config.ai_base_url)
-    db.set_config("translate_language", init_config.translate_language)
-    db.set_config("years_back", str(init_config.years_back))
-    db.set_config("arxiv_max_results_per_field", str(init_config.arxiv_max_results_per_field))
-    db.set_config("arxiv_max_results", str(init_config.arxiv_max_results))
-    db.set_config("recent_papers_limit", str(init_config.recent_papers_limit))
-    db.set_config("search_limit", str(init_config.search_limit))
-    db.set_selected_fields(init_config.selected_fields)
-
+    updates = {
+        "ai_api_key": init_config.ai_api_key,
+        "ai_model": init_config.ai_model,
+        "ai_base_url": init_config.ai_base_url,
+        "translate_language": init_config.translate_language,
+        "years_back": str(init_config.years_back),
+        "arxiv_max_results_per_field": str(init_config.arxiv_max_results_per_field),
+        "arxiv_max_results": str(init_config.arxiv_max_results),
+        "recent_papers_limit": str(init_config.recent_papers_limit),
+        "search_limit": str(init_config.search_limit),
+        "selected_fields": json.dumps(init_config.selected_fields),
+    }
     search_queries = get_queries_for_fields(init_config.selected_fields)
     if search_queries:
-        db.set_search_queries(search_queries)
+        updates["search_queries"] = "; ".join(search_queries)
+    db.set_configs(updates)
 
     return {"success": True, "message": "配置已保存"}
 
 
 @router.post("/init/sync")
-async def initial_sync():
-    """执行初始同步（SSE 流）"""
+async def initial_sync(source: Literal["api", "oai"] = "api"):
+    """执行初始同步（SSE 流）；source=oai 时用 OAI-PMH 按领域批量采集，代替逐个查询翻页搜索"""
     import asyncio
     import uuid
 
-    from arxiv_pulse.crawler import ArXivCrawler
+    from arxiv_pulse.crawler import ArXivCrawler, SyncPipeline
 
     db = get_db()
 
@@ -253,26 +264,39 @@ async def initial_sync():
         total_added = 0
         crawler = ArXivCrawler()
 
-        for i, query in enumerate(search_queries, 1):
-            if total_added >= arxiv_max_results:
-                yield f"data: {json.dumps({'type': 'log', 'message': f'已达到全局限制 ({arxiv_max_results})，停止同步'}, ensure_ascii=False)}\n\n"
-                break
-
-            field_name = query
-            if i <= len(selected_fields):
-                field_name = get_field_display_name(selected_fields[i - 1], "zh")
-
-            remaining = arxiv_max_results - total_added
-            field_limit = min(arxiv_max_results_per_field, remaining)
-
-            yield f"data: {json.dumps({'type': 'log', 'message': f'[{i}/{len(search_queries)}] {field_name}'}, ensure_ascii=False)}\n\n"
-            await asyncio.sleep(0.05)
-
+        if source == "oai":
+            harvest = crawler.harvest_fields(selected_fields, years_back, max_results=arxiv_max_results)
+            window_added = 0
             try:
-                result = crawler.sync_query(
-                    query=query, years_back=years_back, force=False, arxiv_max_results=field_limit
-                )
-                print(f"[DEBUG] sync_query result: {result.get('error', 'no error')}")
+                while (progress := await asyncio.to_thread(next, harvest, None)) is not None:
+                    total_added = progress["total_new"]
+                    window_added += progress["new_papers"]
+                    if progress["last_page"]:
+                        i, windows = progress["window_index"], progress["windows"]
+                        window = f"{progress['set']} {progress['from']} ~ {progress['until']}"
+                        yield f"data: {json.dumps({'type': 'log', 'message': f'[{i}/{windows}] {window}'}, ensure_ascii=False)}\n\n"
+                        yield f"data: {json.dumps({'type': 'progress', 'current': i, 'total': windows, 'added': window_added}, ensure_ascii=False)}\n\n"
+                        window_added = 0
+            except Exception as e:
+                error_msg = str(e)[:200]
+                yield f"data: {json.dumps({'type': 'log', 'message': f'  错误: {error_msg}'}, ensure_ascii=False)}\n\n"
+        else:
+            # 抓取下一个领域的同时保存当前领域；全局上限按已新增的篇数收紧后续领域的抓取上限
+            pipeline = SyncPipeline(
+                crawler,
+                search_queries,
+                years_back=years_back,
+                max_results=arxiv_max_results_per_field,
+                total_limit=arxiv_max_results,
+            )
+            async for result in pipeline.stream():
+                i = result["index"]
+                field_name = result["query"]
+                if i <= len(selected_fields):
+                    field_name = get_field_display_name(selected_fields[i - 1], "zh")
+
+                yield f"data: {json.dumps({'type': 'log', 'message': f'[{i}/{len(search_queries)}] {field_name}'}, ensure_ascii=False)}\n\n"
+
                 if "error" in result:
                     error_msg = result["error"][:200] if len(result["error"]) > 200 else result["error"]
                     yield f"data: {json.dumps({'type': 'log', 'message': f'  错误: {error_msg}'}, ensure_ascii=False)}\n\n"
@@ -280,18 +304,12 @@ async def initial_sync():
                     added = result.get("new_papers", 0)
                     total_added += added
                     yield f"data: {json.dumps({'type': 'progress', 'current': i, 'total': len(search_queries), 'added': added}, ensure_ascii=False)}\n\n"
-            except Exception as e:
-                import traceback
 
-                traceback.print_exc()
-                yield f"data: {json.dumps({'type': 'log', 'message': f'  异常: {str(e)[:200]}'}, ensure_ascii=False)}\n\n"
+        if total_added >= arxiv_max_results:
+            yield f"data: {json.dumps({'type': 'log', 'message': f'已达到全局限制 ({arxiv_max_results})，停止同步'}, ensure_ascii=False)}\n\n"
 
         db.set_initialized(True)
 
-        from arxiv_pulse.web.api.stats import update_stats_cache
-
-        update_stats_cache()
-
         with db.get_session() as session:
             from arxiv_pulse.models import Paper
 
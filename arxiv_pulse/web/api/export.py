@@ -6,11 +6,12 @@ import base64
 import io
 import json
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import PlainTextResponse, Response
+from fastapi.responses import FileResponse, PlainTextResponse, Response
 from pydantic import BaseModel
+from starlette.background import BackgroundTask
 
 from arxiv_pulse.core import Config
 from arxiv_pulse.models import Collection, CollectionPaper, FigureCache, Paper
@@ -33,8 +34,9 @@ class CollectionExportRequest(BaseModel):
     language: str = "zh"
 
 
+# 导出涉及大量查询和 PDF 渲染，用同步路由让 FastAPI 放到线程池执行，不阻塞事件循环
 @router.post("/papers")
-async def export_papers(data: ExportRequest):
+def export_papers(data: ExportRequest):
     """Export selected papers"""
     with get_db().get_session() as session:
         papers = session.query(Paper).filter(Paper.id.in_(data.paper_ids)).all()
@@ -77,7 +79,7 @@ async def export_papers(data: ExportRequest):
 
 
 @router.post("/collection")
-async def export_collection(data: CollectionExportRequest):
+def export_collection(data: CollectionExportRequest):
     """Export a collection"""
     with get_db().get_session() as session:
         collection = session.query(Collection).filter_by(id=data.collection_id).first()
@@ -131,11 +133,42 @@ async def export_collection(data: CollectionExportRequest):
             raise HTTPException(status_code=400, detail="Unsupported format")
 
 
+@router.get("/corpus")
+def export_corpus(format: Literal["parquet", "arrow"] = "parquet"):
+    """Export the whole paper corpus as a zip of Parquet / Arrow files (one file per table)"""
+    import shutil
+    import tempfile
+    from pathlib import Path
+
+    from arxiv_pulse.services.corpus_service import export_corpus as run_export
+    from arxiv_pulse.services.corpus_service import zip_corpus
+
+    tmp = Path(tempfile.mkdtemp(prefix="arxiv_pulse_corpus_"))
+    try:
+        run_export(get_db().engine, tmp / "corpus", format)
+        zip_corpus(tmp / "corpus", tmp / "corpus.zip")
+    except RuntimeError as e:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise HTTPException(status_code=501, detail=str(e)) from e
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    filename = f"arxiv_pulse_corpus_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    return FileResponse(
+        tmp / "corpus.zip",
+        media_type="application/zip",
+        filename=filename,
+        background=BackgroundTask(shutil.rmtree, tmp, ignore_errors=True),
+    )
+
+
 def get_figure_data(arxiv_id: str, session) -> dict[str, Any] | None:
     """Get figure URL and base64 data for a paper"""
     figure = session.query(FigureCache).filter_by(arxiv_id=arxiv_id).first()
     if not figure or not figure.figure_url:
         return None
+    get_db().touch_cache("figures", [arxiv_id])
 
     result = {"url": figure.figure_url}
 
@@ -163,6 +196,13 @@ def get_translation(paper: Paper) -> dict[str, str]:
     }
 
 
+def warm_translations(papers: list[Paper]) -> None:
+    """Load cached translations for all papers in one query before per-paper get_translation calls"""
+    from arxiv_pulse.services.translation_service import warm_translation_cache
+
+    warm_translation_cache([text for paper in papers for text in (paper.title, paper.abstract)])
+
+
 def get_paper_summary_data(paper: Paper) -> dict[str, Any]:
     """Parse and return summary data"""
     if not paper.summary:
@@ -230,6 +270,8 @@ def generate_markdown(
     """Generate Markdown content from papers"""
     lines = []
     i18n = I18N.get(language, I18N["zh"])
+    if language != "en":
+        warm_translations(papers)
 
     lines.append(i18n["generated_by"].format(GITHUB_URL))
     lines.append("\n---\n")
@@ -336,6 +378,8 @@ def generate_pdf(
     i18n = I18N.get(language, I18N["zh"])
     title = collection_name if collection_name else i18n["title"]
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if language != "en":
+        warm_translations(papers)
 
     html_parts = [
         "<!DOCTYPE html>",
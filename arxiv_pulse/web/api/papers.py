@@ -2,22 +2,27 @@
 Papers API Router
 """
 
+import asyncio
 import json
 import re
 from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy import select
 
 from arxiv_pulse.core import Config
-from arxiv_pulse.models import Paper
+from arxiv_pulse.models import ArchivedPaper, Paper, PaperAuthor, PaperCard, PaperCategory
 from arxiv_pulse.services.figure_service import fetch_and_cache_figure, get_figure_url_cached
 from arxiv_pulse.services.paper_service import (
+    enhance_paper_cards_async,
     enhance_paper_data,
+    iter_paper_cards,
     summarize_and_cache_paper,
 )
 from arxiv_pulse.utils import sse_event, sse_response
 from arxiv_pulse.web.dependencies import get_db
+from arxiv_pulse.web.pagination import cached_count, decode_cursor, encode_cursor, keyset_page, keyset_query
 
 router = APIRouter()
 
@@ -32,33 +37,89 @@ def parse_arxiv_id(query: str) -> str | None:
     return match.group(1) if match else None
 
 
+async def index_page(
+    cutoff: datetime | None,
+    categories: list[str] | None,
+    limit: int,
+    offset: int = 0,
+    after: str | None = None,
+    before: str | None = None,
+) -> tuple[list[PaperCard], int] | None:
+    """Select a page from the in-memory paper index and hydrate only that page from SQLite
+
+    Same ordering and cursor semantics as keyset_query (limit + 1 rows, before pages ascending).
+    Returns (cards, total matching without cursor), or None while the index is not built yet.
+    """
+    db = get_db()
+    if not db.paper_index.ready:
+        return None
+    if after and before:
+        raise HTTPException(status_code=400, detail="Use either after or before, not both")
+
+    paper_ids, total = db.paper_index.select(
+        cutoff=cutoff,
+        categories=categories,
+        limit=limit,
+        offset=offset,
+        after=decode_cursor(after) if after else None,
+        before=decode_cursor(before) if before else None,
+    )
+    if not paper_ids:
+        return [], total
+    async with db.get_async_session() as session:
+        rows = (await session.execute(PaperCard.query().where(Paper.id.in_(paper_ids)))).all()
+    id_to_card = {card.id: card for card in map(PaperCard.from_row, rows)}
+    return [id_to_card[pid] for pid in paper_ids if pid in id_to_card], total
+
+
 @router.get("")
 async def list_papers(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     category: str | None = None,
     days: int | None = None,
+    after: str | None = Query(None, description="Cursor: papers after this one"),
+    before: str | None = Query(None, description="Cursor: papers before this one"),
+    with_total: bool = Query(True, description="Include (cached) total count"),
 ):
-    """List papers with pagination and filters"""
-    with get_db().get_session() as session:
-        query = session.query(Paper)
-
+    """List papers with pagination and filters
+
+    Pass next_cursor / prev_cursor as after / before for keyset pagination;
+    page is kept for numbered pagination and falls back to OFFSET.
+    """
+    cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days) if days else None
+    offset = (page - 1) * page_size if page > 1 and not (after or before) else 0
+
+    indexed = await index_page(cutoff, [category] if category else None, page_size, offset, after, before)
+    if indexed is not None:
+        cards, indexed_total = indexed
+        total = indexed_total if with_total else None
+    else:
+        query = PaperCard.query()
         if category:
-            query = query.filter(Paper.categories.contains(category) | Paper.primary_category.contains(category))
-
-        if days:
-            cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days)
-            query = query.filter(Paper.published >= cutoff)
-
-        total = query.count()
-        papers = query.order_by(Paper.published.desc()).offset((page - 1) * page_size).limit(page_size).all()
+            query = query.where(Paper.id.in_(PaperCategory.paper_ids_matching([category])))
+        if cutoff:
+            query = query.where(Paper.published >= cutoff)
+
+        async with get_db().get_async_session() as session:
+            total = await cached_count(session, query, ("papers", category, days)) if with_total else None
+            if offset:
+                page_query = query.order_by(Paper.published.desc(), Paper.id.desc()).offset(offset).limit(page_size + 1)
+            else:
+                page_query = keyset_query(query, Paper.published, Paper.id, page_size, after=after, before=before)
+            rows = (await session.execute(page_query)).all()
+        cards = [PaperCard.from_row(row) for row in rows]
 
-        return {
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "papers": [enhance_paper_data(p) for p in papers],
-        }
+    result = keyset_page(cards, page_size, lambda p: (p.published, p.id), after=after, before=before)
+    return {
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "has_more": result["has_more"],
+        "next_cursor": result["next_cursor"],
+        "prev_cursor": result["prev_cursor"],
+        "papers": await enhance_paper_cards_async(result["items"]),
+    }
 
 
 @router.get("/recent")
@@ -67,40 +128,56 @@ async def get_recent_papers(
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     categories: str | None = Query(None, description="Comma-separated category codes"),
+    after: str | None = Query(None, description="Cursor: papers after this one"),
+    before: str | None = Query(None, description="Cursor: papers before this one"),
+    with_total: bool = Query(True, description="Include (cached) total count"),
 ):
-    """Get recent papers with pagination and optional category filter"""
-    with get_db().get_session() as session:
-        cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days)
-        query = session.query(Paper).filter(Paper.published >= cutoff)
-
-        if categories:
-            from sqlalchemy import or_
-
-            cat_list = [c.strip() for c in categories.split(",")]
-            conditions = []
-            for cat in cat_list:
-                conditions.append(Paper.categories.contains(cat))
-                conditions.append(Paper.primary_category.contains(cat))
-            query = query.filter(or_(*conditions))
-
-        total = query.count()
-        papers = query.order_by(Paper.published.desc()).offset(offset).limit(limit).all()
+    """Get recent papers with pagination and optional category filter
+
+    Prefer after=next_cursor over offset for "load more"; offset is kept for compatibility.
+    """
+    cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days)
+    cat_list = [c.strip() for c in categories.split(",") if c.strip()] if categories else []
+    page_offset = offset if not (after or before) else 0
+
+    indexed = await index_page(cutoff, cat_list, limit, page_offset, after, before)
+    if indexed is not None:
+        cards, indexed_total = indexed
+        total = indexed_total if with_total else None
+    else:
+        query = PaperCard.query().where(Paper.published >= cutoff)
+        if cat_list:
+            query = query.where(Paper.id.in_(PaperCategory.paper_ids_matching(cat_list)))
+
+        async with get_db().get_async_session() as session:
+            total = await cached_count(session, query, ("recent", days, categories)) if with_total else None
+            if page_offset:
+                page_query = (
+                    query.order_by(Paper.published.desc(), Paper.id.desc()).offset(page_offset).limit(limit + 1)
+                )
+            else:
+                page_query = keyset_query(query, Paper.published, Paper.id, limit, after=after, before=before)
+            rows = (await session.execute(page_query)).all()
+        cards = [PaperCard.from_row(row) for row in rows]
 
-        return {
-            "days": days,
-            "total": total,
-            "offset": offset,
-            "limit": limit,
-            "has_more": offset + len(papers) < total,
-            "papers": [enhance_paper_data(p, session) for p in papers],
-        }
+    result = keyset_page(cards, limit, lambda p: (p.published, p.id), after=after, before=before)
+    return {
+        "days": days,
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "has_more": result["has_more"],
+        "next_cursor": result["next_cursor"],
+        "prev_cursor": result["prev_cursor"],
+        "papers": await enhance_paper_cards_async(result["items"]),
+    }
 
 
 @router.get("/recent/cache")
 async def get_recent_cache():
     """Get cached recent papers (instant load)"""
     db = get_db()
-    cache = db.get_recent_cache()
+    cache = await asyncio.to_thread(db.get_recent_cache)
 
     if not cache:
         return {"cached": False, "papers": [], "total": 0}
@@ -115,16 +192,15 @@ async def get_recent_cache():
             "updated_at": cache.get("updated_at"),
         }
 
-    with db.get_session() as session:
-        papers = session.query(Paper).filter(Paper.id.in_(paper_ids)).all()
-        id_to_paper = {p.id: p for p in papers}
-        ordered_papers = [id_to_paper[pid] for pid in paper_ids if pid in id_to_paper]
-        result = [enhance_paper_data(p, session) for p in ordered_papers]
+    async with db.get_async_session() as session:
+        rows = (await session.execute(PaperCard.query().where(Paper.id.in_(paper_ids)))).all()
+    id_to_card = {card.id: card for card in map(PaperCard.from_row, rows)}
+    ordered_cards = [id_to_card[pid] for pid in paper_ids if pid in id_to_card]
 
     return {
         "cached": True,
-        "papers": result,
-        "total": len(ordered_papers),
+        "papers": await enhance_paper_cards_async(ordered_cards),
+        "total": len(ordered_cards),
         "days_back": cache.get("days_back", 7),
         "updated_at": cache.get("updated_at"),
     }
@@ -163,20 +239,23 @@ async def get_recent_cache_stream():
         )
         await asyncio.sleep(0.01)
 
+        next_cursor = None
         with db.get_session() as session:
-            papers = session.query(Paper).filter(Paper.id.in_(paper_ids)).all()
-            id_to_paper = {p.id: p for p in papers}
+            rows = session.execute(PaperCard.query().where(Paper.id.in_(paper_ids))).all()
+            id_to_card = {card.id: card for card in map(PaperCard.from_row, rows)}
+            ordered_cards = [id_to_card[pid] for pid in paper_ids if pid in id_to_card]
+            if ordered_cards and total < db_total:
+                next_cursor = encode_cursor(ordered_cards[-1].published, ordered_cards[-1].id)
 
+            enhanced_cards = iter_paper_cards(ordered_cards, session)
             for i, pid in enumerate(paper_ids, 1):
-                if pid in id_to_paper:
-                    paper = id_to_paper[pid]
-                    enhanced = enhance_paper_data(paper, session)
-                    yield sse_event("result", {"paper": enhanced, "index": i, "total": total})
+                if pid in id_to_card:
+                    yield sse_event("result", {"paper": next(enhanced_cards), "index": i, "total": total})
                 else:
                     yield sse_event("progress", {"index": i, "total": total})
                 await asyncio.sleep(0.01)
 
-        yield sse_event("done", {"total": total, "db_total": db_total, "cached": True})
+        yield sse_event("done", {"total": total, "db_total": db_total, "cached": True, "next_cursor": next_cursor})
 
     return sse_response(event_generator)
 
@@ -216,7 +295,7 @@ async def update_recent_papers(
         db = get_db()
         task_id = str(uuid.uuid4())
 
-        category_list = [c.strip() for c in categories.split(",")] if categories else []
+        category_list = [c.strip() for c in categories.split(",") if c.strip()] if categories else []
         query_limit = limit or Config.RECENT_PAPERS_LIMIT
         sync_years = Config.YEARS_BACK
 
@@ -249,21 +328,18 @@ async def update_recent_papers(
             await asyncio.sleep(0.1)
 
             try:
-                from arxiv_pulse.crawler import ArXivCrawler
+                from arxiv_pulse.crawler import ArXivCrawler, SyncPipeline
 
                 crawler = ArXivCrawler()
                 queries = Config.SEARCH_QUERIES
 
-                for i, query in enumerate(queries, 1):
+                async for result in SyncPipeline(crawler, queries, years_back=sync_years).stream():
+                    query = result["query"]
                     query_short = query[:50] + "..." if len(query) > 50 else query
-                    yield sse_event("log", {"message": f"[{i}/{len(queries)}] 同步: {query_short}"})
-                    await asyncio.sleep(0.05)
-
-                    try:
-                        result = crawler.sync_query(query=query, years_back=sync_years, force=False)
-                        total_added += result.get("new_papers", 0)
-                    except Exception as e:
-                        yield sse_event("log", {"message": f"  同步出错: {str(e)[:80]}"})
+                    yield sse_event("log", {"message": f"[{result['index']}/{len(queries)}] 同步: {query_short}"})
+                    if "error" in result:
+                        yield sse_event("log", {"message": f"  同步出错: {result['error'][:80]}"})
+                    total_added += result.get("new_papers", 0)
 
                 yield sse_event("log", {"message": f"同步完成，新增 {total_added} 篇论文"})
                 await asyncio.sleep(0.1)
@@ -277,22 +353,24 @@ async def update_recent_papers(
         yield sse_event("log", {"message": "正在查询最近论文..."})
         await asyncio.sleep(0.1)
 
+        cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days)
         with db.get_session() as session:
-            cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days)
-            query = session.query(Paper).filter(Paper.published >= cutoff)
-
-            if category_list:
-                from sqlalchemy import or_
-
-                conditions = []
-                for cat in category_list:
-                    conditions.append(Paper.categories.contains(cat))
-                    conditions.append(Paper.primary_category.contains(cat))
-                query = query.filter(or_(*conditions))
-
-            total_count = query.count()
-            papers = query.order_by(Paper.published.desc()).limit(query_limit).all()
+            if db.paper_index.ready:
+                paper_ids, total_count = db.paper_index.select(
+                    cutoff=cutoff, categories=category_list, limit=query_limit
+                )
+                id_to_paper = {p.id: p for p in session.query(Paper).filter(Paper.id.in_(paper_ids[:query_limit]))}
+                papers = [id_to_paper[pid] for pid in paper_ids[:query_limit] if pid in id_to_paper]
+            else:
+                query = session.query(Paper).filter(Paper.published >= cutoff)
+                if category_list:
+                    query = query.filter(Paper.id.in_(PaperCategory.paper_ids_matching(category_list)))
+                total_count = query.count()
+                papers = query.order_by(Paper.published.desc(), Paper.id.desc()).limit(query_limit).all()
             paper_ids = [p.id for p in papers]
+            next_cursor = (
+                encode_cursor(papers[-1].published, papers[-1].id) if papers and len(papers) < total_count else None
+            )
 
         yield sse_event("log", {"message": f"找到 {total_count} 篇论文，加载前 {len(papers)} 篇"})
         await asyncio.sleep(0.1)
@@ -342,6 +420,7 @@ async def update_recent_papers(
             {
                 "total": total_count,
                 "loaded": len(papers),
+                "next_cursor": next_cursor,
                 "synced": total_added,
                 "summarized": summarized_count,
                 "figures": figure_count,
@@ -380,6 +459,7 @@ async def quick_fetch(q: str = Query(..., min_length=1)):
                     if summarize_and_cache_paper(paper):
                         with db.get_session() as s:
                             s.query(Paper).filter_by(id=paper.id).update({"summarized": True})
+                            s.commit()
                             paper = s.query(Paper).filter_by(arxiv_id=arxiv_id).first()
 
                 with db.get_session() as s:
@@ -652,8 +732,12 @@ async def search_papers(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     days: int | None = None,
+    include_archive: bool = False,
 ):
-    """Search papers by query (basic search without AI parsing)"""
+    """Search papers by query (basic search without AI parsing)
+
+    include_archive also searches papers moved to the archive database.
+    """
     from arxiv_pulse.search import SearchEngine, SearchFilter
 
     with get_db().get_session() as session:
@@ -667,6 +751,7 @@ async def search_papers(
             limit=page_size * 2,
             sort_by="published",
             sort_order="desc",
+            include_archive=include_archive,
         )
 
         papers = search_engine.search_papers(filter_config)
@@ -685,6 +770,7 @@ async def search_papers_stream(
     q: str = Query(..., min_length=1),
     days: int | None = None,
     limit: int = Query(20, ge=1, le=100),
+    include_archive: bool = False,
 ):
     """SSE endpoint for real-time search with AI parsing and logs"""
 
@@ -770,6 +856,7 @@ async def search_papers_stream(
                     limit=limit * 2,
                     sort_by="published",
                     sort_order="desc",
+                    include_archive=include_archive,
                 )
                 papers = search_engine.search_papers(filter_config)
                 all_papers.extend(papers)
@@ -797,7 +884,8 @@ async def search_papers_stream(
                 if fresh_paper:
                     paper = fresh_paper
 
-            if not paper.summarized:
+            # 归档论文只读，不再补做总结
+            if not paper.summarized and not isinstance(paper, ArchivedPaper):
                 yield sse_event("log", {"message": f"[{i + 1}/{len(unique_papers)}] 总结论文 {paper.arxiv_id}..."})
                 await asyncio.sleep(0.05)
                 if summarize_and_cache_paper(paper):
@@ -901,14 +989,32 @@ async def ai_filter_papers(data: AIFilterPapersRequest):
             raise HTTPException(status_code=500, detail=f"AI filter failed: {str(e)[:100]}")
 
 
+@router.get("/author")
+async def get_papers_by_author(
+    name: str = Query(..., min_length=1),
+    exact: bool = True,
+    limit: int = Query(64, ge=1, le=500),
+):
+    """Get papers by author via the normalized authors index"""
+    query = (
+        PaperCard.query()
+        .where(Paper.id.in_(PaperAuthor.paper_ids_by_author(name, exact=exact)))
+        .order_by(Paper.published.desc())
+        .limit(limit)
+    )
+    async with get_db().get_async_session() as session:
+        cards = [PaperCard.from_row(row) for row in (await session.execute(query)).all()]
+    return {"author": name, "total": len(cards), "papers": await enhance_paper_cards_async(cards)}
+
+
 @router.get("/{paper_id}")
 async def get_paper(paper_id: int):
     """Get paper by ID with enhanced data"""
-    with get_db().get_session() as session:
-        paper = session.query(Paper).filter_by(id=paper_id).first()
-        if not paper:
-            raise HTTPException(status_code=404, detail="Paper not found")
-        return enhance_paper_data(paper)
+    async with get_db().get_async_session() as session:
+        paper = await session.get(Paper, paper_id) or await session.get(ArchivedPaper, paper_id)
+    if not paper:
+        raise HTTPException(status_code=404, detail="Paper not found")
+    return await asyncio.to_thread(enhance_paper_data, paper)
 
 
 @router.get("/{paper_id}/translate")
@@ -934,11 +1040,13 @@ async def get_paper_translation(paper_id: int):
 @router.get("/arxiv/{arxiv_id}")
 async def get_paper_by_arxiv_id(arxiv_id: str):
     """Get paper by arXiv ID with enhanced data"""
-    with get_db().get_session() as session:
-        paper = session.query(Paper).filter_by(arxiv_id=arxiv_id).first()
-        if not paper:
-            raise HTTPException(status_code=404, detail="Paper not found")
-        return enhance_paper_data(paper)
+    async with get_db().get_async_session() as session:
+        paper = await session.scalar(select(Paper).where(Paper.arxiv_id == arxiv_id)) or await session.scalar(
+            select(ArchivedPaper).where(ArchivedPaper.arxiv_id == arxiv_id)
+        )
+    if not paper:
+        raise HTTPException(status_code=404, detail="Paper not found")
+    return await asyncio.to_thread(enhance_paper_data, paper)
 
 
 @router.get("/pdf/{arxiv_id}")
@@ -2,108 +2,73 @@
 Stats API Router
 """
 
-import json
+import asyncio
 from collections import Counter
 from datetime import UTC, datetime, timedelta
 
-from fastapi import APIRouter
-from sqlalchemy import func
+from fastapi import APIRouter, Query
 
-from arxiv_pulse.constants import ARXIV_CATEGORIES, get_all_categories
-from arxiv_pulse.core import Config
-from arxiv_pulse.models import Collection, CollectionPaper, Paper
+from arxiv_pulse.constants import get_all_categories
 from arxiv_pulse.web.dependencies import get_db
 
 router = APIRouter()
 
 
-def update_stats_cache():
-    """更新统计数据缓存 - 使用 SQL 聚合查询优化性能"""
-    with get_db().get_session() as session:
-        total_papers = session.query(func.count(Paper.id)).scalar()
-        summarized_papers = session.query(func.count(Paper.id)).filter(Paper.summarized == True).scalar()
-
-        now = datetime.now(UTC).replace(tzinfo=None)
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = now - timedelta(days=7)
-        month_start = now - timedelta(days=30)
-
-        today_count = session.query(func.count(Paper.id)).filter(Paper.published >= today_start).scalar()
-        week_count = session.query(func.count(Paper.id)).filter(Paper.published >= week_start).scalar()
-        month_count = session.query(func.count(Paper.id)).filter(Paper.published >= month_start).scalar()
+def build_stats() -> dict:
+    """从统计汇总表生成统计数据（汇总表由触发器维护，开销与论文总数无关）"""
+    db = get_db()
+    with db.get_session() as session:
+        counters = db.get_stat_counters(session)
+        total_papers = counters.get("papers", 0)
+        summarized_papers = counters.get("summarized", 0)
 
-        category_counts = (
-            session.query(Paper.categories, func.count(Paper.id))
-            .filter(Paper.categories.isnot(None))
-            .group_by(Paper.categories)
-            .all()
-        )
-        category_counter = Counter()
-        for cats, count in category_counts:
-            if cats:
-                for cat in cats.split(", "):
-                    if cat:
-                        category_counter[cat] += count
+        today = datetime.now(UTC).date()
+        today_count = db.count_papers_since(today, session)
+        week_count = db.count_papers_since(today - timedelta(days=7), session)
+        month_count = db.count_papers_since(today - timedelta(days=30), session)
 
+        category_counter = Counter(db.get_category_counts(session))
         top_categories = category_counter.most_common(10)
 
-        year_counts = (
-            session.query(func.strftime("%Y", Paper.published), func.count(Paper.id))
-            .filter(Paper.published.isnot(None))
-            .group_by(func.strftime("%Y", Paper.published))
-            .all()
-        )
-        year_distribution = {int(year): count for year, count in year_counts if year}
-        year_distribution = dict(sorted(year_distribution.items()))
-
-        total_collections = session.query(func.count(Collection.id)).scalar()
-        total_collection_papers = session.query(func.count(CollectionPaper.id)).scalar()
-
-        cache_data = {
-            "updated_at": datetime.now(UTC).isoformat(),
-            "papers": {
-                "total": total_papers,
-                "summarized": summarized_papers,
-                "summarization_rate": summarized_papers / total_papers if total_papers > 0 else 0,
-                "today": today_count,
-                "this_week": week_count,
-                "this_month": month_count,
-            },
-            "categories": {
-                "total": len(category_counter),
-                "top": [{"name": cat, "count": count} for cat, count in top_categories],
-            },
-            "years": year_distribution,
-            "collections": {
-                "total": total_collections,
-                "total_papers": total_collection_papers,
-            },
-        }
-
-        db = get_db()
-        db.set_config("stats_cache", json.dumps(cache_data, ensure_ascii=False))
-        return cache_data
+        year_distribution = db.get_year_counts(session)
+
+    return {
+        "updated_at": datetime.now(UTC).isoformat(),
+        "papers": {
+            "total": total_papers,
+            "summarized": summarized_papers,
+            "summarization_rate": summarized_papers / total_papers if total_papers > 0 else 0,
+            "today": today_count,
+            "this_week": week_count,
+            "this_month": month_count,
+        },
+        "categories": {
+            "total": len(category_counter),
+            "top": [{"name": cat, "count": count} for cat, count in top_categories],
+        },
+        "years": year_distribution,
+        "collections": {
+            "total": counters.get("collections", 0),
+            "total_papers": counters.get("collection_papers", 0),
+        },
+    }
 
 
 @router.get("")
 async def get_stats():
-    """Get database statistics (from cache if available)"""
-    db = get_db()
-    cached = db.get_config("stats_cache")
-
-    if cached:
-        try:
-            return json.loads(cached)
-        except:
-            pass
-
-    return update_stats_cache()
+    """Get database statistics from the rollup tables"""
+    return await asyncio.to_thread(build_stats)
 
 
 @router.post("/refresh")
 async def refresh_stats():
-    """Force refresh stats cache"""
-    return update_stats_cache()
+    """Rebuild the rollup tables from the raw tables, then return fresh stats"""
+
+    def rebuild():
+        get_db().rebuild_stats_rollups()
+        return build_stats()
+
+    return await asyncio.to_thread(rebuild)
 
 
 @router.get("/fields")
@@ -111,22 +76,10 @@ async def get_field_stats():
     """Get research field statistics with paper counts"""
     db = get_db()
 
-    selected_fields = db.get_selected_fields()
+    selected_fields = await asyncio.to_thread(db.get_selected_fields)
     all_cats = get_all_categories()
 
-    with db.get_session() as session:
-        category_counts = (
-            session.query(Paper.categories, func.count(Paper.id))
-            .filter(Paper.categories.isnot(None))
-            .group_by(Paper.categories)
-            .all()
-        )
-        category_counter = Counter()
-        for cats, count in category_counts:
-            if cats:
-                for cat in cats.split(", "):
-                    if cat:
-                        category_counter[cat] += count
+    category_counter = await asyncio.to_thread(db.get_category_counts)
 
     fields_data = []
     for field_id, field_info in all_cats.items():
@@ -146,3 +99,10 @@ async def get_field_stats():
         "fields": fields_data,
         "selected_fields": selected_fields,
     }
+
+
+@router.get("/authors")
+async def get_author_stats(limit: int = Query(50, ge=1, le=500)):
+    """Get top authors with paper counts"""
+    counts = await asyncio.to_thread(get_db().get_author_counts, limit)
+    return {"authors": [{"name": name, "paper_count": count} for name, count in counts.items()]}
@@ -11,6 +11,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from arxiv_pulse.core import Config
+from arxiv_pulse.core.database import detached_context
 from arxiv_pulse.models import Paper, RecentResult, SyncTask
 from arxiv_pulse.utils import sse_event, sse_response
 from arxiv_pulse.web.dependencies import get_db
@@ -126,7 +127,7 @@ async def start_sync_stream(
         await asyncio.sleep(0.1)
 
         try:
-            from arxiv_pulse.crawler import ArXivCrawler
+            from arxiv_pulse.crawler import ArXivCrawler, SyncPipeline
 
             crawler = ArXivCrawler()
 
@@ -137,26 +138,22 @@ async def start_sync_stream(
             total_queries = len(queries)
             total_added = 0
 
-            for i, query in enumerate(queries, 1):
+            # 抓取下一个查询的同时保存当前查询，每个查询保存完成后报告进度
+            pipeline = SyncPipeline(crawler, queries, years_back=years_back, force=force)
+            async for result in pipeline.stream():
+                i = result["index"]
+                query = result["query"]
                 query_short = query[:50] + "..." if len(query) > 50 else query
                 yield f"data: {json.dumps({'type': 'log', 'message': f'[{i}/{total_queries}] 搜索查询: {query_short}'}, ensure_ascii=False)}\n\n"
-                await asyncio.sleep(0.1)
-
                 yield f"data: {json.dumps({'type': 'progress', 'current': i, 'total': total_queries}, ensure_ascii=False)}\n\n"
 
-                try:
-                    result = crawler.sync_query(
-                        query=query,
-                        years_back=years_back,
-                        force=force,
-                    )
+                if "error" in result:
+                    error = result["error"][:100]
+                    yield f"data: {json.dumps({'type': 'log', 'message': f'  查询出错: {error}'}, ensure_ascii=False)}\n\n"
+                else:
                     added = result.get("new_papers", 0)
                     total_added += added
                     yield f"data: {json.dumps({'type': 'log', 'message': f'  添加了 {added} 篇新论文'}, ensure_ascii=False)}\n\n"
-                except Exception as e:
-                    yield f"data: {json.dumps({'type': 'log', 'message': f'  查询出错: {str(e)[:100]}'}, ensure_ascii=False)}\n\n"
-
-                await asyncio.sleep(0.1)
 
             yield f"data: {json.dumps({'type': 'log', 'message': '正在刷新最近论文缓存...'}, ensure_ascii=False)}\n\n"
             await asyncio.sleep(0.1)
@@ -179,16 +176,6 @@ async def start_sync_stream(
             except Exception as e:
                 yield f"data: {json.dumps({'type': 'log', 'message': f'更新缓存失败: {str(e)[:80]}'}, ensure_ascii=False)}\n\n"
 
-            yield f"data: {json.dumps({'type': 'log', 'message': '正在更新统计缓存...'}, ensure_ascii=False)}\n\n"
-            await asyncio.sleep(0.1)
-            try:
-                from arxiv_pulse.web.api.stats import update_stats_cache
-
-                update_stats_cache()
-                yield f"data: {json.dumps({'type': 'log', 'message': '统计缓存已更新'}, ensure_ascii=False)}\n\n"
-            except Exception as e:
-                yield f"data: {json.dumps({'type': 'log', 'message': f'更新统计缓存失败: {str(e)[:80]}'}, ensure_ascii=False)}\n\n"
-
             with get_db().get_session() as session:
                 task = session.query(SyncTask).filter_by(id=task_id).first()
                 if task:
@@ -229,7 +216,7 @@ async def create_task(data: SyncTaskCreate):
         session.add(task)
         session.commit()
 
-    asyncio.create_task(run_sync_task(task_id, data))
+    asyncio.create_task(run_sync_task(task_id, data), context=detached_context())
 
     return {"task_id": task_id, "status": "pending"}
 
@@ -267,6 +254,7 @@ async def run_sync_task(task_id: str, data: SyncTaskCreate):
         )
 
         update_task(task_id, progress=80, total=result.get("total_processed", 0), message="Sync completed")
+        get_db().flush_writes()
 
         with get_db().get_session() as session:
             task = session.query(SyncTask).filter_by(id=task_id).first()
@@ -279,6 +267,7 @@ async def run_sync_task(task_id: str, data: SyncTaskCreate):
                 session.commit()
 
     except Exception as e:
+        get_db().flush_writes()
         with get_db().get_session() as session:
             task = session.query(SyncTask).filter_by(id=task_id).first()
             if task:
@@ -289,11 +278,5 @@ async def run_sync_task(task_id: str, data: SyncTaskCreate):
 
 
 def update_task(task_id: str, progress: int = 0, total: int = 0, message: str = ""):
-    """Update task progress"""
-    with get_db().get_session() as session:
-        task = session.query(SyncTask).filter_by(id=task_id).first()
-        if task:
-            task.progress = progress
-            task.total = total
-            task.message = message
-            session.commit()
+    """Update task progress (queued on the database writer thread)"""
+    get_db().update_sync_task(task_id, progress=progress, total=total, message=message)
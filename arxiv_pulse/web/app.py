@@ -2,29 +2,45 @@
 FastAPI Application Entry Point
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import APIRouter, FastAPI
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import create_engine
 
 from arxiv_pulse.__version__ import __version__
 from arxiv_pulse.core import Database
-from arxiv_pulse.models import Base
+from arxiv_pulse.core.maintenance import MaintenanceScheduler
+from arxiv_pulse.utils import output
 from arxiv_pulse.web.api import cache, chat, collections, config, export, papers, stats, tasks
+from arxiv_pulse.web.middleware import DatabaseScopeMiddleware
+
+
+async def build_paper_index(db: Database) -> None:
+    """Build the in-memory paper index in the background; list endpoints use SQL until it is ready"""
+    try:
+        count = await asyncio.to_thread(db.build_paper_index)
+        output.info(f"内存论文索引已构建: {count} 篇")
+    except Exception as e:
+        output.warn(f"内存论文索引构建失败，列表接口使用 SQL 查询: {e}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan context manager"""
     db_url = os.getenv("DATABASE_URL", "sqlite:///data/arxiv_papers.db")
-    engine = create_engine(db_url)
-    Base.metadata.create_all(engine)
     db = Database(db_url)
     db.init_default_config()
+    app.state.paper_index_build = asyncio.create_task(build_paper_index(db))
+    app.state.maintenance = MaintenanceScheduler(db)
+    app.state.maintenance.start()
     yield
+    await app.state.maintenance.stop()
+    db.flush_cache_access()
+    db.close_writer()
+    await db.dispose_async_engine()
 
 
 def create_app() -> FastAPI:
@@ -35,6 +51,7 @@ def create_app() -> FastAPI:
         version=__version__,
         lifespan=lifespan,
     )
+    app.add_middleware(DatabaseScopeMiddleware)
 
     api_router = APIRouter()
     api_router.include_router(papers.router, prefix="/papers", tags=["papers"])
@@ -0,0 +1,47 @@
+"""
+ASGI middleware - 请求级数据库作用域
+"""
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from arxiv_pulse.web.dependencies import get_db
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseScopeMiddleware:
+    """每个 HTTP 请求共用一个数据库会话，并记录该请求打开的会话数和执行的 SQL 条数
+
+    响应头 X-DB-Sessions / X-DB-Queries 为发送响应头时的计数（SSE 等流式响应之后还会增加），
+    请求完全结束后的最终计数写入 debug 日志。
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with get_db().request_scope() as db_scope:
+
+            async def send_with_usage(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Sessions"] = str(db_scope.sessions)
+                    headers["X-DB-Queries"] = str(db_scope.queries)
+                await send(message)
+
+            await self.app(scope, receive, send_with_usage)
+
+        logger.debug(
+            "%s %s: %d db sessions, %d queries",
+            scope["method"],
+            scope["path"],
+            db_scope.sessions,
+            db_scope.queries,
+        )
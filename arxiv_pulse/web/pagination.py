@@ -0,0 +1,147 @@
+"""
+游标（keyset）分页 - 基于 (排序列, id) 的不透明游标，替代 OFFSET + 全表计数
+"""
+
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import Select, and_, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from arxiv_pulse.core import Database
+
+COUNT_CACHE_TTL = 60  # 秒
+COUNT_CACHE_SIZE = 256  # 最多缓存的计数条数，超出时淘汰最久未用的
+
+# key -> (计数时的 Database.papers_version, 过期时间, 总数)
+_count_cache: OrderedDict[tuple, tuple[int, float, int]] = OrderedDict()
+_count_cache_lock = threading.Lock()
+
+
+def encode_cursor(value: Any, row_id: int) -> str:
+    """把 (排序值, id) 编码为 URL 安全的游标；排序值为 None（NULL）时原样编码为 null"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, is_datetime: bool = True) -> tuple[Any, int]:
+    """解析游标，格式错误时返回 400；null 排序值解析为 None"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, row_id = json.loads(raw)
+        if is_datetime and value is not None:
+            value = datetime.fromisoformat(value)
+        return value, int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _beyond(sort_column, id_column, value: Any, row_id: int, greater: bool):
+    """(sort_column, id_column) 排在游标 (value, row_id) 之后（greater）或之前的条件
+
+    与 SQLite 的排序一致，NULL 视为比任何值都小（正序排在最前，倒序排在最后）；
+    元组比较遇到 NULL 结果为 NULL，所以 NULL 的行和 NULL 的游标单独处理。
+    """
+    key = tuple_(sort_column, id_column)
+    if value is None:
+        if greater:
+            return or_(sort_column.is_not(None), and_(sort_column.is_(None), id_column > row_id))
+        return and_(sort_column.is_(None), id_column < row_id)
+    if greater:
+        return key > tuple_(value, row_id)
+    return or_(key < tuple_(value, row_id), sort_column.is_(None))
+
+
+def keyset_query(
+    query: Select,
+    sort_column,
+    id_column,
+    limit: int,
+    after: str | None = None,
+    before: str | None = None,
+    descending: bool = True,
+) -> Select:
+    """按 (sort_column, id_column) 排序并加上游标条件，多取一行用于判断 has_more
+
+    after 向后翻页（沿排序方向），before 向前翻页（查询时反向排序，结果由 keyset_page 翻转回来）。
+    sort_column 可以为 NULL，游标条件按 SQLite 的 NULL 排序处理。
+    """
+    if after and before:
+        raise HTTPException(status_code=400, detail="Use either after or before, not both")
+
+    forward = before is None
+    if after:
+        value, row_id = decode_cursor(after)
+        query = query.where(_beyond(sort_column, id_column, value, row_id, greater=not descending))
+    elif before:
+        value, row_id = decode_cursor(before)
+        query = query.where(_beyond(sort_column, id_column, value, row_id, greater=descending))
+
+    if descending == forward:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    return query.limit(limit + 1)
+
+
+def keyset_page(rows: Sequence, limit: int, cursor_of, after: str | None = None, before: str | None = None) -> dict:
+    """把 keyset_query 的结果整理为一页
+
+    Args:
+        rows: keyset_query 取回的行（最多 limit + 1 行）
+        cursor_of: 行 -> (排序值, id)
+
+    Returns:
+        {"items": [...], "has_more": bool, "next_cursor": str | None, "prev_cursor": str | None}
+    """
+    overflow = len(rows) > limit
+    items = list(rows[:limit])
+    if before:
+        items.reverse()
+
+    has_next = overflow if before is None else True
+    has_prev = after is not None if before is None else overflow
+
+    return {
+        "items": items,
+        "has_more": bool(items) and has_next,
+        "next_cursor": encode_cursor(*cursor_of(items[-1])) if items and has_next else None,
+        "prev_cursor": encode_cursor(*cursor_of(items[0])) if items and has_prev else None,
+    }
+
+
+def clear_count_cache() -> None:
+    with _count_cache_lock:
+        _count_cache.clear()
+
+
+async def cached_count(session: AsyncSession, query: Select, key: tuple, ttl: int = COUNT_CACHE_TTL) -> int:
+    """带 TTL 的 LRU 缓存的 COUNT(*)，key 需要唯一标识查询条件
+
+    热库论文增删（入库、归档、导入）会递增 Database.papers_version，之前缓存的计数随之失效。
+    """
+    now = time.monotonic()
+    version = Database.papers_version
+    with _count_cache_lock:
+        hit = _count_cache.get(key)
+        if hit and hit[0] == version and hit[1] > now:
+            _count_cache.move_to_end(key)
+            return hit[2]
+    # 先记下版本再计数：计数期间有论文增删时，这条结果下次查找即失效
+    count_query = select(func.count()).select_from(query.order_by(None).limit(None).subquery())
+    total: int = (await session.execute(count_query)).scalar_one()
+    with _count_cache_lock:
+        _count_cache[key] = (version, now + ttl, total)
+        _count_cache.move_to_end(key)
+        while len(_count_cache) > COUNT_CACHE_SIZE:
+            _count_cache.popitem(last=False)
+    return total
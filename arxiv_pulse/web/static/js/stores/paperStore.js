@@ -16,6 +16,7 @@ const usePaperStore = defineStore('paper', () => {
     
     const recentTotalCount = ref(0);
     const recentLoadingMore = ref(false);
+    const recentNextCursor = ref(null);
     const recentSelectedCategories = ref([]);
     
     const homeQuery = ref('');
@@ -273,6 +274,7 @@ const usePaperStore = defineStore('paper', () => {
         loadingProgress.value = 0;
         loadingTotal.value = 0;
         recentPapers.value = [];
+        recentNextCursor.value = null;
         
         const controller = new AbortController();
         loadingController.value = controller;
@@ -306,6 +308,7 @@ const usePaperStore = defineStore('paper', () => {
                                 loadingTotal.value = data.total;
                             } else if (data.type === 'done') {
                                 recentTotalCount.value = data.db_total || recentPapers.value.length;
+                                recentNextCursor.value = data.next_cursor || null;
                                 recentNeedSync.value = data.need_sync || false;
                                 if (recentPapers.value.length === 0) {
                                     recentLogs.value.push({ type: 'info', message: '暂无数据，请先同步论文' });
@@ -334,6 +337,7 @@ const usePaperStore = defineStore('paper', () => {
         recentSearchQuery.value = '';
         recentPapers.value = [];
         recentTotalCount.value = 0;
+        recentNextCursor.value = null;
         
         try {
             const params = new URLSearchParams({
@@ -369,6 +373,7 @@ const usePaperStore = defineStore('paper', () => {
                                 recentPapers.value.push(data.paper);
                             } else if (data.type === 'done') {
                                 recentTotalCount.value = data.total || recentPapers.value.length;
+                                recentNextCursor.value = data.next_cursor || null;
                                 recentNeedSync.value = false;
                                 recentLogs.value.push({ type: 'success', message: configStore?.currentLang === 'zh' ? '更新完成' : 'Update completed' });
                             } else if (data.type === 'error') {
@@ -395,8 +400,13 @@ const usePaperStore = defineStore('paper', () => {
             const params = new URLSearchParams({
                 days: recentDays.value,
                 limit: configStore.settingsConfig.recent_papers_limit || 50,
-                offset: recentPapers.value.length
+                with_total: false
             });
+            if (recentNextCursor.value) {
+                params.set('after', recentNextCursor.value);
+            } else {
+                params.set('offset', recentPapers.value.length);
+            }
             
             if (recentSelectedCategories.value.length > 0) {
                 params.set('categories', recentSelectedCategories.value.join(','));
@@ -408,7 +418,10 @@ const usePaperStore = defineStore('paper', () => {
             if (data.papers && data.papers.length > 0) {
                 recentPapers.value.push(...data.papers);
             }
-            recentTotalCount.value = data.total || recentTotalCount.value;
+            recentNextCursor.value = data.next_cursor || null;
+            if (!data.has_more) {
+                recentTotalCount.value = recentPapers.value.length;
+            }
         } catch (e) {
             console.error('Failed to load more papers:', e);
             ElementPlus.ElMessage.error(configStore?.currentLang === 'zh' ? '加载更多失败' : 'Failed to load more papers');
@@ -648,7 +661,7 @@ const usePaperStore = defineStore('paper', () => {
         recentPapers, loadingRecent, loadingProgress, loadingTotal, loadingController,
         updatingRecent, recentLogs, recentDays, recentNeedSync, recentSelectedIds,
         recentSearchQuery, recentSearching, recentUseAiSearch, recentOriginalPapers,
-        recentTotalCount, recentLoadingMore,
+        recentTotalCount, recentLoadingMore, recentNextCursor,
         homeQuery, homeSearching, homeLogs, homeResults, homeSelectedIds, homeController, homeLogsContainer, homeUserScrolledUp,
         searchQuery, searching, searchLogs, searchResults, searchSelectedIds,
         paperCart, showCart, cartExportLoading, cartPosition, cartPanelRef, cartZIndex,
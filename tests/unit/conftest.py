@@ -0,0 +1,170 @@
+"""
+单元测试 fixtures
+
+Database 是进程内单例：每个测试在临时目录里新建一套数据库（主库、archive.db、cache.db），
+结束时停止写线程、释放连接并恢复单例状态。oai_server 是返回预置 ListRecords XML 的本地 OAI-PMH 服务。
+"""
+
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import arxiv_pulse.core.config as config_module
+import arxiv_pulse.crawler.oai as oai
+from arxiv_pulse.core.config import Config
+from arxiv_pulse.core.database import Database
+from arxiv_pulse.core.maintenance import CacheAccessLog
+from arxiv_pulse.core.paper_index import PaperIndex
+from arxiv_pulse.crawler.pipeline import arxiv_rate_limiter
+from arxiv_pulse.models import Paper
+
+
+def reset_database_singleton() -> None:
+    Database._instance = None
+    Database._engine = None
+    Database._async_engine = None
+    Database._writer = None
+    Database.fts_enabled = False
+    Database.cache_access = CacheAccessLog()
+    Database.paper_index = PaperIndex()
+    config_module._db_instance = None
+    Config.invalidate()
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    return f"sqlite:///{data_dir / 'arxiv_papers.db'}"
+
+
+@pytest.fixture
+def database(db_url, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", db_url)
+    reset_database_singleton()
+    db = Database(db_url)
+    config_module._db_instance = db
+    yield db
+    db.close_writer()
+    Database._engine.dispose()
+    reset_database_singleton()
+
+
+@pytest.fixture
+def reopen_database(database, db_url):
+    """关闭当前的 Database 单例并重新打开同一个库（或 url 指定的另一个库）：重新执行迁移、重建全文索引等启动步骤"""
+
+    def reopen(url: str | None = None) -> Database:
+        Database._instance.close_writer()
+        Database._engine.dispose()
+        reset_database_singleton()
+        db = Database(url or db_url)
+        config_module._db_instance = db
+        return db
+
+    return reopen
+
+
+def make_paper(arxiv_id: str, published: datetime, categories: str = "cs.AI", **fields) -> Paper:
+    primary = categories.split(",")[0].strip()
+    return Paper(
+        arxiv_id=arxiv_id,
+        title=fields.pop("title", f"Paper {arxiv_id}"),
+        authors=json.dumps(
+            [{"name": name, "affiliation": ""} for name in fields.pop("author_names", ["Alice Smith", "Bob Jones"])]
+        ),
+        abstract=fields.pop("abstract", f"Abstract of {arxiv_id}"),
+        categories=categories,
+        primary_category=primary,
+        published=published,
+        **fields,
+    )
+
+
+@pytest.fixture
+def paper_factory():
+    return make_paper
+
+
+class OAIFixtureServer:
+    """按请求参数返回预置响应的 OAI-PMH 服务
+
+    responses 的键是 resumptionToken（翻页请求）或 set（首页请求），值是依次返回的 (状态码, 响应头, XML)，
+    用完后重复最后一个。requests 记录每次请求的参数。
+    """
+
+    def __init__(self):
+        self.responses: dict[str, list[tuple[int, dict[str, str], str]]] = {}
+        self.requests: list[dict[str, str]] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+                server.requests.append(params)
+                queue = server.responses.get(params.get("resumptionToken") or params.get("set", ""))
+                if not queue:
+                    status, headers, body = 200, {}, server.error("noRecordsMatch")
+                else:
+                    status, headers, body = queue.pop(0) if len(queue) > 1 else queue[0]
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "text/xml")
+                self.end_headers()
+                self.wfile.write(body.encode())
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}/oai"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    @staticmethod
+    def record(arxiv_id: str, categories: str, created: str = "2024-01-10", **fields: str) -> str:
+        """arXiv 元数据格式的一条 OAI 记录；fields 里值为空的元素不输出"""
+        authors = "".join(
+            f"<author><keyname>{keyname}</keyname><forenames>{forenames}</forenames></author>"
+            for forenames, keyname in (("Alice", "Smith"), ("Bob", "Jones"))
+        )
+        values = {"title": f"Paper {arxiv_id}", "abstract": f"Abstract of {arxiv_id}", **fields}
+        elements = "".join(f"<{tag}>{value}</{tag}>" for tag, value in values.items() if value)
+        return (
+            f"<record><header><identifier>oai:arXiv.org:{arxiv_id}</identifier><datestamp>{created}</datestamp></header>"
+            f'<metadata><arXiv xmlns="http://arxiv.org/OAI/arXiv/"><id>{arxiv_id}</id><created>{created}</created>'
+            f"<authors>{authors}</authors><categories>{categories}</categories>{elements}</arXiv></metadata></record>"
+        )
+
+    @staticmethod
+    def page(records: list[str], token: str | None = None) -> str:
+        """一页 ListRecords 响应；token 为 None 时是最后一页（空的 resumptionToken）"""
+        resumption = f"<resumptionToken>{token}</resumptionToken>" if token else "<resumptionToken/>"
+        return (
+            '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+            f"<ListRecords>{''.join(records)}{resumption}</ListRecords></OAI-PMH>"
+        )
+
+    @staticmethod
+    def error(code: str) -> str:
+        return (
+            f'<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/"><error code="{code}">no records</error></OAI-PMH>'
+        )
+
+
+@pytest.fixture
+def oai_server(monkeypatch):
+    server = OAIFixtureServer()
+    monkeypatch.setattr(oai, "ARXIV_OAI_URL", server.url)
+    monkeypatch.setattr(arxiv_rate_limiter, "interval", 0.001)
+    yield server
+    server.close()
@@ -0,0 +1,118 @@
+"""
+热/冷归档单元测试
+
+archive_old_papers 把旧论文连同分类、作者索引移出热库；归档库中已有同一 arxiv_id 的论文不会被丢弃；
+search_archive 的分类过滤按完整的分类代码匹配
+"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, insert, select
+
+from arxiv_pulse.models import (
+    ArchivedPaper,
+    Collection,
+    CollectionPaper,
+    Paper,
+    PaperAuthor,
+    PaperCategory,
+    utcnow,
+)
+from arxiv_pulse.search.engine import SearchEngine, SearchFilter
+
+
+def count(db, model, **filters) -> int:
+    with db.get_session() as session:
+        return session.scalar(select(func.count()).select_from(model).filter_by(**filters))
+
+
+def seed(db, paper_factory):
+    now = utcnow()
+    papers = [
+        paper_factory("2001.00001", now - timedelta(days=400)),
+        paper_factory("2001.00002", now - timedelta(days=380), "math.CO, cs.LG"),
+        paper_factory("2001.00003", now - timedelta(days=370)),
+        paper_factory("2401.00004", now - timedelta(days=3)),
+    ]
+    db.bulk_upsert_papers(papers, "test")
+    with db.get_session() as session:
+        return {paper.arxiv_id: paper.id for paper in session.query(Paper)}
+
+
+def test_moves_old_papers_with_their_index_rows(database, paper_factory):
+    ids = seed(database, paper_factory)
+    with database.get_session() as session:
+        collection = Collection(name="keep")
+        session.add(collection)
+        session.flush()
+        session.add(CollectionPaper(collection_id=collection.id, paper_id=ids["2001.00003"]))
+        session.commit()
+
+    assert database.archive_old_papers(horizon_days=180) == 2
+    # 论文集中的论文和最新一篇（id 最大）留在热库
+    assert count(database, Paper) == 2
+    assert count(database, ArchivedPaper) == 2
+    for arxiv_id in ("2001.00001", "2001.00002"):
+        archived = database.get_archived_paper(arxiv_id=arxiv_id)
+        assert archived is not None and archived.id == ids[arxiv_id]
+        assert count(database, PaperCategory, paper_id=ids[arxiv_id]) == 0
+        assert count(database, PaperAuthor, paper_id=ids[arxiv_id]) == 0
+    assert database.paper_exists("2001.00001")
+    assert database.archive_old_papers(horizon_days=180) == 0
+
+
+def test_conflicting_arxiv_id_stays_in_hot_db(database, paper_factory):
+    ids = seed(database, paper_factory)
+    # 同一篇论文早先已归档（id 不同），之后又重新入库到热库
+    with database.get_session() as session:
+        columns = {c.name: getattr(session.get(Paper, ids["2001.00001"]), c.name) for c in Paper.__table__.columns}
+        session.execute(insert(ArchivedPaper.__table__).values({**columns, "id": 1_000, "title": "Archived copy"}))
+        session.commit()
+
+    assert database.archive_old_papers(horizon_days=180) == 2
+    with database.get_session() as session:
+        hot = session.query(Paper).filter_by(arxiv_id="2001.00001").one()
+        assert hot.id == ids["2001.00001"]
+        assert session.query(ArchivedPaper).filter_by(arxiv_id="2001.00001").one().title == "Archived copy"
+    assert count(database, PaperCategory, paper_id=ids["2001.00001"]) == 1
+    assert count(database, ArchivedPaper) == 3
+
+
+def test_horizon_zero_disables_archiving(database, paper_factory):
+    seed(database, paper_factory)
+    assert database.archive_old_papers(horizon_days=0) == 0
+    assert count(database, ArchivedPaper) == 0
+
+
+@pytest.fixture
+def archived(database, paper_factory):
+    now = utcnow()
+    papers = [
+        paper_factory("1901.00001", now - timedelta(days=900), "cond-mat.str-el"),
+        paper_factory("1901.00002", now - timedelta(days=890), "cond-mat.supr-con, quant-ph"),
+        paper_factory("1901.00003", now - timedelta(days=880), "math.CO, cs.DM"),
+        paper_factory("2401.00004", now - timedelta(days=1)),
+    ]
+    database.bulk_upsert_papers(papers, "test")
+    database.archive_old_papers(horizon_days=180)
+    return database
+
+
+@pytest.mark.parametrize(
+    ("categories", "exclude", "expected"),
+    [
+        (["cond-mat.str"], None, []),
+        (["cond-mat.str-el"], None, ["1901.00001"]),
+        (["cond-mat"], None, ["1901.00001", "1901.00002"]),
+        (["cond-mat.*"], None, ["1901.00001", "1901.00002"]),
+        (["quant-ph", "cs.DM"], None, ["1901.00002", "1901.00003"]),
+        (None, ["cond-mat.str"], ["1901.00001", "1901.00002", "1901.00003"]),
+        (None, ["cond-mat.str-el", "math"], ["1901.00002"]),
+    ],
+)
+def test_search_archive_matches_whole_categories(archived, categories, exclude, expected):
+    with archived.get_session() as session:
+        filter_config = SearchFilter(categories=categories, exclude_categories=exclude, sort_order="asc")
+        papers = SearchEngine(session).search_archive(filter_config)
+    assert [paper.arxiv_id for paper in papers] == expected
@@ -0,0 +1,64 @@
+"""
+批量入库单元测试
+
+bulk_upsert_papers 每批一个事务、跳过已有论文；一批中个别论文写入失败时，save_papers 逐篇重试，
+返回所有实际入库的论文（包括更早的批次），只跳过出错的那一篇
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from arxiv_pulse.crawler.arxiv import ArXivCrawler
+from arxiv_pulse.models import Paper, PaperAuthor, PaperCategory
+
+PUBLISHED = datetime(2024, 3, 1)
+
+
+def stored_ids(db) -> set[str]:
+    with db.get_session() as session:
+        return {arxiv_id for (arxiv_id,) in session.query(Paper.arxiv_id)}
+
+
+def test_batches_insert_and_index_new_papers(database, paper_factory):
+    database.bulk_upsert_papers([paper_factory("2403.00001", PUBLISHED)], "test")
+    papers = [paper_factory(f"2403.0000{i}", PUBLISHED, "cs.AI, math.CO") for i in range(1, 6)]
+
+    reports = database.bulk_upsert_papers(papers, "test", batch_size=2)
+
+    assert [len(report["inserted"]) for report in reports] == [1, 2, 1]
+    assert [report["skipped"] for report in reports] == [1, 0, 0]
+    assert stored_ids(database) == {paper.arxiv_id for paper in papers}
+    with database.get_session() as session:
+        assert session.query(PaperCategory).count() == 1 + 2 * 4
+        assert session.query(PaperAuthor).count() == 2 * 5
+
+
+def test_failed_batch_raises_after_earlier_batches_committed(database, paper_factory):
+    papers = [paper_factory(f"2403.0000{i}", PUBLISHED) for i in range(1, 5)]
+    papers[3].title = None  # NOT NULL 约束失败
+
+    with pytest.raises(IntegrityError):
+        database.bulk_upsert_papers(papers, "test", batch_size=2)
+    assert stored_ids(database) == {"2403.00001", "2403.00002"}
+
+
+def test_skip_errors_keeps_the_rest_of_a_failed_batch(database, paper_factory):
+    papers = [paper_factory(f"2403.0000{i}", PUBLISHED) for i in range(1, 6)]
+    papers[3].title = None
+
+    reports = database.bulk_upsert_papers(papers, "test", batch_size=2, skip_errors=True)
+
+    assert [report["failed"] for report in reports] == [0, 1, 0]
+    assert stored_ids(database) == {"2403.00001", "2403.00002", "2403.00003", "2403.00005"}
+
+
+def test_save_papers_returns_every_committed_paper(database, paper_factory):
+    papers = [paper_factory(f"2403.0000{i}", PUBLISHED) for i in range(1, 6)]
+    papers[3].title = None
+
+    saved = ArXivCrawler().save_papers(papers, "test")
+
+    assert [paper.arxiv_id for paper in saved] == ["2403.00001", "2403.00002", "2403.00003", "2403.00005"]
+    assert all(paper.id is not None for paper in saved)
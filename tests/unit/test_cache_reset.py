@@ -0,0 +1,28 @@
+"""
+缓存库重置单元测试
+
+reset_cache_database 清空翻译、图片、全文缓存；最近论文列表只在 include_recent 时清空
+"""
+
+import pytest
+
+
+@pytest.fixture
+def cached(database):
+    database.set_translation_cache("Hello", "你好")
+    database.set_recent_cache(7, [3, 2, 1], total_count=3)
+    database.flush_writes()
+    assert database.get_translation_cache("Hello") == "你好"
+    return database
+
+
+def test_reset_keeps_recent_results(cached):
+    assert cached.reset_cache_database() == {"translations": 1, "figures": 0, "contents": 0}
+    assert cached.get_translation_cache("Hello") is None
+    assert cached.get_recent_cache()["paper_ids"] == [3, 2, 1]
+
+
+def test_reset_can_include_recent_results(cached):
+    cleared = cached.reset_cache_database(include_recent=True)
+    assert cleared == {"translations": 1, "figures": 0, "contents": 0, "recent_results": 1}
+    assert cached.get_recent_cache() is None
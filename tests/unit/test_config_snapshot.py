@@ -0,0 +1,98 @@
+"""
+配置快照单元测试
+
+Config.X 从快照读取，不再逐次查询；set_configs 一次写入多项配置并把版本号加一，本进程的快照立即失效；
+其他进程的修改在检查间隔过后通过版本号发现，版本号未变时不重新加载；加载期间发生的失效不会被旧快照覆盖
+"""
+
+import pytest
+from sqlalchemy import text
+
+import arxiv_pulse.core.config as config_module
+from arxiv_pulse.core.config import Config
+from arxiv_pulse.core.database import Database
+
+
+@pytest.fixture
+def loads(database, monkeypatch):
+    """记录 get_config_snapshot（整表加载）和 get_config_version（版本检查）的调用次数"""
+    calls = {"snapshot": 0, "version": 0}
+    get_snapshot, get_version = Database.get_config_snapshot, Database.get_config_version
+
+    def counted_snapshot(self):
+        calls["snapshot"] += 1
+        return get_snapshot(self)
+
+    def counted_version(self):
+        calls["version"] += 1
+        return get_version(self)
+
+    monkeypatch.setattr(Database, "get_config_snapshot", counted_snapshot)
+    monkeypatch.setattr(Database, "get_config_version", counted_version)
+    database.set_configs({"ai_model": "model-a", "search_limit": "7"})
+    return calls
+
+
+def external_write(db, key: str, value: str) -> None:
+    """模拟另一个进程修改配置：直接写表并把版本号加一，不经过本进程的 Config.invalidate"""
+    with db.engine.begin() as conn:
+        conn.execute(text("UPDATE system_config SET value = :value WHERE key = :key"), {"key": key, "value": value})
+        conn.execute(text("UPDATE system_config SET value = value + 1 WHERE key = 'config_version'"))
+
+
+def test_reads_come_from_one_snapshot(database, loads, monkeypatch):
+    monkeypatch.setattr(config_module, "CONFIG_VERSION_CHECK_INTERVAL", 3600)
+
+    assert [Config.AI_MODEL, Config.SEARCH_LIMIT, Config.AI_MODEL] == ["model-a", 7, "model-a"]
+    assert loads == {"snapshot": 1, "version": 0}
+    assert Config.snapshot().version == database.get_config_version() == 1
+
+
+def test_local_write_bumps_version_once_and_invalidates(database, loads, monkeypatch):
+    monkeypatch.setattr(config_module, "CONFIG_VERSION_CHECK_INTERVAL", 3600)
+    assert Config.AI_MODEL == "model-a"
+
+    database.set_configs({"ai_model": "model-b", "search_limit": "9"})
+
+    assert (Config.AI_MODEL, Config.SEARCH_LIMIT) == ("model-b", 9)
+    assert Config.snapshot().version == 2
+    assert loads["snapshot"] == 2
+
+
+def test_external_write_is_seen_after_the_check_interval(database, loads, monkeypatch):
+    monkeypatch.setattr(config_module, "CONFIG_VERSION_CHECK_INTERVAL", 3600)
+    assert Config.AI_MODEL == "model-a"
+    external_write(database, "ai_model", "model-c")
+
+    # 检查间隔内仍使用已有快照，不查询数据库
+    assert Config.AI_MODEL == "model-a"
+    assert loads == {"snapshot": 1, "version": 0}
+
+    monkeypatch.setattr(config_module, "CONFIG_VERSION_CHECK_INTERVAL", 0)
+    assert Config.AI_MODEL == "model-c"
+    assert Config.snapshot().version == 2
+    assert loads["snapshot"] == 2
+
+
+def test_unchanged_version_only_checks_the_version(database, loads, monkeypatch):
+    monkeypatch.setattr(config_module, "CONFIG_VERSION_CHECK_INTERVAL", 0)
+    assert Config.AI_MODEL == "model-a"
+
+    for _ in range(3):
+        assert Config.AI_MODEL == "model-a"
+
+    assert loads == {"snapshot": 1, "version": 3}
+
+
+def test_invalidation_during_a_load_is_not_overwritten(database, loads, monkeypatch):
+    get_snapshot = Database.get_config_snapshot
+
+    def concurrent_write(self):
+        # 加载读到旧数据后，另一个线程写入配置并使快照失效
+        result = get_snapshot(self)
+        Config.invalidate()
+        return result
+
+    monkeypatch.setattr(Database, "get_config_snapshot", concurrent_write)
+    assert Config.AI_MODEL == "model-a"
+    assert Config._snapshot is None
@@ -0,0 +1,133 @@
+"""
+论文库导出 / 导入单元测试
+
+export_corpus 导出的目录（或 zip）导入到新的数据目录后，论文、分类与作者索引、论文集和归档论文都与原库一致，
+统计汇总和全文索引按导入的数据重建，触发器恢复后继续维护它们；目标库已有数据时拒绝导入且不做任何修改
+"""
+
+import json
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select, text
+
+from arxiv_pulse.models import Collection, CollectionPaper, Paper, PaperAuthor, PaperCategory, utcnow
+from arxiv_pulse.services.corpus_service import CORPUS_MANIFEST, export_corpus, import_corpus, zip_corpus
+
+pytest.importorskip("pyarrow")
+
+
+def count(db, model) -> int:
+    with db.get_session() as session:
+        return session.scalar(select(func.count()).select_from(model))
+
+
+def fts_matches(db, query: str) -> list[str]:
+    with db.engine.connect() as conn:
+        return conn.scalars(
+            text(
+                "SELECT papers.arxiv_id FROM papers_fts JOIN papers ON papers.id = papers_fts.rowid "
+                "WHERE papers_fts MATCH :query ORDER BY papers.id"
+            ),
+            {"query": query},
+        ).all()
+
+
+@pytest.fixture
+def corpus(database, paper_factory, tmp_path):
+    """一个含论文集和归档论文的库，导出到 tmp_path/corpus，返回清单"""
+    now = utcnow()
+    papers = [
+        paper_factory("2001.00001", now - timedelta(days=400), author_names=["Carol White"]),
+        paper_factory("2401.00002", now - timedelta(days=3), "math.CO, cs.LG", summarized=True),
+        paper_factory("2401.00003", now - timedelta(days=2), "quant-ph", author_names=["Dan Brown"]),
+    ]
+    database.bulk_upsert_papers(papers, "test")
+    with database.get_session() as session:
+        collection = Collection(name="Reading")
+        session.add(collection)
+        session.flush()
+        session.add(CollectionPaper(collection_id=collection.id, paper_id=papers[2].id, notes="note"))
+        session.commit()
+    assert database.archive_old_papers(horizon_days=180) == 1
+    return export_corpus(database.engine, tmp_path / "corpus", "parquet")
+
+
+def import_into_new_database(reopen_database, tmp_path, source):
+    data_dir = tmp_path / "copy"
+    data_dir.mkdir()
+    db = reopen_database(f"sqlite:///{data_dir / 'arxiv_papers.db'}")
+    return db, import_corpus(db.engine, source, chunk_size=2)
+
+
+def test_manifest_lists_every_table(corpus, tmp_path):
+    tables = corpus["tables"]
+    assert {name: entry["rows"] for name, entry in tables.items()} == {
+        "papers": 2,
+        "paper_categories": 3,
+        "authors": 4,  # 归档论文的作者仍留在 authors 表中
+        "paper_authors": 3,
+        "collections": 1,
+        "collection_papers": 1,
+        "archived_papers": 1,
+    }
+    assert json.loads((tmp_path / "corpus" / CORPUS_MANIFEST).read_text(encoding="utf-8")) == corpus
+    assert all((tmp_path / "corpus" / entry["file"]).exists() for entry in tables.values())
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_round_trip_into_new_data_dir(database, paper_factory, corpus, reopen_database, tmp_path, fmt):
+    source = tmp_path / fmt
+    manifest = export_corpus(database.engine, source, fmt)
+    with database.get_session() as session:
+        original = [(paper.id, paper.arxiv_id, paper.title, paper.summarized) for paper in session.query(Paper)]
+
+    db, counts = import_into_new_database(reopen_database, tmp_path, source)
+
+    assert counts == {name: entry["rows"] for name, entry in manifest["tables"].items()}
+    with db.get_session() as session:
+        assert [(paper.id, paper.arxiv_id, paper.title, paper.summarized) for paper in session.query(Paper)] == original
+        assert session.query(CollectionPaper).one().notes == "note"
+    assert count(db, PaperCategory) == 3 and count(db, PaperAuthor) == 3
+    assert db.get_archived_paper(arxiv_id="2001.00001") is not None
+    assert [paper.arxiv_id for paper in db.get_papers_by_author("Dan Brown")] == ["2401.00003"]
+    # 统计汇总和全文索引按导入的数据重建
+    counters = db.get_stat_counters()
+    assert (counters["papers"], counters["summarized"], counters["collection_papers"]) == (2, 1, 1)
+    assert fts_matches(db, "Brown") == ["2401.00003"]
+
+    # 恢复的触发器继续维护汇总表和全文索引
+    db.add_paper(paper_factory("2401.00004", utcnow(), author_names=["Brown Eve"]))
+    assert db.get_stat_counters()["papers"] == 3
+    assert fts_matches(db, "Brown") == ["2401.00003", "2401.00004"]
+
+
+def test_import_from_zip(corpus, reopen_database, tmp_path):
+    zip_corpus(tmp_path / "corpus", tmp_path / "corpus.zip")
+
+    db, counts = import_into_new_database(reopen_database, tmp_path, tmp_path / "corpus.zip")
+
+    assert counts["papers"] == 2
+    assert count(db, Paper) == 2
+
+
+def triggers(db) -> list[str]:
+    with db.engine.connect() as conn:
+        return conn.scalars(text("SELECT name FROM sqlite_master WHERE type = 'trigger' ORDER BY name")).all()
+
+
+def test_import_refuses_a_database_with_papers(database, corpus, tmp_path):
+    before = triggers(database)
+
+    with pytest.raises(ValueError):
+        import_corpus(database.engine, tmp_path / "corpus")
+
+    assert count(database, Paper) == 2
+    assert triggers(database) == before
+    assert database.get_stat_counters()["papers"] == 2
+
+
+def test_import_requires_a_manifest(database, tmp_path):
+    (tmp_path / "empty").mkdir()
+    with pytest.raises(ValueError):
+        import_corpus(database.engine, tmp_path / "empty")
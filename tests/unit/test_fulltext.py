@@ -0,0 +1,104 @@
+"""
+全文索引单元测试
+
+papers_fts 的 authors 列只索引作者名，不索引 JSON 的键（name、affiliation）；入库、修改、归档后索引里
+没有残留的旧词条，旧定义的索引在迁移后按新定义重建
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from arxiv_pulse.models import Paper, utcnow
+
+OLD_FTS_DDL = [
+    """CREATE VIRTUAL TABLE papers_fts USING fts5(
+        title, abstract, authors, keywords, content='papers', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER papers_fts_ai AFTER INSERT ON papers BEGIN
+        INSERT INTO papers_fts(rowid, title, abstract, authors, keywords)
+        VALUES (new.id, new.title, new.abstract, new.authors, new.keywords);
+    END""",
+    "INSERT INTO papers_fts(papers_fts) VALUES ('rebuild')",
+]
+
+
+def matching(db, query: str) -> list[str]:
+    with db.get_session() as session:
+        return session.scalars(
+            text(
+                "SELECT papers.arxiv_id FROM papers_fts JOIN papers ON papers.id = papers_fts.rowid "
+                "WHERE papers_fts MATCH :query ORDER BY papers.id"
+            ),
+            {"query": query},
+        ).all()
+
+
+def check_integrity(db) -> None:
+    with db.get_session() as session:
+        session.execute(text("INSERT INTO papers_fts(papers_fts) VALUES ('integrity-check')"))
+
+
+@pytest.fixture
+def indexed(database, paper_factory):
+    if not database.fts_enabled:
+        pytest.skip("SQLite 未编译 FTS5")
+    published = utcnow() - timedelta(days=1)
+    database.bulk_upsert_papers(
+        [
+            paper_factory("2405.00001", published, author_names=["Alice Smith", "Bob Jones"]),
+            paper_factory("2405.00002", published, author_names=["Carol Name"]),
+            paper_factory("2405.00003", datetime(2020, 1, 1)),
+        ],
+        "test",
+    )
+    # 旧格式：作者是字符串列表，或根本不是 JSON
+    legacy = {"2405.00004": '["Dave Plain"]', "2405.00005": "Erin Text, Frank Text"}
+    with database.get_session() as session:
+        for arxiv_id, authors in legacy.items():
+            paper = paper_factory(arxiv_id, published)
+            paper.authors = authors
+            session.add(paper)
+        session.commit()
+    return database
+
+
+def test_only_author_names_are_indexed(indexed):
+    assert matching(indexed, "authors:alice") == ["2405.00001", "2405.00003"]
+    assert matching(indexed, "authors:name") == ["2405.00002"]
+    assert matching(indexed, "authors:affiliation") == []
+    assert matching(indexed, "authors:dave") == ["2405.00004"]
+    assert matching(indexed, "authors:frank") == ["2405.00005"]
+    check_integrity(indexed)
+
+
+def test_updates_and_archiving_keep_the_index_consistent(indexed):
+    with indexed.get_session() as session:
+        paper = session.query(Paper).filter_by(arxiv_id="2405.00002").one()
+        paper.authors = '[{"name": "Dana Scully", "affiliation": "FBI"}]'
+        session.commit()
+    assert matching(indexed, "authors:carol") == []
+    assert matching(indexed, "authors:scully") == ["2405.00002"]
+
+    assert indexed.archive_old_papers(365) == 1
+    assert matching(indexed, "authors:alice") == ["2405.00001"]
+    check_integrity(indexed)
+
+
+def test_migration_rebuilds_an_index_of_raw_author_json(indexed, reopen_database):
+    with indexed._engine.begin() as conn:
+        for statement in ("DROP TRIGGER papers_fts_ai", "DROP TRIGGER papers_fts_ad", "DROP TRIGGER papers_fts_au"):
+            conn.execute(text(statement))
+        conn.execute(text("DROP TABLE papers_fts"))
+        conn.execute(text("DROP VIEW papers_fts_source"))
+        for statement in OLD_FTS_DDL:
+            conn.execute(text(statement))
+        conn.execute(text("DELETE FROM schema_migrations WHERE version >= 6"))
+    assert matching(indexed, "authors:affiliation") != []
+
+    db = reopen_database()
+    assert matching(db, "authors:affiliation") == []
+    assert matching(db, "authors:alice") == ["2405.00001", "2405.00003"]
+    check_integrity(db)
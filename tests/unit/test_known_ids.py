@@ -0,0 +1,91 @@
+"""
+已知 arXiv ID 集合单元测试
+
+KnownArxivIds 对 entry_id、带版本号的 ID 和不带版本号的 ID 给出相同结果，4 位与 5 位序号的新格式 ID 互不混淆，
+旧格式 ID 单独存放；load 分块读入热库和归档库的全部 ID；爬虫过滤只查内存，入库后随之更新，reset 后重新加载
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from arxiv_pulse.crawler.arxiv import ArXivCrawler
+from arxiv_pulse.crawler.known_ids import KnownArxivIds
+from arxiv_pulse.models import utcnow
+
+
+def entry(arxiv_id: str) -> SimpleNamespace:
+    """filter_new_papers 只读取 entry_id"""
+    return SimpleNamespace(entry_id=f"http://arxiv.org/abs/{arxiv_id}v1")
+
+
+@pytest.mark.parametrize(
+    "entry_id, expected",
+    [
+        ("2401.01234", True),
+        ("2401.01234v3", True),
+        ("http://arxiv.org/abs/2401.01234v2", True),
+        ("0704.0001", True),
+        ("0704.00001", False),  # 与 0704.0001 只差序号位数
+        ("2401.1234", False),
+        ("http://arxiv.org/abs/hep-th/9901001v1", True),
+        ("9901002", False),
+    ],
+)
+def test_membership(entry_id, expected):
+    known = KnownArxivIds(["2401.01234", "0704.0001", "9901001"])
+
+    assert (entry_id in known) is expected
+    assert len(known) == 3
+
+
+def test_duplicates_are_counted_once():
+    assert len(KnownArxivIds(["2401.00001", "2401.00001", "9901001", "9901001"])) == 2
+
+
+def test_add_records_new_ids():
+    known = KnownArxivIds(["2401.00001"])
+
+    known.add(["http://arxiv.org/abs/2401.00002v1", "2401.10003", "math/0309136v2"])
+
+    assert all(arxiv_id in known for arxiv_id in ("2401.00001", "2401.00002", "2401.10003v4", "0309136"))
+    assert "2401.00003" not in known
+    assert len(known) == 4
+
+
+def test_load_reads_hot_and_archived_ids_in_chunks(database, paper_factory):
+    now = utcnow()
+    database.bulk_upsert_papers(
+        [
+            paper_factory("2001.00001", now - timedelta(days=400)),
+            paper_factory("2401.00002", now - timedelta(days=3)),
+            paper_factory("2401.00003", now - timedelta(days=2)),
+        ],
+        "test",
+    )
+    assert database.archive_old_papers(horizon_days=180) == 1
+
+    assert list(database.iter_arxiv_ids(chunk_size=1)) == [["2401.00002"], ["2401.00003"], ["2001.00001"]]
+    known = KnownArxivIds.load(database)
+    assert len(known) == 3
+    assert "2001.00001v2" in known and "2401.00004" not in known
+
+
+def test_crawler_filters_in_memory_and_tracks_saves(database, paper_factory):
+    published = utcnow()
+    database.bulk_upsert_papers([paper_factory("2401.00001", published)], "test")
+    crawler = ArXivCrawler()
+
+    new = crawler.filter_new_papers([entry("2401.00001"), entry("2401.00002"), entry("2401.00002")])
+    assert [paper.entry_id for paper in new] == ["http://arxiv.org/abs/2401.00002v1"]
+
+    # 本爬虫入库的论文立即计入集合，不需要重新加载
+    crawler.save_papers([paper_factory("2401.00002", published)], "test")
+    assert crawler.filter_new_papers([entry("2401.00002")]) == []
+
+    # 其他进程写入的论文要等 reset_known_ids 之后才能看到
+    database.bulk_upsert_papers([paper_factory("2401.00003", published)], "test")
+    assert len(crawler.filter_new_papers([entry("2401.00003")])) == 1
+    crawler.reset_known_ids()
+    assert crawler.filter_new_papers([entry("2401.00003")]) == []
@@ -0,0 +1,190 @@
+"""
+schema 迁移单元测试
+
+用旧版（迁移引入之前）的表结构和数据建库，启动 Database 后逐项检查 v1–v6 的结果：热点查询索引、
+统计汇总、压缩正文、缓存访问时间与 incremental auto-vacuum、缓存表迁入 cache.db；重复启动不会再次迁移
+"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from arxiv_pulse.core.database import translation_cache_key
+from arxiv_pulse.core.migrations import MIGRATIONS, get_schema_version, verify_query_plans
+
+# 迁移引入之前由 create_all 建出的表（只列出迁移会涉及的表）
+LEGACY_SCHEMA = """
+CREATE TABLE papers (
+    id INTEGER NOT NULL, arxiv_id VARCHAR(50) NOT NULL, title VARCHAR(500) NOT NULL, authors TEXT, abstract TEXT,
+    categories VARCHAR(500), primary_category VARCHAR(100), published DATETIME NOT NULL, updated DATETIME,
+    pdf_url VARCHAR(500), doi VARCHAR(200), journal_ref VARCHAR(500), comment TEXT, search_query VARCHAR(200),
+    relevance_score FLOAT, keywords TEXT, downloaded BOOLEAN, summarized BOOLEAN, summary TEXT,
+    created_at DATETIME, updated_at DATETIME, PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_papers_arxiv_id ON papers (arxiv_id);
+CREATE TABLE collections (
+    id INTEGER NOT NULL, name VARCHAR(100) NOT NULL, description TEXT, color VARCHAR(7), icon VARCHAR(50),
+    sort_order INTEGER, created_at DATETIME, updated_at DATETIME, PRIMARY KEY (id)
+);
+CREATE TABLE collection_papers (
+    id INTEGER NOT NULL, collection_id INTEGER NOT NULL, paper_id INTEGER NOT NULL, notes TEXT, tags VARCHAR(500),
+    read_status VARCHAR(20), starred BOOLEAN, added_at DATETIME, PRIMARY KEY (id),
+    FOREIGN KEY(collection_id) REFERENCES collections (id), FOREIGN KEY(paper_id) REFERENCES papers (id)
+);
+CREATE TABLE sync_tasks (
+    id VARCHAR(36) NOT NULL, task_type VARCHAR(20) NOT NULL, status VARCHAR(20), progress INTEGER, total INTEGER,
+    message TEXT, result TEXT, created_at DATETIME, completed_at DATETIME, PRIMARY KEY (id)
+);
+CREATE TABLE translation_cache (
+    id INTEGER NOT NULL, source_text TEXT NOT NULL, source_text_hash VARCHAR(64) NOT NULL,
+    translated_text TEXT NOT NULL, target_language VARCHAR(10), created_at DATETIME, updated_at DATETIME,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_translation_cache_source_text_hash ON translation_cache (source_text_hash);
+CREATE TABLE figure_cache (
+    id INTEGER NOT NULL, arxiv_id VARCHAR(50) NOT NULL, figure_url TEXT NOT NULL, created_at DATETIME,
+    updated_at DATETIME, PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_figure_cache_arxiv_id ON figure_cache (arxiv_id);
+CREATE TABLE paper_content_cache (
+    id INTEGER NOT NULL, arxiv_id VARCHAR(50) NOT NULL, full_text TEXT, created_at DATETIME, PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_paper_content_cache_arxiv_id ON paper_content_cache (arxiv_id);
+CREATE TABLE recent_results (
+    id INTEGER NOT NULL, days_back INTEGER, paper_ids TEXT, total_count INTEGER, created_at DATETIME,
+    updated_at DATETIME, PRIMARY KEY (id)
+);
+"""
+
+CREATED = "2024-01-20 08:00:00.000000"
+FULL_TEXT = "Full text of the first paper. " * 200
+
+
+@pytest.fixture
+def legacy_db(db_url):
+    """在 Database 打开之前写好旧版数据库文件"""
+    conn = sqlite3.connect(db_url.removeprefix("sqlite:///"))
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO papers (id, arxiv_id, title, authors, abstract, categories, primary_category, published, "
+        "relevance_score, downloaded, summarized, summary, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, 'abstract', ?, ?, ?, 0.0, 0, ?, ?, ?, ?)",
+        [
+            (
+                1,
+                "2401.00001",
+                "Old paper one",
+                '[{"name": "Alice Smith", "affiliation": ""}]',
+                "cs.LG, stat.ML",
+                "cs.LG",
+                "2024-01-10 00:00:00.000000",
+                1,
+                '{"key_findings": ["a"]}',
+                CREATED,
+                CREATED,
+            ),
+            (
+                2,
+                "2401.00002",
+                "Old paper two",
+                '[{"name": "Bob Jones", "affiliation": ""}]',
+                "quant-ph",
+                "quant-ph",
+                "2024-01-11 00:00:00.000000",
+                0,
+                None,
+                CREATED,
+                CREATED,
+            ),
+        ],
+    )
+    conn.execute(
+        "INSERT INTO collections (id, name, created_at, updated_at) VALUES (1, 'Reading', ?, ?)", (CREATED,) * 2
+    )
+    conn.execute(
+        "INSERT INTO collection_papers (id, collection_id, paper_id, added_at) VALUES (1, 1, 1, ?)", (CREATED,)
+    )
+    conn.execute(
+        "INSERT INTO translation_cache (source_text, source_text_hash, translated_text, target_language, "
+        "created_at, updated_at) VALUES ('Hello', ?, '你好', 'zh', ?, ?)",
+        (translation_cache_key("Hello"), CREATED, CREATED),
+    )
+    conn.execute(
+        "INSERT INTO figure_cache (arxiv_id, figure_url, created_at, updated_at) VALUES ('2401.00001', ?, ?, ?)",
+        ("https://example.org/fig.png", CREATED, CREATED),
+    )
+    conn.execute(
+        "INSERT INTO paper_content_cache (arxiv_id, full_text, created_at) VALUES ('2401.00001', ?, ?)",
+        (FULL_TEXT, CREATED),
+    )
+    conn.execute(
+        "INSERT INTO recent_results (days_back, paper_ids, total_count, created_at, updated_at) "
+        "VALUES (7, '[2, 1]', 2, ?, ?)",
+        (CREATED, CREATED),
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def upgraded(legacy_db, database):
+    """在旧版数据库文件上启动的 Database（启动时执行全部迁移）"""
+    return database
+
+
+def scalar(db, sql: str):
+    with db.engine.connect() as conn:
+        return conn.execute(text(sql)).scalar()
+
+
+def test_upgrade_applies_every_migration(upgraded):
+    with upgraded.engine.begin() as conn:
+        assert get_schema_version(conn) == MIGRATIONS[-1].version
+        applied = conn.execute(text("SELECT version FROM schema_migrations ORDER BY version")).scalars().all()
+    assert applied == [migration.version for migration in MIGRATIONS]
+
+
+def test_upgrade_adds_hot_query_indexes(upgraded):
+    assert scalar(upgraded, "SELECT count(*) FROM sqlite_master WHERE name = 'ix_papers_published'") == 1
+    verify_query_plans(upgraded.engine)
+
+
+def test_upgrade_builds_statistics_from_existing_rows(upgraded):
+    counters = upgraded.get_stat_counters()
+    assert (counters["papers"], counters["summarized"]) == (2, 1)
+    assert (counters["collections"], counters["collection_papers"]) == (1, 1)
+    assert upgraded.get_category_counts() == {"cs.LG": 1, "stat.ML": 1, "quant-ph": 1}
+    assert upgraded.count_papers_since(datetime(2024, 1, 11).date()) == 1
+
+
+def test_upgrade_compresses_content_and_moves_caches(upgraded):
+    for table in ("translation_cache", "figure_cache", "paper_content_cache", "recent_results"):
+        assert scalar(upgraded, f"SELECT count(*) FROM main.sqlite_master WHERE name = '{table}'") == 0
+        assert scalar(upgraded, f"SELECT count(*) FROM cache.{table}") == 1
+
+    assert upgraded.get_translation_cache("Hello") == "你好"
+    assert upgraded.get_figure_cache("2401.00001") == "https://example.org/fig.png"
+    assert upgraded.get_paper_content("2401.00001") == FULL_TEXT
+    assert scalar(upgraded, "SELECT count(*) FROM cache.paper_content_cache WHERE full_text IS NOT NULL") == 0
+    assert upgraded.get_recent_cache()["paper_ids"] == [2, 1]
+    # v4：访问时间以写入时间为初值，供 LRU 淘汰使用
+    assert scalar(upgraded, "SELECT accessed_at FROM cache.translation_cache") == CREATED
+    assert scalar(upgraded, "PRAGMA main.auto_vacuum") == 2
+
+
+def test_upgrade_backfills_lookup_indexes(upgraded):
+    assert [paper.arxiv_id for paper in upgraded.get_papers_by_author("alice smith")] == ["2401.00001"]
+    assert scalar(upgraded, "SELECT count(*) FROM paper_categories") == 3
+    assert scalar(upgraded, "SELECT count(*) FROM papers_fts WHERE papers_fts MATCH 'Jones'") == 1
+
+
+def test_reopening_does_not_migrate_again(upgraded, reopen_database):
+    applied_at = scalar(upgraded, "SELECT max(applied_at) FROM schema_migrations")
+
+    db = reopen_database()
+
+    assert scalar(db, "SELECT max(applied_at) FROM schema_migrations") == applied_at
+    assert db.get_stat_counters()["papers"] == 2
+    assert db.get_paper_content("2401.00001") == FULL_TEXT
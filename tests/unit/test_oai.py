@@ -0,0 +1,196 @@
+"""
+OAI-PMH 采集单元测试
+
+本地 fixture 服务返回预置的 ListRecords XML（通过 ARXIV_OAI_URL 指向它）：resumptionToken 翻页、
+noRecordsMatch、503 + Retry-After，以及 parse_record 的字段映射和 match_field 的前缀匹配
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import UTC, date, datetime
+
+import pytest
+
+from arxiv_pulse.crawler.oai import OAIHarvester, date_windows, match_field, oai_set_for, parse_record
+
+FROM = date(2024, 1, 1)
+UNTIL = date(2024, 2, 15)
+
+
+def first_record(xml: str) -> ET.Element:
+    return ET.fromstring(xml).find(".//{http://www.openarchives.org/OAI/2.0/}record")
+
+
+def test_parse_record_maps_fields(oai_server):
+    xml = oai_server.page(
+        [
+            oai_server.record(
+                "2401.01234",
+                "cs.AI cs.LG",
+                updated="2024-01-20",
+                comments="12 pages",
+                doi="10.1000/xyz",
+                **{"journal-ref": "J. Test 1 (2024)"},
+            )
+        ]
+    )
+    paper = parse_record(first_record(xml))
+
+    assert paper.entry_id == "http://arxiv.org/abs/2401.01234"
+    assert paper.get_short_id() == "2401.01234"
+    assert paper.published == datetime(2024, 1, 10, tzinfo=UTC)
+    assert paper.updated == datetime(2024, 1, 20, tzinfo=UTC)
+    assert paper.title == "Paper 2401.01234"
+    assert [author.name for author in paper.authors] == ["Alice Smith", "Bob Jones"]
+    assert paper.summary == "Abstract of 2401.01234"
+    assert (paper.comment, paper.journal_ref, paper.doi) == ("12 pages", "J. Test 1 (2024)", "10.1000/xyz")
+    assert paper.primary_category == "cs.AI" and paper.categories == ["cs.AI", "cs.LG"]
+    assert paper.pdf_url == "https://arxiv.org/pdf/2401.01234"
+
+
+def test_parse_record_without_abstract_or_updated_date(oai_server):
+    paper = parse_record(first_record(oai_server.page([oai_server.record("2401.00002", "math.CO", abstract="")])))
+
+    assert paper.summary == ""
+    assert paper.updated == paper.published == datetime(2024, 1, 10, tzinfo=UTC)
+    assert paper.comment is None and paper.doi is None and paper.journal_ref is None
+
+
+def test_parse_record_skips_deleted_records():
+    record = ET.fromstring(
+        '<record xmlns="http://www.openarchives.org/OAI/2.0/"><header status="deleted">'
+        "<identifier>oai:arXiv.org:2401.00003</identifier></header></record>"
+    )
+    assert parse_record(record) is None
+
+
+@pytest.mark.parametrize(
+    ("categories", "expected"),
+    [
+        (["cs.AI"], "cs.AI"),
+        (["cs.CV", "cs.LG"], "cs.LG"),
+        (["cond-mat.str-el"], "cond-mat"),
+        (["cond-mat.supr-con", "cs.AI"], "cs.AI"),
+        (["math.CO"], "math.*"),
+        (["cs.CV"], None),
+        (["cond-matter.x"], None),
+    ],
+)
+def test_match_field_prefix_matching(categories, expected):
+    assert match_field(["cs.AI", "cs.LG", "cond-mat", "math.*"], categories) == expected
+
+
+def test_sets_and_windows():
+    assert oai_set_for("cs.AI") == "cs"
+    assert oai_set_for("cond-mat.str-el") == "physics:cond-mat"
+    assert oai_set_for("math.*") == "math"
+    assert date_windows(date(2024, 1, 1), date(2024, 1, 10), window_days=4) == [
+        (date(2024, 1, 1), date(2024, 1, 4)),
+        (date(2024, 1, 5), date(2024, 1, 8)),
+        (date(2024, 1, 9), date(2024, 1, 10)),
+    ]
+
+
+def test_list_records_follows_resumption_tokens(oai_server):
+    oai_server.responses["cs"] = [(200, {}, oai_server.page([oai_server.record("2401.00001", "cs.AI")], "tok-1"))]
+    oai_server.responses["tok-1"] = [(200, {}, oai_server.page([oai_server.record("2401.00002", "cs.AI")], "tok-2"))]
+    oai_server.responses["tok-2"] = [(200, {}, oai_server.page([oai_server.record("2401.00003", "cs.AI")]))]
+
+    pages = list(OAIHarvester().list_records("cs", FROM, UNTIL))
+
+    assert [(len(records), last_page) for records, last_page in pages] == [(1, False), (1, False), (1, True)]
+    assert oai_server.requests[0] == {
+        "verb": "ListRecords",
+        "metadataPrefix": "arXiv",
+        "set": "cs",
+        "from": "2024-01-01",
+        "until": "2024-02-15",
+    }
+    # 翻页请求只带 resumptionToken
+    assert oai_server.requests[1:] == [
+        {"verb": "ListRecords", "resumptionToken": "tok-1"},
+        {"verb": "ListRecords", "resumptionToken": "tok-2"},
+    ]
+
+
+def test_no_records_match_is_an_empty_last_page(oai_server):
+    assert list(OAIHarvester().list_records("econ", FROM, UNTIL)) == [([], True)]
+
+
+def test_other_oai_errors_raise(oai_server):
+    oai_server.responses["cs"] = [(200, {}, oai_server.error("badArgument"))]
+    with pytest.raises(RuntimeError, match="badArgument"):
+        list(OAIHarvester().list_records("cs", FROM, UNTIL))
+
+
+def test_503_waits_for_retry_after(oai_server, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("arxiv_pulse.crawler.oai.time.sleep", sleeps.append)
+    oai_server.responses["cs"] = [
+        (503, {"Retry-After": "7"}, ""),
+        (503, {}, ""),
+        (200, {}, oai_server.page([oai_server.record("2401.00001", "cs.AI")])),
+    ]
+
+    pages = list(OAIHarvester().list_records("cs", FROM, UNTIL))
+
+    assert len(pages) == 1 and len(oai_server.requests) == 3
+    assert sleeps == [7, 30]  # 没有 Retry-After 时等待 OAI_RETRY_AFTER
+
+
+def test_503_gives_up_after_max_retries(oai_server, monkeypatch):
+    monkeypatch.setattr("arxiv_pulse.crawler.oai.time.sleep", lambda seconds: None)
+    oai_server.responses["cs"] = [(503, {"Retry-After": "1"}, "")]
+    with pytest.raises(Exception, match="503"):
+        list(OAIHarvester(max_retries=2).list_records("cs", FROM, UNTIL))
+    assert len(oai_server.requests) == 3
+
+
+def test_harvest_filters_fields_and_cutoff(oai_server):
+    oai_server.responses["cs"] = [
+        (
+            200,
+            {},
+            oai_server.page(
+                [
+                    oai_server.record("2401.00001", "cs.AI"),
+                    oai_server.record("2401.00002", "cs.CV"),  # 不属于选中领域
+                    oai_server.record("2312.00003", "cs.AI", created="2023-12-20"),  # 早于截止日期
+                ],
+                "tok-1",
+            ),
+        )
+    ]
+    oai_server.responses["tok-1"] = [(200, {}, oai_server.page([oai_server.record("2401.00004", "cs.LG cs.AI")]))]
+    oai_server.responses["physics:cond-mat"] = [
+        (200, {}, oai_server.page([oai_server.record("2401.00005", "cond-mat.str-el")]))
+    ]
+
+    batches = list(OAIHarvester().harvest(["cs.AI", "cond-mat"], FROM, UNTIL, window_days=90))
+
+    assert [(batch.set_spec, batch.window_index, batch.last_page) for batch in batches] == [
+        ("cs", 1, False),
+        ("cs", 1, True),
+        ("physics:cond-mat", 2, True),
+    ]
+    assert [batch.scanned for batch in batches] == [3, 1, 1]
+    harvested: dict[str, list[str]] = {}
+    for batch in batches:
+        for field_id, papers in batch.papers.items():
+            harvested.setdefault(field_id, []).extend(paper.get_short_id() for paper in papers)
+    assert harvested == {"cs.AI": ["2401.00001", "2401.00004"], "cond-mat": ["2401.00005"]}
+
+
+def test_harvest_resume_skips_finished_windows(oai_server):
+    oai_server.responses["cs"] = [(200, {}, oai_server.page([oai_server.record("2401.00001", "cs.AI")]))]
+    oai_server.responses["math"] = [(200, {}, oai_server.page([oai_server.record("2401.00002", "math.CO")]))]
+
+    # 第一个集合（cs）的第一个窗口已完成
+    batches = list(
+        OAIHarvester().harvest(["cs.AI", "math"], FROM, UNTIL, window_days=30, resume=(0, date(2024, 1, 30)))
+    )
+
+    assert [(batch.set_spec, batch.window) for batch in batches] == [
+        ("cs", (date(2024, 1, 31), UNTIL)),
+        ("math", (FROM, date(2024, 1, 30))),
+        ("math", (date(2024, 1, 31), UNTIL)),
+    ]
@@ -0,0 +1,133 @@
+"""
+游标分页单元测试
+
+encode_cursor / decode_cursor 往返，keyset_query + keyset_page 在大量相同 published 以及 published 为 NULL 时
+前后翻页不重不漏；cached_count 的 LRU 上限和论文增删后的失效
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, create_engine, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import arxiv_pulse.web.pagination as pagination
+from arxiv_pulse.core import Database
+from arxiv_pulse.web.pagination import cached_count, decode_cursor, encode_cursor, keyset_page, keyset_query
+
+PAGE_SIZE = 4
+
+metadata = MetaData()
+items = Table("items", metadata, Column("id", Integer, primary_key=True), Column("published", DateTime))
+
+
+BASE = datetime(2024, 5, 1, 12, 30, 15, 123456)
+
+
+@pytest.fixture(params=["dated", "with_nulls"])
+def connection(request):
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    # 每 5 行共用一个 published，整页都落在同一时间上也要能翻页；with_nulls 中每 3 行有一行没有 published
+    rows = [{"id": i, "published": BASE - timedelta(hours=i // 5)} for i in range(1, 24)]
+    if request.param == "with_nulls":
+        rows = [{**row, "published": None} if row["id"] % 3 == 0 else row for row in rows]
+    with engine.connect() as conn:
+        conn.execute(insert(items), rows)
+        yield conn
+    engine.dispose()
+
+
+def fetch_page(conn, after=None, before=None, descending=True):
+    query = keyset_query(
+        select(items), items.c.published, items.c.id, PAGE_SIZE, after=after, before=before, descending=descending
+    )
+    rows = conn.execute(query).all()
+    return keyset_page(rows, PAGE_SIZE, lambda row: (row.published, row.id), after=after, before=before)
+
+
+def expected_order(conn, descending=True) -> list[int]:
+    if descending:
+        return conn.scalars(select(items.c.id).order_by(items.c.published.desc(), items.c.id.desc())).all()
+    return conn.scalars(select(items.c.id).order_by(items.c.published.asc(), items.c.id.asc())).all()
+
+
+def test_cursor_round_trip_keeps_microseconds():
+    value = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(value, 42)) == (value, 42)
+    assert decode_cursor(encode_cursor(17.5, 3), is_datetime=False) == (17.5, 3)
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(HTTPException) as excinfo:
+        decode_cursor("not-a-cursor")
+    assert excinfo.value.status_code == 400
+
+
+@pytest.mark.parametrize("descending", [True, False])
+def test_forward_pages_cover_ties_exactly_once(connection, descending):
+    seen = []
+    page = fetch_page(connection, descending=descending)
+    assert page["prev_cursor"] is None
+    while True:
+        seen.extend(row.id for row in page["items"])
+        if not page["has_more"]:
+            break
+        page = fetch_page(connection, after=page["next_cursor"], descending=descending)
+        assert page["prev_cursor"] is not None
+    assert seen == expected_order(connection, descending)
+
+
+def test_backward_pages_mirror_forward_pages(connection):
+    forward = [fetch_page(connection)]
+    while forward[-1]["has_more"]:
+        forward.append(fetch_page(connection, after=forward[-1]["next_cursor"]))
+
+    page = forward[-1]
+    for previous in reversed(forward[:-1]):
+        page = fetch_page(connection, before=page["prev_cursor"])
+        assert [row.id for row in page["items"]] == [row.id for row in previous["items"]]
+    assert page["prev_cursor"] is None
+
+
+def test_after_and_before_are_exclusive(connection):
+    cursor = encode_cursor(datetime(2024, 5, 1), 1)
+    with pytest.raises(HTTPException):
+        fetch_page(connection, after=cursor, before=cursor)
+
+
+def test_count_cache_is_bounded_and_invalidated(tmp_path, monkeypatch):
+    monkeypatch.setattr(pagination, "COUNT_CACHE_SIZE", 2)
+    monkeypatch.setattr(Database, "papers_version", 0)
+    pagination.clear_count_cache()
+    engine = create_engine(f"sqlite:///{tmp_path / 'count.db'}")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(items), [{"id": i, "published": BASE} for i in range(1, 4)])
+
+    def add_item(row_id: int) -> None:
+        with engine.begin() as conn:
+            conn.execute(insert(items).values(id=row_id, published=BASE))
+
+    async def run() -> list[int]:
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'count.db'}")
+        counts = []
+        async with AsyncSession(async_engine) as session:
+            query = select(items)
+            counts.append(await cached_count(session, query, ("all",)))
+            add_item(4)
+            counts.append(await cached_count(session, query, ("all",)))  # TTL 内：仍是缓存的计数
+            Database.papers_changed()
+            counts.append(await cached_count(session, query, ("all",)))
+            for key in ("a", "b"):
+                await cached_count(session, query, (key,))
+            assert list(pagination._count_cache) == [("a",), ("b",)]
+        await async_engine.dispose()
+        return counts
+
+    assert asyncio.run(run()) == [3, 3, 4]
+    pagination.clear_count_cache()
+    engine.dispose()
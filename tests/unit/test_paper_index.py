@@ -0,0 +1,155 @@
+"""
+内存论文索引单元测试
+
+PaperIndex.select 与 SQL 的 keyset_query / OFFSET 分页取到相同的论文 id 和总数：
+发表时间大量相同、分类过滤（含整个大类）、截止时间、前后游标，以及增量更新之后；
+published 为空的论文与 SQLite 一样排在最后
+"""
+
+import itertools
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from arxiv_pulse.core.paper_index import PaperIndex
+from arxiv_pulse.models import Paper, PaperCategory
+from arxiv_pulse.web.pagination import encode_cursor, keyset_query
+
+LIMIT = 7
+BASE_TIME = datetime(2024, 6, 1, 8, 0)
+CATEGORIES = ["cs.AI", "cs.LG", "math.CO", "cond-mat.str-el", "quant-ph"]
+CATEGORY_FILTERS = [None, ["cs"], ["cs.AI"], ["math.*", "quant-ph"], ["hep-th"]]
+
+
+def make_paper(rng: random.Random, paper_id: int) -> Paper:
+    categories = rng.sample(CATEGORIES, rng.randint(1, 2))
+    return Paper(
+        id=paper_id,
+        arxiv_id=f"2406.{paper_id:05d}",
+        title=f"Paper {paper_id}",
+        # 只有 12 个不同的发表时间，每页都会落在相同的时间上
+        published=BASE_TIME - timedelta(hours=rng.randrange(12)),
+        categories=", ".join(categories),
+        primary_category=categories[0],
+        summarized=rng.random() < 0.5,
+    )
+
+
+def insert_papers(session: Session, papers: list[Paper]) -> None:
+    session.add_all(papers)
+    session.flush()
+    rows = [row for p in papers for row in PaperCategory.rows_for(p.id, p.categories, p.primary_category)]
+    session.execute(insert(PaperCategory), rows)
+    session.commit()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'index.db'}")
+    Paper.metadata.create_all(engine, tables=[Paper.__table__, PaperCategory.__table__])
+    rng = random.Random(18)
+    with Session(engine) as session:
+        insert_papers(session, [make_paper(rng, paper_id) for paper_id in range(1, 121)])
+    yield engine
+    engine.dispose()
+
+
+def sql_select(engine, cutoff, categories, offset=0, after=None, before=None) -> tuple[list[int], int]:
+    """papers 接口在索引未就绪时走的 SQL 分页"""
+    query = select(Paper.id)
+    if categories:
+        query = query.where(Paper.id.in_(PaperCategory.paper_ids_matching(categories)))
+    if cutoff:
+        query = query.where(Paper.published >= cutoff)
+    if offset:
+        page_query = query.order_by(Paper.published.desc(), Paper.id.desc()).offset(offset).limit(LIMIT + 1)
+    else:
+        page_query = keyset_query(query, Paper.published, Paper.id, LIMIT, after=after, before=before)
+    with engine.connect() as conn:
+        total = conn.scalar(select(func.count()).select_from(query.subquery()))
+        return conn.scalars(page_query).all(), total
+
+
+def cursor_rows(engine) -> list[tuple[datetime, int]]:
+    with engine.connect() as conn:
+        rows = conn.execute(select(Paper.published, Paper.id).order_by(Paper.published.desc(), Paper.id.desc()))
+        return [tuple(row) for row in rows]
+
+
+def assert_index_matches_sql(index: PaperIndex, engine) -> None:
+    rows = cursor_rows(engine)
+    cursors = [rows[0], rows[len(rows) // 3], rows[len(rows) // 2 + 1], rows[-1]]
+    for cutoff, categories in itertools.product([None, BASE_TIME - timedelta(hours=5)], CATEGORY_FILTERS):
+        for offset in (0, 3, 50):
+            expected = sql_select(engine, cutoff, categories, offset=offset)
+            assert index.select(cutoff, categories, LIMIT, offset) == expected, (cutoff, categories, offset)
+        for cursor in cursors:
+            for direction in ("after", "before"):
+                expected = sql_select(engine, cutoff, categories, **{direction: encode_cursor(*cursor)})
+                actual = index.select(cutoff, categories, LIMIT, **{direction: cursor})
+                assert actual == expected, (cutoff, categories, direction, cursor)
+
+
+def test_select_matches_keyset_query(engine):
+    index = PaperIndex()
+    assert index.build(engine) == 120
+    assert_index_matches_sql(index, engine)
+
+
+def test_select_matches_after_incremental_updates(engine):
+    index = PaperIndex()
+    index.build(engine)
+
+    rng = random.Random(25)
+    with Session(engine, expire_on_commit=False) as session:
+        # 新论文的 id 既有递增的也有落在已有 id 之间的（删除后重新入库）
+        removed = list(range(10, 40, 3))
+        session.execute(PaperCategory.__table__.delete().where(PaperCategory.paper_id.in_(removed)))
+        session.execute(Paper.__table__.delete().where(Paper.id.in_(removed)))
+        session.commit()
+        index.remove(removed)
+        added = [make_paper(rng, paper_id) for paper_id in [*removed[::2], *range(121, 131)]]
+        insert_papers(session, added)
+        index.add(added)
+
+    assert len(index) == 120 - len(removed) + len(added)
+    assert_index_matches_sql(index, engine)
+
+
+def test_select_sorts_null_published_last(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    Paper.metadata.create_all(engine, tables=[Paper.__table__, PaperCategory.__table__])
+    index = PaperIndex()
+    index.build(engine)
+    engine.dispose()
+
+    rng = random.Random(7)
+    papers = [make_paper(rng, paper_id) for paper_id in range(1, 31)]
+    for paper in papers[::4]:
+        paper.published = None
+    index.add(papers)
+
+    dated = sorted((p for p in papers if p.published), key=lambda p: (p.published, p.id), reverse=True)
+    undated = sorted((p for p in papers if p.published is None), key=lambda p: p.id, reverse=True)
+    expected = [paper.id for paper in dated + undated]
+    published = {paper.id: paper.published for paper in papers}
+
+    seen, after = [], None
+    while True:
+        ids, total = index.select(limit=LIMIT, after=after)
+        assert total == len(papers)
+        seen.extend(ids[:LIMIT])
+        if len(ids) <= LIMIT:
+            break
+        after = (published[seen[-1]], seen[-1])
+    assert seen == expected
+
+    for offset in (0, 14, 21):
+        assert index.select(limit=LIMIT, offset=offset)[0] == expected[offset : offset + LIMIT + 1]
+    # 从 published 为空的游标向前翻页：正序返回它前面的 LIMIT + 1 篇
+    position = expected.index(undated[2].id)
+    ids, _ = index.select(limit=LIMIT, before=(None, undated[2].id))
+    assert ids == expected[position - LIMIT - 1 : position][::-1]
@@ -0,0 +1,143 @@
+"""
+按提交日期分片单元测试
+
+plan_windows 的窗口端点取整到分钟、首尾相接且互不重叠、每个窗口不超过 SHARD_MAX_RESULTS；
+iter_windows 按窗口顺序产出
+"""
+
+import random
+import re
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from arxiv_pulse.crawler.shards import (
+    SHARD_MAX_RESULTS,
+    SHARD_MIN_SPAN,
+    iter_windows,
+    plan_windows,
+    window_query,
+)
+
+START = datetime(2021, 3, 4, 5, 6, 37, tzinfo=UTC)
+END = datetime(2026, 1, 2, 3, 4, 55, tzinfo=UTC)
+
+_RANGE = re.compile(r"submittedDate:\[(\d{12}) TO (\d{12})\]")
+
+
+def minute(moment: datetime) -> str:
+    return f"{moment:%Y%m%d%H%M}"
+
+
+class FakeArxiv:
+    """按 submittedDate 分钟计数的假 API：与 arXiv 一样，查询两端都包含"""
+
+    def __init__(self, submitted: list[datetime]):
+        self.minutes = sorted(minute(moment) for moment in submitted)
+        self.queries: list[str] = []
+
+    def count(self, query: str) -> int:
+        self.queries.append(query)
+        low, high = _RANGE.search(query).groups()
+        return sum(low <= value <= high for value in self.minutes)
+
+
+@pytest.fixture
+def fake():
+    rng = random.Random(25)
+    span = int((END - START).total_seconds())
+    submitted = [START + timedelta(seconds=rng.randrange(span)) for _ in range(60_000)]
+    # 一天内的集中投稿：超过上限也不再切到 SHARD_MIN_SPAN 以下
+    burst = datetime(2024, 2, 2, tzinfo=UTC)
+    submitted += [burst + timedelta(seconds=rng.randrange(3600)) for _ in range(SHARD_MAX_RESULTS + 1)]
+    return FakeArxiv(submitted)
+
+
+def test_small_range_is_one_window():
+    fake = FakeArxiv([START + timedelta(days=1)] * 10)
+    assert plan_windows(fake.count, "cat:cs.AI", START, END) == [
+        (START.replace(second=0), END.replace(second=0)),
+    ]
+    assert len(fake.queries) == 1
+
+
+def test_windows_tile_the_range_without_overlap(fake):
+    windows = plan_windows(fake.count, "cat:cs.AI", START, END)
+
+    assert len(windows) > 1
+    assert windows[0][1] == END.replace(second=0) and windows[-1][0] == START.replace(second=0)
+    for window_start, window_end in windows:
+        assert window_start <= window_end
+        assert window_start.second == window_start.microsecond == window_end.second == 0
+    for newer, older in zip(windows, windows[1:]):
+        assert older[1] == newer[0] - timedelta(minutes=1)
+
+    counts = [fake.count(window_query("cat:cs.AI", *window)) for window in windows]
+    # 边界分钟只属于一个窗口：各窗口结果数之和恰好是总数
+    assert sum(counts) == len(fake.minutes)
+    for (window_start, window_end), count in zip(windows, counts):
+        assert count <= SHARD_MAX_RESULTS or window_end - window_start <= SHARD_MIN_SPAN
+
+
+def days(*offsets: int) -> list[tuple[datetime, datetime]]:
+    return [(START + timedelta(days=day), START + timedelta(days=day, hours=23)) for day in offsets]
+
+
+def test_iter_windows_keeps_window_order():
+    windows = days(3, 2, 1, 0)
+    # 越新的窗口越慢，结果仍应按窗口顺序产出
+    delays = {minute(window_start): 0.01 * (len(windows) - i) for i, (window_start, _) in enumerate(windows)}
+
+    def fetch(query: str, limit: int, cancel: threading.Event) -> list[str]:
+        low, _ = _RANGE.search(query).groups()
+        time.sleep(delays[low])
+        return [f"{low}-a", f"{low}-b"]
+
+    papers = list(iter_windows(fetch, "cat:cs.AI", windows, max_results=100, workers=2))
+    assert papers == [f"{minute(start)}-{suffix}" for start, _ in windows for suffix in "ab"]
+
+
+def test_iter_windows_stops_scheduling_and_cancels_at_the_cap():
+    windows = days(9, 8, 7, 6, 5, 4, 3, 2, 1, 0)
+    limits: dict[str, int] = {}
+    cancelled = threading.Event()
+
+    def fetch(query: str, limit: int, cancel: threading.Event) -> list[str]:
+        low, _ = _RANGE.search(query).groups()
+        limits[low] = limit
+        if low == minute(windows[2][0]):
+            # 预取的窗口还在翻页：达到上限后应收到取消
+            if cancel.wait(5):
+                cancelled.set()
+            return []
+        return [f"{low}-{i}" for i in range(min(limit, 3))]
+
+    papers = list(iter_windows(fetch, "cat:cs.AI", windows, max_results=5, workers=2))
+
+    assert papers == [f"{minute(windows[0][0])}-{i}" for i in range(3)] + [
+        f"{minute(windows[1][0])}-{i}" for i in range(2)
+    ]
+    assert cancelled.wait(5)
+    # 第一个窗口抓完后才提交第三个窗口，它最多还需要 5 - 3 条；之后不再提交
+    assert limits == {minute(windows[0][0]): 5, minute(windows[1][0]): 5, minute(windows[2][0]): 2}
+
+
+def test_closing_iter_windows_cancels_running_fetches():
+    started, cancelled = threading.Event(), threading.Event()
+
+    def fetch(query: str, limit: int, cancel: threading.Event) -> list[str]:
+        started.set()
+        if cancel.wait(5):
+            cancelled.set()
+        return ["late"]
+
+    def first_window(query: str, limit: int, cancel: threading.Event) -> list[str]:
+        return ["x"] if minute(START + timedelta(days=1)) in query else fetch(query, limit, cancel)
+
+    papers = iter_windows(first_window, "cat:cs.AI", days(1, 0), max_results=10, workers=2)
+    assert next(papers) == "x"
+    assert started.wait(5)
+    papers.close()
+    assert cancelled.wait(5)
@@ -0,0 +1,102 @@
+"""
+同步检查点单元测试
+
+按查询同步中断后从检查点的分页位置和提交日期继续；OAI-PMH 批量采集因 max_results 提前停止时检查点保持未完成，
+下次跳过已完成的窗口，被截断的窗口重新采集，全部窗口采集完才标记完成
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import arxiv
+
+from arxiv_pulse.crawler.arxiv import SYNC_CHECKPOINT_MAX_AGE, ArXivCrawler
+from arxiv_pulse.models import Paper, SyncCheckpoint, utcnow
+
+FIELDS = ["cs.AI"]
+
+
+def result(arxiv_id: str, published: datetime) -> arxiv.Result:
+    return arxiv.Result(
+        entry_id=f"http://arxiv.org/abs/{arxiv_id}v1",
+        published=published,
+        updated=published,
+        title=f"Paper {arxiv_id}",
+        authors=[arxiv.Result.Author("Alice Smith")],
+        summary=f"Abstract of {arxiv_id}",
+        primary_category="cs.AI",
+        categories=["cs.AI"],
+    )
+
+
+def stored_ids(db) -> set[str]:
+    with db.get_session() as session:
+        return {arxiv_id for (arxiv_id,) in session.query(Paper.arxiv_id)}
+
+
+def test_interrupted_query_sync_resumes_from_checkpoint(database):
+    query = "cat:cs.AI"
+    first = ArXivCrawler()
+    run = first.start_sync(query, years_back=1, force=True, max_results=100)
+    reached = datetime(2024, 3, 1, 8, 30, tzinfo=UTC)
+    first.store_sync_chunk(run, [result("2403.00002", reached + timedelta(hours=1)), result("2403.00001", reached)], 2)
+
+    resumed = ArXivCrawler().start_sync(query, years_back=1, force=True, max_results=100)
+    assert (resumed.offset, resumed.until_date, resumed.cutoff_date) == (2, reached, run.cutoff_date)
+
+    # 模式或回溯年数不同的同步不沿用这个检查点
+    assert ArXivCrawler().resumable_checkpoint(query, force=True, years_back=2) is None
+    assert ArXivCrawler().resumable_checkpoint(query, force=False, years_back=1) is None
+
+    ArXivCrawler().finish_sync(resumed)
+    assert ArXivCrawler().resumable_checkpoint(query, force=True, years_back=1) is None
+
+
+def test_stale_checkpoint_is_ignored(database):
+    query = "cat:cs.AI"
+    ArXivCrawler().start_sync(query, years_back=1, force=True, max_results=100)
+    database.save_sync_checkpoint(query, offset=5)
+    stale = utcnow() - SYNC_CHECKPOINT_MAX_AGE - timedelta(minutes=1)
+    database.write(lambda session: session.query(SyncCheckpoint).update({SyncCheckpoint.updated_at: stale}))
+    assert ArXivCrawler().start_sync(query, years_back=1, force=True, max_results=100).offset == 0
+
+
+def window_starts(oai_server) -> list[str]:
+    return [params["from"] for params in oai_server.requests]
+
+
+def test_capped_harvest_redoes_truncated_window(database, oai_server):
+    cutoff = (datetime.now(UTC) - timedelta(days=365)).date()
+    created = str(cutoff + timedelta(days=5))
+    page = oai_server.page([oai_server.record(arxiv_id, "cs.AI", created) for arxiv_id in ("2401.00001", "2401.00002")])
+    oai_server.responses["cs"] = [(200, {}, page), (200, {}, page), (200, {}, oai_server.error("noRecordsMatch"))]
+
+    list(ArXivCrawler().harvest_fields(FIELDS, years_back=1, max_results=1))
+    assert stored_ids(database) == {"2401.00001"}
+    checkpoint = database.get_sync_checkpoint("oai:cs.AI")
+    assert not checkpoint.completed and checkpoint.reached_date is None
+    assert window_starts(oai_server) == [str(cutoff)]
+
+    list(ArXivCrawler().harvest_fields(FIELDS, years_back=1))
+    assert stored_ids(database) == {"2401.00001", "2401.00002"}
+    assert database.get_sync_checkpoint("oai:cs.AI").completed
+    starts = window_starts(oai_server)[1:]
+    assert starts[0] == str(cutoff) and len(starts) == len(set(starts)) > 1
+
+
+def test_capped_harvest_resumes_after_finished_windows(database, oai_server):
+    cutoff = (datetime.now(UTC) - timedelta(days=365)).date()
+    created = str(cutoff + timedelta(days=5))
+    page = oai_server.page([oai_server.record(arxiv_id, "cs.AI", created) for arxiv_id in ("2401.00001", "2401.00002")])
+    oai_server.responses["cs"] = [(200, {}, page), (200, {}, oai_server.error("noRecordsMatch"))]
+
+    progress = list(ArXivCrawler().harvest_fields(FIELDS, years_back=1, max_results=2))
+    assert progress[-1]["total_new"] == 2 and progress[-1]["windows"] > 1
+    checkpoint = database.get_sync_checkpoint("oai:cs.AI")
+    assert not checkpoint.completed
+    assert checkpoint.reached_date.date() == progress[-1]["until"]
+
+    list(ArXivCrawler().harvest_fields(FIELDS, years_back=1))
+    starts = window_starts(oai_server)
+    # 第一个窗口不再请求，其余窗口各请求一次
+    assert starts.count(str(cutoff)) == 1 and len(starts) == progress[-1]["windows"]
+    assert database.get_sync_checkpoint("oai:cs.AI").completed
@@ -0,0 +1,30 @@
+"""
+翻译缓存 LRU 单元测试
+
+进程内 LRU 命中时不查库，但仍要记下访问（CacheAccessLog），批量更新 accessed_at
+"""
+
+from datetime import timedelta
+
+from arxiv_pulse.core.database import translation_cache_key
+from arxiv_pulse.models import TranslationCache, utcnow
+from arxiv_pulse.services.translation_service import TranslationLRU, translate_text, warm_translation_cache
+
+
+def test_lru_hits_refresh_accessed_at(database, monkeypatch):
+    monkeypatch.setattr("arxiv_pulse.services.translation_service.translation_lru", TranslationLRU())
+    database.set_translation_cache("Hello", "你好")
+    database.flush_writes()
+    stale = utcnow() - timedelta(days=30)
+    database.write(lambda session: session.query(TranslationCache).update({TranslationCache.accessed_at: stale}))
+
+    warm_translation_cache(["Hello"])
+    database.cache_access.drain()  # 预热时的查库命中已记录，这里只看之后的 LRU 命中
+
+    assert translate_text("Hello") == "你好"
+    assert database.cache_access.drain() == {"translations": {translation_cache_key("Hello", "zh")}}
+
+    translate_text("Hello")
+    database.flush_cache_access(wait=True)
+    with database.get_session() as session:
+        assert session.query(TranslationCache).one().accessed_at > stale + timedelta(days=29)
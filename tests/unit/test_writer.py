@@ -0,0 +1,74 @@
+"""
+数据库写线程单元测试
+
+合并的事务中某个写操作失败时逐个重试：其他写操作照常落库，只有出错的那个失败
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from arxiv_pulse.core.writer import DatabaseWriter
+
+metadata = MetaData()
+notes = Table("notes", metadata, Column("id", Integer, primary_key=True), Column("text", String, unique=True))
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'writer.db'}")
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def writer(engine):
+    # linger 足够长、max_batch 恰好等于提交的写操作数：三个低优先级写入一定合并进同一个事务
+    writer = DatabaseWriter(sessionmaker(bind=engine), max_batch=3, linger=5)
+    yield writer
+    writer.stop()
+
+
+def add_note(text: str, calls: list[str]):
+    def op(session):
+        calls.append(text)
+        session.execute(insert(notes).values(text=text))
+        return text
+
+    return op
+
+
+def stored(engine) -> list[str]:
+    with engine.connect() as conn:
+        return conn.scalars(select(notes.c.text).order_by(notes.c.id)).all()
+
+
+def test_batch_commits_in_one_transaction(engine, writer):
+    calls = []
+    futures = [writer.submit(add_note(text, calls)) for text in ("a", "b", "c")]
+    assert [future.result(10) for future in futures] == ["a", "b", "c"]
+    assert calls == ["a", "b", "c"]
+    assert stored(engine) == ["a", "b", "c"]
+
+
+def test_failed_batch_retries_each_op(engine, writer):
+    calls = []
+    futures = [writer.submit(add_note(text, calls)) for text in ("a", "dup", "dup")]
+
+    assert futures[0].result(10) == "a"
+    assert futures[1].result(10) == "dup"
+    with pytest.raises(IntegrityError):
+        futures[2].result(10)
+    # 合并的事务先整体执行一次，回滚后每个写操作各自在独立事务中重试
+    assert calls == ["a", "dup", "dup", "a", "dup", "dup"]
+    assert stored(engine) == ["a", "dup"]
+
+
+def test_urgent_write_returns_value_and_writer_keeps_running(engine, writer):
+    with pytest.raises(IntegrityError):
+        writer.write(lambda session: session.execute(insert(notes), [{"text": "x"}, {"text": "x"}]))
+    assert writer.running
+    assert writer.write(add_note("y", [])) == "y"
+    assert stored(engine) == ["y"]